@@ -0,0 +1,87 @@
+import asyncio
+from inspect import iscoroutinefunction
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+from src.design_patterns.command.game_example import GameEngine
+from src.design_patterns.command.supplement import AsyncCommand, Command
+
+AnyCommand = Union[Command, AsyncCommand]
+
+
+class AsyncGameEngine(GameEngine):
+    def __init__(
+        self,
+        max_concurrent_commands: int = 10,
+        command_timeout: Optional[float] = None,
+        **engine_options: Any,
+    ) -> None:
+        super().__init__(**engine_options)
+        self.max_concurrent_commands = max_concurrent_commands
+        self.command_timeout = command_timeout
+
+    def queue_commands(self, *args: AnyCommand) -> None:  # type: ignore[override]
+        super().queue_commands(*cast(Tuple[Command, ...], args))
+
+    def execute_turn(self) -> None:
+        asyncio.run(self.execute_turn_async())
+
+    async def execute_turn_async(self) -> None:
+        # commands for the same receiver form a lane that runs in queued order,
+        # while separate lanes run concurrently
+        turn = self._start_turn()
+        lanes: Dict[int, List[AnyCommand]] = {}
+        for command in turn:
+            receiver = getattr(command, "receiver", command)
+            lanes.setdefault(id(receiver), []).append(command)
+
+        slots = asyncio.Semaphore(self.max_concurrent_commands)
+        failed: List[AnyCommand] = []
+        await asyncio.gather(
+            *(self._execute_lane(lane, slots, failed) for lane in lanes.values())
+        )
+        self._finish_turn(turn, cast(List[Command], failed))
+
+    async def _execute_lane(
+        self,
+        lane: List[AnyCommand],
+        slots: asyncio.Semaphore,
+        failed: List[AnyCommand],
+    ) -> None:
+        metrics = self.metrics
+        for command in lane:
+            async with slots:
+                if metrics is not None:
+                    metrics.command_started(cast(Command, command))
+                start = perf_counter_ns()
+                command_failed = False
+                try:
+                    await self._execute(command)
+                except (RuntimeError, asyncio.TimeoutError):
+                    failed.append(command)
+                    command_failed = True
+                if metrics is not None:
+                    metrics.command_finished(
+                        cast(Command, command),
+                        perf_counter_ns() - start,
+                        command_failed,
+                    )
+
+    async def _execute(self, command: AnyCommand) -> None:
+        if iscoroutinefunction(command.execute):
+            await asyncio.wait_for(
+                cast(AsyncCommand, command).execute(), self.command_timeout
+            )
+            return
+
+        # sync commands run on a worker thread so they do not stall the other lanes.
+        # A thread cannot be cancelled, so a timed out command is waited for before
+        # the next command in its lane starts.
+        running = asyncio.ensure_future(
+            asyncio.to_thread(cast(Command, command).execute)
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(running), self.command_timeout)
+        except asyncio.TimeoutError:
+            await asyncio.gather(running, return_exceptions=True)
+            raise
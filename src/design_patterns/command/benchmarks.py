@@ -0,0 +1,215 @@
+from itertools import cycle, islice
+from random import Random
+from time import perf_counter, sleep
+from timeit import timeit
+from typing import Dict, Sequence, Tuple
+
+from src.design_patterns.command.game_example import GameEngine, MoveCommand
+from src.design_patterns.command.photoshop_example import (
+    Command,
+    KeyboardHandler,
+    NullCommand,
+)
+from src.design_patterns.command.sharded_game_example import ShardedGameEngine
+from src.design_patterns.command.spatial_index import SpatialGrid
+from src.design_patterns.command.supplement import MovementDirection, UnitType
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+_DIRECTIONS = list(MovementDirection)
+
+
+class SimulatedUnit:
+    # stands in for a unit whose moves are resolved by a simulation service
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.moves = 0
+
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        sleep(self.latency)
+        self.moves += 1
+
+    def destroy(self) -> None:
+        sleep(self.latency)
+
+
+def _time_turn(engine: GameEngine, units: Sequence[SimulatedUnit]) -> float:
+    engine.queue_commands(
+        *(
+            MoveCommand(unit, _DIRECTIONS[index % len(_DIRECTIONS)], 1)
+            for index, unit in enumerate(units)
+        )
+    )
+    start = perf_counter()
+    engine.execute_turn()
+    return perf_counter() - start
+
+
+def benchmark_sharded_turns(
+    unit_counts: Sequence[int] = (100, 1_000, 5_000),
+    worker_counts: Sequence[int] = (1, 2, 4, 8, 16),
+    latency: float = 0.000_05,
+    pool: str = "thread",
+) -> Dict[Tuple[int, int], float]:
+    # seconds per turn for every (unit count, worker count) pair
+    results = {}
+
+    for unit_count in unit_counts:
+        units = [SimulatedUnit(latency) for _ in range(unit_count)]
+        results[unit_count, 0] = _time_turn(GameEngine(), units)
+
+        for workers in worker_counts:
+            with ShardedGameEngine(workers=workers, pool=pool) as engine:
+                # the first turn starts the pool, so it is not timed
+                _time_turn(engine, units[:1])
+                results[unit_count, workers] = _time_turn(engine, units)
+
+    return results
+
+
+class _PerKeyKeyboardHandler:
+    # the dispatch `KeyboardHandler` used before bindings were pre-bound, kept as
+    # the baseline for `benchmark_keyboard_dispatch`
+    def __init__(self, key_bindings: Dict[str, Command]) -> None:
+        self._key_bindings = key_bindings
+
+    def handle_input(self, key_pressed: str) -> None:
+        command = self._key_bindings.get(key_pressed, NullCommand())
+        command.execute()
+
+
+def benchmark_keyboard_dispatch(
+    key_presses: int = 1_000_000, bound_keys: str = "bez"
+) -> Dict[str, float]:
+    bindings: Dict[str, Command] = {key: NullCommand() for key in bound_keys}
+    # half of the keys pressed have no binding
+    keys = "".join(islice(cycle(bound_keys + "xyq"), key_presses))
+
+    per_key = _PerKeyKeyboardHandler(bindings)
+    pre_bound = KeyboardHandler(bindings)
+
+    def per_key_loop() -> None:
+        for key in keys:
+            per_key.handle_input(key)
+
+    def pre_bound_loop() -> None:
+        for key in keys:
+            pre_bound.handle_input(key)
+
+    per_key_seconds = timeit(per_key_loop, number=1)
+    pre_bound_seconds = timeit(pre_bound_loop, number=1)
+    batch_seconds = timeit(lambda: pre_bound.handle_inputs(keys), number=1)
+
+    return {
+        "per_key_dispatches_per_second": key_presses / per_key_seconds,
+        "pre_bound_dispatches_per_second": key_presses / pre_bound_seconds,
+        "batch_dispatches_per_second": key_presses / batch_seconds,
+    }
+
+
+def benchmark_unit_registry(
+    unit_counts: Sequence[int] = (10_000, 100_000, 1_000_000)
+) -> Dict[int, Tuple[float, float]]:
+    # seconds for one move per unit, executed one by one and applied in bulk
+    results = {}
+
+    for unit_count in unit_counts:
+        registry = UnitRegistry()
+        for _ in range(unit_count):
+            registry.add_unit(UnitType.LAND)
+        commands = [
+            MoveCommand(unit, _DIRECTIONS[index % len(_DIRECTIONS)], 1)
+            for index, unit in enumerate(registry.units)
+        ]
+
+        def one_by_one() -> None:
+            for command in commands:
+                command.execute()
+
+        results[unit_count] = (
+            timeit(one_by_one, number=1),
+            timeit(lambda: registry.apply_moves(commands), number=1),
+        )
+
+    return results
+
+
+def benchmark_spatial_index(
+    unit_counts: Sequence[int] = (10_000, 100_000, 1_000_000),
+    queries: int = 100,
+    radius: int = 20,
+) -> Dict[int, Dict[str, float]]:
+    # units are spread at one per 64 square tiles, whatever their number
+    results = {}
+    # a seeded generator so every run places the same units, nothing secret
+    rng = Random(0)  # nosec B311
+
+    for unit_count in unit_counts:
+        half_width = int((unit_count * 64) ** 0.5) // 2
+        registry = UnitRegistry()
+        for _ in range(unit_count):
+            registry.add_unit(
+                UnitType.LAND,
+                (
+                    rng.randint(-half_width, half_width),
+                    rng.randint(-half_width, half_width),
+                ),
+            )
+        points = [
+            (rng.randint(-half_width, half_width), rng.randint(-half_width, half_width))
+            for _ in range(queries)
+        ]
+        moves = [
+            MoveCommand(unit, _DIRECTIONS[index % len(_DIRECTIONS)], 3)
+            for index, unit in enumerate(registry.units)
+        ]
+
+        start = perf_counter()
+        grid = SpatialGrid(registry)
+        build = perf_counter() - start
+
+        registry.apply_moves(moves)
+        start = perf_counter()
+        grid.update(registry.units)
+        update = perf_counter() - start
+
+        start = perf_counter()
+        for point in points:
+            grid.units_within(point, radius)
+        query = (perf_counter() - start) / queries
+
+        # the check every unit would need without an index, timed for one query
+        x, y = points[0]
+        start = perf_counter()
+        [
+            index
+            for index, (unit_x, unit_y) in enumerate(zip(registry.xs, registry.ys))
+            if (unit_x - x) ** 2 + (unit_y - y) ** 2 <= radius**2
+        ]
+        scan = perf_counter() - start
+
+        results[unit_count] = {
+            "build_seconds": build,
+            "turn_update_seconds": update,
+            "query_seconds": query,
+            "scan_seconds": scan,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in benchmark_keyboard_dispatch().items():
+        print(f"{name}: {value:,.0f}")
+
+    print("units  workers  seconds/turn  (0 workers = GameEngine)")
+    for (unit_count, workers), seconds in benchmark_sharded_turns().items():
+        print(f"{unit_count:>5}  {workers:>7}  {seconds:>12.4f}")
+
+    print("units      one by one  in bulk")
+    for unit_count, (one_by_one, in_bulk) in benchmark_unit_registry().items():
+        print(f"{unit_count:>9}  {one_by_one:>10.4f}  {in_bulk:>7.4f}")
+
+    print("units      build    update   query      scan")
+    for unit_count, timings in benchmark_spatial_index().items():
+        build, update, query, scan = timings.values()
+        print(f"{unit_count:>9}  {build:.4f}  {update:.4f}  {query:.6f}  {scan:.4f}")
@@ -0,0 +1,117 @@
+from bisect import bisect_right
+from typing import Any, Callable, List, Sequence, Tuple
+
+from src.design_patterns.command.supplement import Command, succeeded_commands
+
+
+class CommandJournal:
+    def __init__(
+        self,
+        snapshot: Callable[[], Any],
+        restore: Callable[[Any], None],
+        snapshot_interval: int = 100,
+        max_commands: int = 10_000,
+    ) -> None:
+        # `restore` may be handed the same snapshot more than once, so it must not
+        # hold on to it or change it
+        self._snapshot = snapshot
+        self._restore = restore
+        self.snapshot_interval = snapshot_interval
+        self.max_commands = max_commands
+
+        # `_commands[i]` is the command that took the game from step `_base + i` to
+        # the step after it, and `_checkpoints` holds (step, snapshot) pairs
+        self._commands: List[Command] = []
+        self._base = 0
+        self._position = 0
+        self._checkpoints: List[Tuple[int, Any]] = [(0, snapshot())]
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @property
+    def undoable_steps(self) -> int:
+        return self._position - self._base
+
+    @property
+    def redoable_steps(self) -> int:
+        return self._base + len(self._commands) - self._position
+
+    @property
+    def checkpoints(self) -> List[int]:
+        return [step for step, _ in self._checkpoints]
+
+    def record(self, command: Command) -> None:
+        self.record_turn((command,))
+
+    def record_turn(self, commands: Sequence[Command]) -> None:
+        # the game is only snapshotted once all of a turn's commands have run, so a
+        # checkpoint is taken at the end of any turn that passed an interval
+        if not commands:
+            return
+
+        # anything that could have been redone is overwritten by the new commands
+        del self._commands[self._position - self._base :]
+        del self._checkpoints[bisect_right(self.checkpoints, self._position) :]
+
+        start = self._position
+        self._commands.extend(commands)
+        self._position += len(commands)
+
+        if self._position // self.snapshot_interval > start // self.snapshot_interval:
+            self._checkpoints.append((self._position, self._snapshot()))
+
+        self._trim()
+
+    def turn_finished(self, turn: Sequence[Command], failed: Sequence[Command]) -> None:
+        self.record_turn(succeeded_commands(turn, failed))
+
+    def undo(self, steps: int = 1) -> int:
+        steps = min(steps, self.undoable_steps)
+        if steps:
+            self._rewind(self._position - steps)
+        return steps
+
+    def redo(self, steps: int = 1) -> int:
+        steps = min(steps, self.redoable_steps)
+        self._replay(self._position, self._position + steps)
+        self._position += steps
+        return steps
+
+    def _rewind(self, target: int) -> None:
+        checkpoint_index = bisect_right(self.checkpoints, target) - 1
+        checkpoint, state = self._checkpoints[checkpoint_index]
+        undone = self._commands[target - self._base : self._position - self._base]
+
+        # undoing step by step is only worth it when it beats restoring the nearest
+        # checkpoint and replaying from there
+        if len(undone) <= target - checkpoint and all(
+            hasattr(command, "undo") for command in undone
+        ):
+            for command in reversed(undone):
+                command.undo()  # type: ignore[attr-defined]
+        else:
+            self._restore(state)
+            self._replay(checkpoint, target)
+
+        self._position = target
+
+    def _replay(self, start: int, end: int) -> None:
+        for command in self._commands[start - self._base : end - self._base]:
+            command.execute()
+
+    def _trim(self) -> None:
+        if len(self._commands) <= self.max_commands:
+            return
+
+        # the journal has to start at a checkpoint, so when the only one left is the
+        # oldest, the current state becomes a checkpoint to trim up to
+        if len(self._checkpoints) == 1:
+            self._checkpoints.append((self._position, self._snapshot()))
+
+        while len(self._commands) > self.max_commands and len(self._checkpoints) > 1:
+            del self._checkpoints[0]
+            base = self._checkpoints[0][0]
+            del self._commands[: base - self._base]
+            self._base = base
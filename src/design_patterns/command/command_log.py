@@ -0,0 +1,161 @@
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Sequence
+from zlib import crc32
+
+from src.design_patterns.command.game_example import DestroyCommand, MoveCommand
+from src.design_patterns.command.supplement import (
+    BaseUnit,
+    Command,
+    MovementDirection,
+    succeeded_commands,
+)
+
+MAGIC = b"CMDLOG\x00\x01"
+
+# Every record is 10 bytes. A turn is its command records followed by a turn record
+# holding the number of commands and a checksum of their bytes, so a turn that was
+# only partly written when the process died can be told apart from a whole one.
+_COMMAND = struct.Struct("<BIBi")  # opcode, receiver id, direction code, distance
+_TURN = struct.Struct("<BIIx")  # opcode, command count, crc32 of the commands
+
+_END_OF_TURN = 0
+_MOVE = 1
+_DESTROY = 2
+
+_DIRECTIONS = tuple(MovementDirection)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+
+
+def _encode(command: Any, unit_ids: Dict[int, int], into: bytearray) -> int:
+    coalesced = getattr(command, "coalesced_commands", None)
+    if coalesced is not None:
+        return sum(_encode(original, unit_ids, into) for original in coalesced)
+
+    if isinstance(command, MoveCommand):
+        into += _COMMAND.pack(
+            _MOVE,
+            unit_ids[id(command.receiver)],
+            _DIRECTION_CODES[command.direction],
+            command.distance,
+        )
+    elif isinstance(command, DestroyCommand):
+        into += _COMMAND.pack(_DESTROY, unit_ids[id(command.receiver)], 0, 0)
+    else:
+        raise TypeError(f"{type(command).__name__} cannot be written to the log.")
+
+    return 1
+
+
+def _complete_turns(log: Any) -> Iterator[bytes]:
+    # yields the command records of every whole turn, stopping at a torn one
+    offset = start = len(MAGIC)
+
+    while offset + _COMMAND.size <= len(log):
+        if log[offset] != _END_OF_TURN:
+            offset += _COMMAND.size
+            continue
+
+        _, count, checksum = _TURN.unpack_from(log, offset)
+        commands = log[start:offset]
+        if count * _COMMAND.size != len(commands) or crc32(commands) != checksum:
+            return
+
+        yield commands
+        offset += _TURN.size
+        start = offset
+
+
+@contextmanager
+def _mapped(log: BinaryIO) -> Iterator[Any]:
+    # the log is streamed through a memory map rather than read into memory
+    log.seek(0)
+    if log.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{log.name} is not a command log.")
+
+    # an empty map cannot be created, so a log without any turns is its header
+    if os.fstat(log.fileno()).st_size == len(MAGIC):
+        yield MAGIC
+        return
+
+    with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+class CommandLog:
+    def __init__(
+        self, path: str, units: Mapping[int, BaseUnit], fsync: bool = True
+    ) -> None:
+        self.path = path
+        self.fsync = fsync
+        self._unit_ids = {id(unit): unit_id for unit_id, unit in units.items()}
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as log:
+                log.write(MAGIC)
+
+        self._file: BinaryIO = open(path, "r+b")
+        with _mapped(self._file) as log:
+            valid_length = len(MAGIC) + sum(
+                len(turn) + _TURN.size for turn in _complete_turns(log)
+            )
+
+        # a turn torn by a crash is cut off before anything new is appended
+        self._file.truncate(valid_length)
+        self._file.seek(valid_length)
+
+    def __enter__(self) -> "CommandLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def turn_finished(self, turn: Sequence[Command], failed: Sequence[Command]) -> None:
+        self.append_turn(succeeded_commands(turn, failed))
+
+    def check(self, commands: Sequence[Command]) -> None:
+        # raises the error `append_turn` would for any command that cannot be logged
+        for command in commands:
+            _encode(command, self._unit_ids, bytearray())
+
+    def append_turn(self, commands: Sequence[Command]) -> int:
+        records = bytearray()
+        count = sum(_encode(command, self._unit_ids, records) for command in commands)
+        checksum = crc32(records)
+        records += _TURN.pack(_END_OF_TURN, count, checksum)
+
+        # group commit: the whole turn goes out in one write and one fsync
+        self._file.write(records)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        return count
+
+
+def read_log(path: str, units: Mapping[int, BaseUnit]) -> Iterator[List[Command]]:
+    with open(path, "rb") as log, _mapped(log) as mapped:
+        for records in _complete_turns(mapped):
+            turn: List[Command] = []
+            for opcode, unit_id, direction, distance in _COMMAND.iter_unpack(records):
+                if opcode == _MOVE:
+                    turn.append(
+                        MoveCommand(units[unit_id], _DIRECTIONS[direction], distance)
+                    )
+                else:
+                    turn.append(DestroyCommand(units[unit_id]))
+            yield turn
+
+
+def replay_log(path: str, units: Mapping[int, BaseUnit]) -> int:
+    turns = 0
+    for turn in read_log(path, units):
+        for command in turn:
+            command.execute()
+        turns += 1
+    return turns
@@ -0,0 +1,202 @@
+import json
+from time import perf_counter_ns
+from typing import Any, Callable, Counter, Dict, Iterator, List, Sequence, Tuple
+
+from src.design_patterns.command.supplement import Command
+
+PreExecuteHook = Callable[[Command], None]
+# called with the command, the nanoseconds it took and whether it failed
+PostExecuteHook = Callable[[Command, int, bool], None]
+
+# Buckets follow HDR histograms: each power of two is split into 8 equal buckets,
+# so a recorded time is never more than 12.5% from the bucket it is counted in,
+# whatever its size, while a handful of buckets covers nanoseconds to minutes.
+_SUB_BUCKET_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(value: int) -> int:
+    shift = max(0, value.bit_length() - _SUB_BUCKET_BITS - 1)
+    return shift * _SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    shift = max(0, index // _SUB_BUCKETS - 1)
+    top = index - shift * _SUB_BUCKETS
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self._counts: List[int] = []
+
+    def record(self, nanoseconds: int) -> None:
+        index = _bucket_index(nanoseconds)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+
+        self._counts[index] += 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        # (highest nanoseconds, count) for every bucket anything was recorded in
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count:
+                yield _bucket_upper_bound(index), bucket_count
+
+    def percentile(self, percent: float) -> int:
+        # the upper bound of the bucket holding the given percentile, in nanoseconds
+        rank = percent / 100 * self.count
+        seen = 0
+        for upper_bound, bucket_count in self.buckets():
+            seen += bucket_count
+            if seen >= rank:
+                return min(upper_bound, self.max)
+        return self.max
+
+
+class _CommandStats:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.failures = 0
+
+
+class CommandMetrics:
+    def __init__(self) -> None:
+        self.pre_execute_hooks: List[PreExecuteHook] = []
+        self.post_execute_hooks: List[PostExecuteHook] = []
+        self._commands: Dict[str, _CommandStats] = {}
+        self._receivers: Counter[str] = Counter()
+
+    def reset(self) -> None:
+        self._commands.clear()
+        self._receivers.clear()
+
+    def execute_commands(self, commands: Sequence[Command]) -> List[Command]:
+        # runs and times a turn's commands, returning those that failed
+        failed = []
+        pre_hooks, post_hooks = self.pre_execute_hooks, self.post_execute_hooks
+
+        for command in commands:
+            if pre_hooks:
+                for pre_hook in pre_hooks:
+                    pre_hook(command)
+
+            start = perf_counter_ns()
+            try:
+                command.execute()
+                command_failed = False
+            except RuntimeError:
+                failed.append(command)
+                command_failed = True
+            elapsed = perf_counter_ns() - start
+
+            self._record(command, elapsed, command_failed)
+
+            if post_hooks:
+                for post_hook in post_hooks:
+                    post_hook(command, elapsed, command_failed)
+
+        return failed
+
+    def command_started(self, command: Command) -> None:
+        # for engines that run commands themselves rather than through
+        # `execute_commands`, called just before a command runs
+        for pre_hook in self.pre_execute_hooks:
+            pre_hook(command)
+
+    def command_finished(
+        self, command: Command, nanoseconds: int, failed: bool
+    ) -> None:
+        self._record(command, nanoseconds, failed)
+        for post_hook in self.post_execute_hooks:
+            post_hook(command, nanoseconds, failed)
+
+    def statistics(self) -> Dict[str, Any]:
+        commands = {}
+        for name, stats in sorted(self._commands.items()):
+            latency = stats.latency
+            commands[name] = {
+                "count": latency.count,
+                "failures": stats.failures,
+                "failure_rate": stats.failures / latency.count,
+                "mean_seconds": latency.total / latency.count / 1e9,
+                "p50_seconds": latency.percentile(50) / 1e9,
+                "p99_seconds": latency.percentile(99) / 1e9,
+                "max_seconds": latency.max / 1e9,
+                "buckets": [
+                    [upper_bound / 1e9, bucket_count]
+                    for upper_bound, bucket_count in latency.buckets()
+                ],
+            }
+
+        return {
+            "commands": commands,
+            "receivers": dict(sorted(self._receivers.items())),
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.statistics(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "game") -> str:
+        lines = [
+            f"# HELP {prefix}_command_duration_seconds Time taken to execute commands.",
+            f"# TYPE {prefix}_command_duration_seconds histogram",
+        ]
+        for name, stats in sorted(self._commands.items()):
+            latency = stats.latency
+            cumulative = 0
+            for upper_bound, bucket_count in latency.buckets():
+                cumulative += bucket_count
+                lines.append(
+                    f'{prefix}_command_duration_seconds_bucket{{command="{name}",'
+                    f'le="{upper_bound / 1e9:.9g}"}} {cumulative}'
+                )
+            lines += [
+                f'{prefix}_command_duration_seconds_bucket{{command="{name}",'
+                f'le="+Inf"}} {latency.count}',
+                f'{prefix}_command_duration_seconds_sum{{command="{name}"}} '
+                f"{latency.total / 1e9:.9g}",
+                f'{prefix}_command_duration_seconds_count{{command="{name}"}} '
+                f"{latency.count}",
+            ]
+
+        lines += [
+            f"# HELP {prefix}_command_failures_total Commands that failed.",
+            f"# TYPE {prefix}_command_failures_total counter",
+        ]
+        lines += [
+            f'{prefix}_command_failures_total{{command="{name}"}} {stats.failures}'
+            for name, stats in sorted(self._commands.items())
+        ]
+
+        lines += [
+            f"# HELP {prefix}_receiver_commands_total Commands executed per receiver.",
+            f"# TYPE {prefix}_receiver_commands_total counter",
+        ]
+        lines += [
+            f'{prefix}_receiver_commands_total{{receiver="{name}"}} {count}'
+            for name, count in sorted(self._receivers.items())
+        ]
+
+        return "\n".join(lines) + "\n"
+
+    def _record(self, command: Command, nanoseconds: int, failed: bool) -> None:
+        name = type(command).__name__
+        stats = self._commands.get(name)
+        if stats is None:
+            stats = self._commands[name] = _CommandStats()
+
+        stats.latency.record(nanoseconds)
+        if failed:
+            stats.failures += 1
+
+        receiver = getattr(command, "receiver", None)
+        if receiver is not None:
+            self._receivers[type(receiver).__name__] += 1
@@ -1,23 +1,172 @@
-from typing import List
-
-from src.design_patterns.command.supplement import BaseUnit, Command, MovementDirection
+from collections import deque
+from threading import Condition
+from typing import TYPE_CHECKING, Deque, List, Optional, Sequence, Tuple
+
+from src.design_patterns.command.supplement import (
+    BaseUnit,
+    Command,
+    CommandQueueFullError,
+    MovementDirection,
+    OverflowPolicy,
+    TurnObserver,
+)
+
+if TYPE_CHECKING:
+    from src.design_patterns.command.command_journal import CommandJournal
+    from src.design_patterns.command.command_log import CommandLog
+    from src.design_patterns.command.command_metrics import CommandMetrics
+    from src.design_patterns.command.spatial_index import SpatialGrid
+    from src.design_patterns.command.unit_registry import UnitRegistry
 
 
 class GameEngine:
-    def __init__(self) -> None:
-        self._command_queue: List[Command] = []
-        self._failed_commands: List[Command] = []
+    def __init__(
+        self,
+        max_queued_commands: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.REJECT,
+        max_failed_commands: int = 1_000,
+        block_timeout: Optional[float] = None,
+        coalesce_moves: bool = False,
+        journal: Optional["CommandJournal"] = None,
+        command_log: Optional["CommandLog"] = None,
+        unit_registry: Optional["UnitRegistry"] = None,
+        spatial_index: Optional["SpatialGrid"] = None,
+        metrics: Optional["CommandMetrics"] = None,
+    ) -> None:
+        self.max_queued_commands = max_queued_commands
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.coalesce_moves = coalesce_moves
+        self.journal = journal
+        self.command_log = command_log
+        self.unit_registry = unit_registry
+        self.spatial_index = spatial_index
+        self.metrics = metrics
+        # new per-turn features register here rather than growing the constructor
+        self.turn_observers: List[TurnObserver] = [
+            observer
+            for observer in (spatial_index, journal, command_log)
+            if observer is not None
+        ]
+        self.dropped_commands = 0
+        self._command_queue: Deque[Command] = deque()
+        # only the most recent failures are kept, older ones are discarded
+        self._failed_commands: Deque[Command] = deque(maxlen=max_failed_commands)
+        self._queue_changed = Condition()
+
+    @property
+    def queued_commands(self) -> Tuple[Command, ...]:
+        with self._queue_changed:
+            return tuple(self._command_queue)
+
+    @property
+    def failed_commands(self) -> Tuple[Command, ...]:
+        with self._queue_changed:
+            return tuple(self._failed_commands)
 
     def queue_commands(self, *args: Command) -> None:
-        for command in args:
-            self._command_queue.append(command)
+        if self.command_log is not None:
+            # a command the log cannot hold is refused before it runs, rather than
+            # failing the turn it ran in
+            self.command_log.check(args)
+
+        with self._queue_changed:
+            if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                for command in args:
+                    self._make_room()
+                    self._command_queue.append(command)
+                return
+
+            # a call queues all of its commands or, when there is no room, none of them
+            self._make_room(len(args))
+            self._command_queue.extend(args)
 
     def execute_turn(self) -> None:
-        for command in self._command_queue:
+        turn = self._start_turn()
+        if self.metrics is not None:
+            # every command is timed on its own, so moves are not applied in bulk
+            failed = self.metrics.execute_commands(turn)
+        elif self.unit_registry is not None:
+            # moves of registered units are applied to the registry's arrays in bulk
+            failed = self.unit_registry.execute_commands(turn)
+        else:
+            failed = []
+            for command in turn:
+                try:
+                    command.execute()
+                except RuntimeError:
+                    failed.append(command)
+
+        self._finish_turn(turn, failed)
+
+    def retry_failed_commands(self) -> int:
+        # failed commands are queued again for the next turn, subject to the usual
+        # overflow policy
+        with self._queue_changed:
+            retries = list(self._failed_commands)
+            self._failed_commands.clear()
+            queued = 0
             try:
-                command.execute()
-            except RuntimeError:
-                self._failed_commands.append(command)
+                for command in retries:
+                    self._make_room()
+                    self._command_queue.append(command)
+                    queued += 1
+            finally:
+                # whatever the queue had no room for is still failed
+                self._failed_commands.extend(retries[queued:])
+
+        return len(retries)
+
+    def _start_turn(self) -> List[Command]:
+        # a turn runs exactly the commands queued before it started, anything queued
+        # while it runs is left for the next turn
+        with self._queue_changed:
+            turn = list(self._command_queue)
+            self._command_queue.clear()
+            self._queue_changed.notify_all()
+
+        if self.coalesce_moves:
+            from src.design_patterns.command.move_coalescing import coalesce_commands
+
+            return coalesce_commands(turn)
+
+        return turn
+
+    def _finish_turn(self, turn: Sequence[Command], failed: List[Command]) -> None:
+        if failed:
+            with self._queue_changed:
+                for command in failed:
+                    # coalesced moves are logged as the commands that were queued
+                    self._failed_commands.extend(
+                        getattr(command, "coalesced_commands", (command,))
+                    )
+
+        for observer in self.turn_observers:
+            observer.turn_finished(turn, failed)
+
+    def _make_room(self, count: int = 1) -> None:
+        limit = self.max_queued_commands
+        if limit is None or len(self._command_queue) + count <= limit:
+            return
+
+        if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+            while self._command_queue and len(self._command_queue) + count > limit:
+                self._command_queue.popleft()
+                self.dropped_commands += 1
+        elif self.overflow_policy is OverflowPolicy.BLOCK and count <= limit:
+            if not self._queue_changed.wait_for(
+                lambda: len(self._command_queue) + count <= limit,
+                self.block_timeout,
+            ):
+                raise CommandQueueFullError(
+                    f"No room was made in the command queue within "
+                    f"{self.block_timeout} seconds."
+                )
+        else:
+            raise CommandQueueFullError(
+                f"The command queue holds at most {limit} commands, so there is no "
+                f"room for {count} more."
+            )
 
 
 class LandUnit:
@@ -44,13 +193,32 @@ class MoveCommand:
         self._direction = direction
         self._distance = distance
 
+    @property
+    def receiver(self) -> BaseUnit:
+        return self._receiver
+
+    @property
+    def direction(self) -> MovementDirection:
+        return self._direction
+
+    @property
+    def distance(self) -> int:
+        return self._distance
+
     def execute(self) -> None:
         self._receiver.move(self._direction, self._distance)
 
+    def undo(self) -> None:
+        self._receiver.move(self._direction.opposite, self._distance)
+
 
 class DestroyCommand:
     def __init__(self, receiver: BaseUnit) -> None:
         self._receiver = receiver
 
+    @property
+    def receiver(self) -> BaseUnit:
+        return self._receiver
+
     def execute(self) -> None:
         self._receiver.destroy()
@@ -0,0 +1,177 @@
+import multiprocessing
+import struct
+from hashlib import blake2b
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple, Union
+
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.supplement import Command, MovementDirection, UnitType
+from src.design_patterns.command.unit_registry import RegisteredUnit, UnitRegistry
+
+Position = Tuple[int, int]
+UnitState = Tuple[int, int, bool]
+
+_UNIT_STATE = struct.Struct("<Qqq?")
+_HASH_MODULUS = 1 << 64
+
+
+class MoveOrder(NamedTuple):
+    unit_id: int
+    direction: MovementDirection
+    distance: int
+
+
+class DestroyOrder(NamedTuple):
+    unit_id: int
+
+
+# commands cannot cross a process boundary along with their receivers, so they are
+# sent as orders naming the unit they are for
+Order = Union[MoveOrder, DestroyOrder]
+
+
+def state_hash(state: Mapping[int, UnitState]) -> int:
+    # the sum of a hash per unit, so partitions can be hashed on their own and added
+    total = 0
+    for unit_id, (x, y, alive) in state.items():
+        digest = blake2b(_UNIT_STATE.pack(unit_id, x, y, alive), digest_size=8)
+        total += int.from_bytes(digest.digest(), "little")
+    return total % _HASH_MODULUS
+
+
+def registry_state(
+    registry: UnitRegistry, unit_ids: Mapping[int, RegisteredUnit]
+) -> Dict[int, UnitState]:
+    xs, ys, alive = registry.xs, registry.ys, registry.alive
+    return {
+        unit_id: (xs[unit.index], ys[unit.index], bool(alive[unit.index]))
+        for unit_id, unit in unit_ids.items()
+    }
+
+
+def to_command(order: Order, units: Mapping[int, RegisteredUnit]) -> Command:
+    if isinstance(order, MoveOrder):
+        return MoveCommand(units[order.unit_id], order.direction, order.distance)
+    return DestroyCommand(units[order.unit_id])
+
+
+def _run_partition(
+    connection: Connection, units: Dict[int, Tuple[UnitType, Position]]
+) -> None:
+    registry = UnitRegistry()
+    handles = {
+        unit_id: registry.add_unit(unit_type, position)
+        for unit_id, (unit_type, position) in sorted(units.items())
+    }
+    engine = GameEngine(unit_registry=registry)
+
+    while True:
+        orders = connection.recv()
+        if orders is None:
+            connection.send(registry_state(registry, handles))
+            return
+
+        # an error is sent back to be raised in the parent, rather than killing the
+        # worker and leaving the parent with a closed pipe
+        try:
+            engine.queue_commands(*(to_command(order, handles) for order in orders))
+            engine.execute_turn()
+            connection.send(state_hash(registry_state(registry, handles)))
+        except Exception as error:
+            connection.send(error)
+
+
+class LockstepSimulation:
+    def __init__(
+        self, units: Mapping[int, Tuple[UnitType, Position]], workers: int = 2
+    ) -> None:
+        if workers < 1:
+            raise ValueError("A simulation needs at least one worker.")
+
+        self.workers = workers
+        self._unit_ids = frozenset(units)
+        self._turn_orders: List[List[Order]] = [[] for _ in range(workers)]
+        self._connections: List[Connection] = []
+        self._processes: List[Any] = []
+
+        # each worker owns every unit whose id leaves it as the remainder
+        partitions: List[Dict[int, Tuple[UnitType, Position]]] = [
+            {} for _ in range(workers)
+        ]
+        for unit_id, unit in units.items():
+            partitions[self.partition_of(unit_id)][unit_id] = unit
+
+        for partition in partitions:
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_partition, args=(worker_connection, partition), daemon=True
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def __enter__(self) -> "LockstepSimulation":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def partition_of(self, unit_id: int) -> int:
+        return unit_id % self.workers
+
+    def queue_orders(self, *orders: Order) -> None:
+        unknown = sorted(
+            {order.unit_id for order in orders if order.unit_id not in self._unit_ids}
+        )
+        if unknown:
+            raise ValueError(f"There are no units with the ids {unknown}.")
+
+        # orders keep their queued order within each partition, and a unit's orders
+        # all go to the same one, so every unit sees them as a single process would
+        for order in orders:
+            self._turn_orders[self.partition_of(order.unit_id)].append(order)
+
+    def execute_turn(self) -> int:
+        # every partition plays the turn before any is sent the next one, and the
+        # hash of the whole game after the turn is returned
+        for connection, orders in zip(self._connections, self._turn_orders):
+            connection.send(orders)
+        self._turn_orders = [[] for _ in range(self.workers)]
+
+        # every worker's answer is read before raising, so none is left in a pipe to
+        # be mistaken for the answer to the next turn
+        results = [connection.recv() for connection in self._connections]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return sum(results) % _HASH_MODULUS
+
+    def close(self) -> Dict[int, UnitState]:
+        # stops the workers, returning the final state of every unit
+        # workers that have died are skipped, and every connection and process is
+        # cleaned up whatever happens
+        state: Dict[int, UnitState] = {}
+        try:
+            for connection, process in zip(self._connections, self._processes):
+                if process.is_alive():
+                    try:
+                        connection.send(None)
+                        state.update(connection.recv())
+                    except (EOFError, OSError):
+                        pass
+        finally:
+            for connection, process in zip(self._connections, self._processes):
+                connection.close()
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+            self._connections.clear()
+            self._processes.clear()
+        return state
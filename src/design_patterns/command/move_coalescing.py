@@ -0,0 +1,75 @@
+from typing import Dict, List, Sequence, Tuple
+
+from src.design_patterns.command.game_example import MoveCommand
+from src.design_patterns.command.supplement import BaseUnit, Command, MovementDirection
+
+Move = Tuple[MovementDirection, int]
+
+# Each direction is a signed step along one axis, so opposite directions cancel out
+
+
+def _axis(direction: MovementDirection) -> Tuple[str, int]:
+    step_x, step_y = direction.unit_vector
+    return ("east_west", step_x) if step_x else ("north_south", step_y)
+
+
+_AXES = {direction: _axis(direction) for direction in MovementDirection}
+_DIRECTIONS = {axis: direction for direction, axis in _AXES.items()}
+
+
+class CoalescedMoveCommand:
+    def __init__(self, receiver: BaseUnit, commands: List[MoveCommand]) -> None:
+        self._receiver = receiver
+        self.coalesced_commands = commands
+
+        # axes keep the order in which the receiver first moved along them
+        offsets: Dict[str, int] = {}
+        for command in commands:
+            axis, sign = _AXES[command.direction]
+            offsets[axis] = offsets.get(axis, 0) + sign * command.distance
+
+        self.moves: List[Move] = [
+            (_DIRECTIONS[axis, 1 if offset > 0 else -1], abs(offset))
+            for axis, offset in offsets.items()
+            if offset
+        ]
+        if not self.moves:
+            # moves that cancel out still reach the receiver, as a move that goes
+            # nowhere, so a receiver that cannot move fails as it would have
+            self.moves = [(commands[0].direction, 0)]
+
+    @property
+    def receiver(self) -> BaseUnit:
+        return self._receiver
+
+    def execute(self) -> None:
+        move_batch = getattr(self._receiver, "move_batch", None)
+        if move_batch is not None:
+            move_batch(self.moves)
+            return
+
+        for direction, distance in self.moves:
+            self._receiver.move(direction, distance)
+
+
+def coalesce_commands(commands: Sequence[Command]) -> List[Command]:
+    coalesced: List[Command] = []
+    pending: Dict[int, List[MoveCommand]] = {}
+
+    def flush() -> None:
+        for moves in pending.values():
+            coalesced.append(CoalescedMoveCommand(moves[0].receiver, moves))
+        pending.clear()
+
+    for command in commands:
+        if isinstance(command, MoveCommand):
+            pending.setdefault(id(command.receiver), []).append(command)
+            continue
+
+        # moves never cross a `DestroyCommand`, or any other command, as it may
+        # depend on where the units are
+        flush()
+        coalesced.append(command)
+
+    flush()
+    return coalesced
@@ -1,4 +1,5 @@
-from typing import Dict, Protocol
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Protocol
 
 
 class Command(Protocol):
@@ -35,10 +36,153 @@ class NullCommand:
         pass
 
 
+# one shared instance, so a key without a binding does not allocate a new command
+NULL_COMMAND = NullCommand()
+_IGNORE_INPUT = NULL_COMMAND.execute
+
+
+def _normalise_chord(key: str) -> str:
+    # modifiers may be pressed in any order, so "shift+ctrl+b" is "ctrl+shift+b"
+    if key == "+":
+        return key
+
+    # a chord ending in "++" has the plus key as its final key, as in "ctrl++"
+    if key.endswith("++"):
+        modifiers, final = key[:-2].lower().split("+"), "+"
+    else:
+        *modifiers, final = key.lower().split("+")
+
+    if "" in modifiers or not final:
+        raise ValueError(f"{key!r} is not a valid key or chord.")
+    return "+".join(sorted(modifiers) + [final])
+
+
+def _parse_binding(binding: str) -> List[str]:
+    # a binding is a sequence of keys or chords separated by single spaces, such as
+    # "g g", apart from a lone space, which is the space bar
+    if binding == " ":
+        return [binding]
+
+    keys = binding.split(" ")
+    if "" in keys:
+        raise ValueError(f"{binding!r} is not a valid key binding.")
+    return [_normalise_chord(key) if "+" in key else key for key in keys]
+
+
+class _KeyNode:
+    __slots__ = ("children", "execute")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _KeyNode] = {}
+        self.execute: Optional[Callable[[], None]] = None
+
+
 class KeyboardHandler:
-    def __init__(self, key_bindings: Dict[str, Command]) -> None:
-        self._key_bindings = key_bindings
+    def __init__(
+        self,
+        key_bindings: Dict[str, Command],
+        sequence_timeout: float = 1.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.sequence_timeout = sequence_timeout
+        self._clock = clock
+        # bindings live in a trie keyed by key or chord. `execute` is looked up once
+        # per binding here rather than on every key press.
+        self._root = _KeyNode()
+        self._pending: Optional[_KeyNode] = None
+        self._pending_since = 0.0
+
+        for binding, command in key_bindings.items():
+            self.bind(binding, command)
+
+    def bind(self, binding: str, command: Command) -> None:
+        node = self._root
+        for key in _parse_binding(binding):
+            node = node.children.setdefault(key, _KeyNode())
+
+        node.execute = command.execute
+
+    def unbind(self, binding: str) -> None:
+        path = [self._root]
+        for key in _parse_binding(binding):
+            child = path[-1].children.get(key)
+            if child is None:
+                return
+            path.append(child)
+
+        path[-1].execute = None
+        # prune the nodes that no longer lead to any binding
+        for key, parent, node in zip(
+            reversed(_parse_binding(binding)), reversed(path[:-1]), reversed(path)
+        ):
+            if node.children or node.execute is not None:
+                break
+            del parent.children[key]
+
+        self._pending = None
 
     def handle_input(self, key_pressed: str) -> None:
-        command = self._key_bindings.get(key_pressed, NullCommand())
-        command.execute()
+        # plain keys that are unbound, or that complete a binding on their own, take
+        # the fast path
+        if self._pending is None and "+" not in key_pressed:
+            node = self._root.children.get(key_pressed)
+            if node is None:
+                _IGNORE_INPUT()
+                return
+            if node.execute is not None and not node.children:
+                node.execute()
+                return
+
+        self._advance(key_pressed)
+
+    def handle_inputs(self, keys_pressed: Iterable[str]) -> None:
+        children = self._root.children
+        for key_pressed in keys_pressed:
+            if self._pending is None and "+" not in key_pressed:
+                node = children.get(key_pressed)
+                if node is None:
+                    _IGNORE_INPUT()
+                    continue
+                if node.execute is not None and not node.children:
+                    node.execute()
+                    continue
+
+            self._advance(key_pressed)
+
+    def poll(self) -> None:
+        # resolves a sequence that has waited too long for its next key
+        if (
+            self._pending is not None
+            and self._clock() - self._pending_since >= self.sequence_timeout
+        ):
+            self._resolve_pending()
+
+    def _advance(self, key_pressed: str) -> None:
+        if self._pending is not None:
+            self.poll()
+
+        if "+" in key_pressed:
+            key_pressed = _normalise_chord(key_pressed)
+
+        node = (self._pending or self._root).children.get(key_pressed)
+
+        if node is None and self._pending is not None:
+            # the sequence in progress cannot continue, so it resolves to whatever
+            # it matched so far and the key starts afresh
+            self._resolve_pending()
+            node = self._root.children.get(key_pressed)
+
+        if node is None:
+            _IGNORE_INPUT()
+        elif node.children:
+            # a longer binding may still follow, so wait for the next key
+            self._pending = node
+            self._pending_since = self._clock()
+        else:
+            self._pending = None
+            (node.execute or _IGNORE_INPUT)()
+
+    def _resolve_pending(self) -> None:
+        node, self._pending = self._pending, None
+        if node is not None and node.execute is not None:
+            node.execute()
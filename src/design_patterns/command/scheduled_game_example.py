@@ -0,0 +1,139 @@
+from heapq import heapify, heappop, heappush
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.design_patterns.command.game_example import GameEngine
+from src.design_patterns.command.supplement import Command
+
+# highest priority first, then earliest deadline, then the order they were queued in
+_Entry = Tuple[int, float, int, Command]
+
+
+class TurnStats(NamedTuple):
+    turn: int
+    executed: int
+    failed: int
+    deferred: Tuple[Command, ...]
+    dropped: Tuple[Command, ...]
+    seconds: float
+
+
+class ScheduledGameEngine(GameEngine):
+    def __init__(
+        self,
+        turn_time_budget: Optional[float] = None,
+        clock: Callable[[], float] = perf_counter,
+        **engine_options: Any,
+    ) -> None:
+        if engine_options.pop("coalesce_moves", False):
+            raise ValueError(
+                "Moves cannot be coalesced, as that would merge commands queued with "
+                "different priorities."
+            )
+
+        super().__init__(**engine_options)
+        self.turn_time_budget = turn_time_budget
+        self._clock = clock
+        self._turn = 0
+        self._last_turn_stats: Optional[TurnStats] = None
+        # commands wait in the queue until a turn starts and are then moved onto the
+        # heap, where anything a turn has no time for stays for the next one
+        self._schedule: List[_Entry] = []
+        # holding on to the command keeps its id from being reused by another one
+        self._scheduling: Dict[int, Tuple[int, float, Command]] = {}
+        self._sequence = count()
+
+    @property
+    def turn(self) -> int:
+        return self._turn
+
+    @property
+    def last_turn_stats(self) -> Optional[TurnStats]:
+        return self._last_turn_stats
+
+    @property
+    def queued_commands(self) -> Tuple[Command, ...]:
+        with self._queue_changed:
+            carried_over = tuple(entry[-1] for entry in sorted(self._schedule))
+            return carried_over + tuple(self._command_queue)
+
+    def queue_command(
+        self, command: Command, priority: int = 0, deadline: Optional[int] = None
+    ) -> None:
+        # `deadline` is the last turn the command may run in, after which it is
+        # dropped rather than run late
+        with self._queue_changed:
+            self._scheduling[id(command)] = (
+                priority,
+                float("inf") if deadline is None else deadline,
+                command,
+            )
+            try:
+                self.queue_commands(command)
+            except Exception:
+                del self._scheduling[id(command)]
+                raise
+
+    def execute_turn(self) -> None:
+        start = self._clock()
+        self._turn += 1
+        self._schedule_queued_commands()
+
+        ran: List[Command] = []
+        failed: List[Command] = []
+        dropped: List[Command] = []
+        schedule = self._schedule
+
+        while schedule:
+            # every turn runs at least one command, so nothing waits forever
+            if (
+                ran
+                and self.turn_time_budget is not None
+                and self._clock() - start >= self.turn_time_budget
+            ):
+                break
+
+            _, deadline, _, command = heappop(schedule)
+            if deadline < self._turn:
+                dropped.append(command)
+                continue
+
+            ran.append(command)
+            if self.metrics is not None:
+                failed += self.metrics.execute_commands((command,))
+                continue
+            try:
+                command.execute()
+            except RuntimeError:
+                failed.append(command)
+
+        if schedule:
+            # anything due this turn that it had no time for is now too late
+            dropped.extend(entry[-1] for entry in schedule if entry[1] <= self._turn)
+            schedule[:] = [entry for entry in schedule if entry[1] > self._turn]
+            heapify(schedule)
+
+        self._finish_turn(ran, failed)
+        self.dropped_commands += len(dropped)
+        self._last_turn_stats = TurnStats(
+            self._turn,
+            len(ran),
+            len(failed),
+            tuple(entry[-1] for entry in schedule),
+            tuple(dropped),
+            self._clock() - start,
+        )
+
+    def _schedule_queued_commands(self) -> None:
+        with self._queue_changed:
+            for command in self._start_turn():
+                priority, deadline, _ = self._scheduling.get(
+                    id(command), (0, float("inf"), command)
+                )
+                heappush(
+                    self._schedule,
+                    (-priority, deadline, next(self._sequence), command),
+                )
+            # whatever is left was dropped from the full queue before its turn came
+            self._scheduling.clear()
@@ -0,0 +1,132 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.design_patterns.command.game_example import GameEngine
+from src.design_patterns.command.supplement import Command
+
+POOLS = ("thread", "process")
+
+
+def _execute_shard(commands: Sequence[Command]) -> List[int]:
+    failed = []
+    for index, command in enumerate(commands):
+        try:
+            command.execute()
+        except RuntimeError:
+            failed.append(index)
+    return failed
+
+
+def _execute_pickled_shard(
+    commands: Sequence[Command],
+) -> Tuple[List[int], List[Dict[str, Any]]]:
+    # the worker only changed its own copies of the receivers, so their state is
+    # sent back to be applied to the originals
+    failed = _execute_shard(commands)
+    return failed, [vars(receiver) for receiver in _receivers(commands)]
+
+
+def _receivers(commands: Sequence[Command]) -> List[Any]:
+    # a command without a receiver may change its own state, so it is sent back as
+    # its own receiver
+    receivers: Dict[int, Any] = {}
+    for command in commands:
+        receiver = getattr(command, "receiver", command)
+        if not hasattr(receiver, "__dict__"):
+            raise TypeError(
+                f"{type(receiver).__name__} has no __dict__, so its state cannot be "
+                f"sent back from a worker process. Use the thread pool instead."
+            )
+        receivers.setdefault(id(receiver), receiver)
+    return list(receivers.values())
+
+
+class ShardedGameEngine(GameEngine):
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        pool: str = "thread",
+        **engine_options: Any,
+    ) -> None:
+        if pool not in POOLS:
+            raise ValueError(f"Unknown pool {pool!r}, expected one of {POOLS}.")
+        if engine_options.get("metrics") is not None:
+            raise ValueError(
+                "Commands run on a worker pool, where they cannot be timed."
+            )
+
+        super().__init__(**engine_options)
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = pool
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "ShardedGameEngine":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def execute_turn(self) -> None:
+        turn = self._start_turn()
+        shards = self._shard(turn)
+
+        if self.workers == 1 or len(shards) <= 1:
+            failed = [
+                shard[index] for shard in shards for index in _execute_shard(shard)
+            ]
+        elif self.pool == "process":
+            failed = self._execute_pickled(shards)
+        else:
+            failed = [
+                shard[index]
+                for shard, failures in zip(
+                    shards, self._get_executor().map(_execute_shard, shards)
+                )
+                for index in failures
+            ]
+
+        self._finish_turn(turn, failed)
+
+    def _shard(self, turn: List[Command]) -> List[List[Command]]:
+        # every command for a receiver lands in the same shard, in queued order, and
+        # receivers are dealt out to the shards in turn to keep them balanced
+        shards: List[List[Command]] = [[] for _ in range(self.workers)]
+        assigned: Dict[int, List[Command]] = {}
+        for command in turn:
+            receiver = getattr(command, "receiver", command)
+            shard = assigned.setdefault(
+                id(receiver), shards[len(assigned) % self.workers]
+            )
+            shard.append(command)
+        return [shard for shard in shards if shard]
+
+    def _execute_pickled(self, shards: List[List[Command]]) -> List[Command]:
+        failed: List[Command] = []
+        # every receiver is checked before any shard runs, so a turn is never half
+        # played
+        receivers = [_receivers(shard) for shard in shards]
+        results = self._get_executor().map(_execute_pickled_shard, shards)
+
+        for shard, shard_receivers, (failures, states) in zip(
+            shards, receivers, results
+        ):
+            failed.extend(shard[index] for index in failures)
+            for receiver, state in zip(shard_receivers, states):
+                vars(receiver).update(state)
+
+        return failed
+
+    def _get_executor(self) -> Executor:
+        # the pool outlives a single turn, so its start-up cost is only paid once
+        if self._executor is None:
+            if self.pool == "process":
+                self._executor = ProcessPoolExecutor(self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(self.workers)
+        return self._executor
@@ -0,0 +1,102 @@
+from math import floor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.design_patterns.command.supplement import BaseUnit, Command
+from src.design_patterns.command.unit_registry import RegisteredUnit, UnitRegistry
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float]
+
+
+class SpatialGrid:
+    def __init__(self, registry: UnitRegistry, cell_size: int = 16) -> None:
+        if cell_size < 1:
+            raise ValueError("Cells must be at least 1 unit wide.")
+
+        self.registry = registry
+        self.cell_size = cell_size
+        # living units are bucketed by the square cell their position falls in
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._unit_cells: Dict[int, Cell] = {}
+        self.rebuild()
+
+    def cell_of(self, point: Point) -> Cell:
+        x, y = point
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def rebuild(self) -> None:
+        self._cells.clear()
+        self._unit_cells.clear()
+        self._refresh(range(len(self.registry)))
+
+    def update(self, units: Iterable[Optional[BaseUnit]]) -> None:
+        # only the units that may have moved, or been destroyed, are looked at again
+        registry = self.registry
+        self._refresh(
+            {
+                unit.index
+                for unit in units
+                if isinstance(unit, RegisteredUnit) and unit.registry is registry
+            }
+        )
+
+    def turn_finished(self, turn: Sequence[Command], failed: Sequence[Command]) -> None:
+        # the index only looks again at the units a turn's commands acted on
+        self.update(getattr(command, "receiver", None) for command in turn)
+
+    def units_in_cell(self, cell: Cell) -> List[RegisteredUnit]:
+        units = self.registry.units
+        return [units[index] for index in self._cells.get(cell, ())]
+
+    def units_within(self, point: Point, radius: float) -> List[RegisteredUnit]:
+        x, y = point
+        xs, ys, units = self.registry.xs, self.registry.ys, self.registry.units
+        min_x, min_y = self.cell_of((x - radius, y - radius))
+        max_x, max_y = self.cell_of((x + radius, y + radius))
+        squared_radius = radius * radius
+
+        # a box holding more cells than are occupied is cheaper to check against
+        # the occupied cells than to walk cell by cell
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            cells: Iterable[Iterable[int]] = [
+                members
+                for (cell_x, cell_y), members in self._cells.items()
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y
+            ]
+        else:
+            cells = [
+                self._cells.get((cell_x, cell_y), ())
+                for cell_x in range(min_x, max_x + 1)
+                for cell_y in range(min_y, max_y + 1)
+            ]
+
+        found = []
+        for indices in cells:
+            for index in indices:
+                offset_x, offset_y = xs[index] - x, ys[index] - y
+                if offset_x * offset_x + offset_y * offset_y <= squared_radius:
+                    found.append(units[index])
+
+        return found
+
+    def _refresh(self, indices: Iterable[int]) -> None:
+        xs, ys, alive = self.registry.xs, self.registry.ys, self.registry.alive
+        cells, unit_cells = self._cells, self._unit_cells
+        size = self.cell_size
+
+        for index in indices:
+            old = unit_cells.get(index)
+            new = (xs[index] // size, ys[index] // size) if alive[index] else None
+            if new == old:
+                continue
+
+            if old is not None:
+                members = cells[old]
+                members.discard(index)
+                if not members:
+                    del cells[old]
+                del unit_cells[index]
+
+            if new is not None:
+                cells.setdefault(new, set()).add(index)
+                unit_cells[index] = new
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Protocol
+from typing import List, Protocol, Sequence, Tuple
 
 
 class MovementDirection(Enum):
@@ -8,15 +8,83 @@ class MovementDirection(Enum):
     SOUTH = "SOUTH"
     WEST = "WEST"
 
+    @property
+    def opposite(self) -> "MovementDirection":
+        return _OPPOSITE_DIRECTIONS[self]
+
+    @property
+    def unit_vector(self) -> Tuple[int, int]:
+        return _UNIT_VECTORS[self]
+
+
+_OPPOSITE_DIRECTIONS = {
+    MovementDirection.NORTH: MovementDirection.SOUTH,
+    MovementDirection.EAST: MovementDirection.WEST,
+    MovementDirection.SOUTH: MovementDirection.NORTH,
+    MovementDirection.WEST: MovementDirection.EAST,
+}
+
+# (east, north) steps, so a move is its unit vector scaled by the distance
+_UNIT_VECTORS = {
+    MovementDirection.NORTH: (0, 1),
+    MovementDirection.EAST: (1, 0),
+    MovementDirection.SOUTH: (0, -1),
+    MovementDirection.WEST: (-1, 0),
+}
+
+
+class UnitType(Enum):
+    LAND = "LAND"
+    SEA = "SEA"
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "BLOCK"
+    DROP_OLDEST = "DROP_OLDEST"
+    REJECT = "REJECT"
+
+
+class CommandQueueFullError(Exception):
+    pass
+
 
 class Command(Protocol):
     def execute(self) -> None:
         ...
 
 
+class UndoableCommand(Command, Protocol):
+    def undo(self) -> None:
+        ...
+
+
+class AsyncCommand(Protocol):
+    async def execute(self) -> None:
+        ...
+
+
 class BaseUnit(Protocol):
     def move(self, direction: MovementDirection, distance: int) -> None:
         ...
 
     def destroy(self) -> None:
         ...
+
+
+class BatchMovingUnit(BaseUnit, Protocol):
+    # units may opt into receiving a whole turn's coalesced moves in one call
+    def move_batch(self, moves: Sequence[Tuple[MovementDirection, int]]) -> None:
+        ...
+
+
+class TurnObserver(Protocol):
+    # told about every turn a `GameEngine` plays, once its commands have all run
+    def turn_finished(self, turn: Sequence[Command], failed: Sequence[Command]) -> None:
+        ...
+
+
+def succeeded_commands(
+    turn: Sequence[Command], failed: Sequence[Command]
+) -> List[Command]:
+    failed_ids = {id(command) for command in failed}
+    return [command for command in turn if id(command) not in failed_ids]
@@ -0,0 +1,150 @@
+import asyncio
+from time import perf_counter, sleep
+from typing import List, Tuple
+
+from src.design_patterns.command.async_game_example import AsyncGameEngine
+from src.design_patterns.command.command_metrics import CommandMetrics
+from src.design_patterns.command.game_example import DestroyCommand, MoveCommand
+from src.design_patterns.command.spatial_index import SpatialGrid
+from src.design_patterns.command.supplement import MovementDirection, UnitType
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+
+class SimulatedUnit:
+    # stands in for a unit whose moves are resolved by a remote simulation service
+    running = 0
+    most_running = 0
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.log: List[Tuple[str, int]] = []
+
+    async def simulate(self, action: str, seconds: float) -> None:
+        SimulatedUnit.running += 1
+        SimulatedUnit.most_running = max(
+            SimulatedUnit.most_running, SimulatedUnit.running
+        )
+        try:
+            await asyncio.sleep(seconds)
+            self.log.append((action, len(self.log)))
+        finally:
+            SimulatedUnit.running -= 1
+
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        sleep(0.001)
+        self.log.append((direction.value, distance))
+
+    def destroy(self) -> None:
+        self.log.append(("DESTROY", 0))
+
+
+class SimulatedMove:
+    def __init__(self, receiver: SimulatedUnit, seconds: float) -> None:
+        self.receiver = receiver
+        self.seconds = seconds
+
+    async def execute(self) -> None:
+        await self.receiver.simulate(f"move-{self.seconds}", self.seconds)
+
+
+def test_commands_for_different_receivers_run_concurrently() -> None:
+    # given
+    engine = AsyncGameEngine()
+    units = [SimulatedUnit(str(index)) for index in range(5)]
+    engine.queue_commands(*(SimulatedMove(unit, 0.05) for unit in units))
+
+    # when
+    start = perf_counter()
+    engine.execute_turn()
+    elapsed = perf_counter() - start
+
+    # then
+    assert elapsed < 0.05 * len(units)
+    assert all(len(unit.log) == 1 for unit in units)
+
+
+def test_commands_for_the_same_receiver_keep_their_order() -> None:
+    # given
+    engine = AsyncGameEngine()
+    unit = SimulatedUnit("Appa")
+
+    # when
+    engine.queue_commands(
+        SimulatedMove(unit, 0.03),
+        MoveCommand(unit, MovementDirection.NORTH, 2),
+        SimulatedMove(unit, 0.0),
+        DestroyCommand(unit),
+    )
+    engine.execute_turn()
+
+    # then
+    assert unit.log == [
+        ("move-0.03", 0),
+        ("NORTH", 2),
+        ("move-0.0", 2),
+        ("DESTROY", 0),
+    ]
+
+
+def test_concurrency_limit_is_respected() -> None:
+    # given
+    engine = AsyncGameEngine(max_concurrent_commands=2)
+    SimulatedUnit.most_running = 0
+    engine.queue_commands(
+        *(SimulatedMove(SimulatedUnit(str(index)), 0.01) for index in range(6))
+    )
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert SimulatedUnit.most_running == 2
+
+
+def test_timed_out_commands_are_recorded_as_failed() -> None:
+    # given
+    engine = AsyncGameEngine(command_timeout=0.01)
+    unit = SimulatedUnit("Momo")
+    slow_move = SimulatedMove(unit, 1.0)
+    quick_move = SimulatedMove(unit, 0.0)
+    engine.queue_commands(slow_move, quick_move)
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert engine.failed_commands == (slow_move,)
+    assert unit.log == [("move-0.0", 0)]
+
+
+def test_turns_can_be_awaited_from_a_running_event_loop() -> None:
+    # given
+    engine = AsyncGameEngine()
+    unit = SimulatedUnit("Aang")
+    engine.queue_commands(MoveCommand(unit, MovementDirection.EAST, 5))
+
+    # when
+    asyncio.run(engine.execute_turn_async())
+
+    # then
+    assert unit.log == [("EAST", 5)]
+    assert engine.queued_commands == ()
+
+
+def test_engine_options_are_passed_on() -> None:
+    # given
+    registry = UnitRegistry()
+    unit = registry.add_unit(UnitType.LAND, (0, 0))
+    grid = SpatialGrid(registry, cell_size=10)
+    metrics = CommandMetrics()
+    engine = AsyncGameEngine(
+        unit_registry=registry, spatial_index=grid, metrics=metrics
+    )
+    engine.queue_commands(MoveCommand(unit, MovementDirection.EAST, 25))
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert grid.units_in_cell((2, 0)) == [unit]
+    assert metrics.statistics()["commands"]["MoveCommand"]["count"] == 1
@@ -0,0 +1,212 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from src.design_patterns.command.command_journal import CommandJournal
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.supplement import Command, MovementDirection
+from src.design_patterns.command.tests.fixtures import TrackedUnit
+
+State = Dict[str, Tuple[Tuple[int, int], bool]]
+
+
+class MortalUnit(TrackedUnit):
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        if not self.alive:
+            raise RuntimeError("Destroyed units cannot move.")
+        super().move(direction, distance)
+
+
+class World:
+    def __init__(self) -> None:
+        self.units = {name: MortalUnit(name) for name in ("Appa", "Momo", "Aang")}
+        self.restores = 0
+        self.executions = 0
+
+    def snapshot(self) -> State:
+        return {name: (unit.position, unit.alive) for name, unit in self.units.items()}
+
+    def restore(self, state: State) -> None:
+        self.restores += 1
+        for name, (position, alive) in state.items():
+            self.units[name].position = position
+            self.units[name].alive = alive
+
+
+class CountedCommand:
+    def __init__(self, world: World, command: Command) -> None:
+        self._world = world
+        self._command = command
+
+    def execute(self) -> None:
+        self._world.executions += 1
+        self._command.execute()
+
+
+def _commands(world: World, count: int) -> List[Command]:
+    directions = list(MovementDirection)
+    commands: List[Command] = []
+    for index in range(count):
+        unit = world.units["Appa" if index % 3 else "Momo"]
+        if index == count - 5:
+            commands.append(CountedCommand(world, DestroyCommand(world.units["Aang"])))
+        else:
+            commands.append(MoveCommand(unit, directions[index % 4], index % 6 + 1))
+    return commands
+
+
+def _play(world: World, journal: CommandJournal, count: int) -> List[State]:
+    states = [world.snapshot()]
+    for command in _commands(world, count):
+        command.execute()
+        journal.record(command)
+        states.append(world.snapshot())
+    return states
+
+
+@pytest.mark.parametrize("steps", [1, 3, 7, 20, 58, 60])
+def test_undo_restores_the_state_from_n_steps_ago(steps: int) -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=10)
+    states = _play(world, journal, 60)
+
+    # when
+    undone = journal.undo(steps)
+
+    # then
+    assert undone == steps
+    assert journal.position == 60 - steps
+    assert world.snapshot() == states[60 - steps]
+
+
+def test_redo_moves_forward_again() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=10)
+    states = _play(world, journal, 60)
+    journal.undo(25)
+
+    # when
+    journal.redo(10)
+    middle = world.snapshot()
+    redone = journal.redo(100)
+
+    # then
+    assert middle == states[45]
+    assert redone == 15
+    assert world.snapshot() == states[60]
+
+
+def test_rewinding_costs_at_most_a_restore_and_a_replay_from_a_checkpoint() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=10)
+    states = _play(world, journal, 60)
+    world.executions = 0
+
+    # when
+    journal.undo(8)
+
+    # then
+    assert world.snapshot() == states[52]
+    assert world.restores == 1
+    assert world.executions == 0
+
+
+def test_undoable_commands_are_undone_without_a_restore() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=10)
+    states = _play(world, journal, 44)
+
+    # when
+    journal.undo(2)
+
+    # then
+    assert world.snapshot() == states[42]
+    assert world.restores == 0
+
+
+def test_recording_after_an_undo_discards_the_redo_history() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=10)
+    _play(world, journal, 30)
+    journal.undo(15)
+
+    # when
+    command = MoveCommand(world.units["Appa"], MovementDirection.NORTH, 1)
+    command.execute()
+    journal.record(command)
+
+    # then
+    assert journal.redoable_steps == 0
+    assert journal.position == 16
+    assert journal.checkpoints == [0, 10]
+
+
+def test_journal_memory_is_bounded() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(
+        world.snapshot, world.restore, snapshot_interval=10, max_commands=25
+    )
+    states = _play(world, journal, 100)
+
+    # when
+    undone = journal.undo(100)
+
+    # then
+    assert undone <= 25
+    assert world.snapshot() == states[100 - undone]
+    assert len(journal.checkpoints) <= 4
+
+
+def test_game_engine_journals_the_commands_that_succeeded() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore)
+    engine = GameEngine(journal=journal)
+    appa, momo = world.units["Appa"], world.units["Momo"]
+
+    # when
+    engine.queue_commands(
+        MoveCommand(appa, MovementDirection.NORTH, 2),
+        DestroyCommand(momo),
+        MoveCommand(momo, MovementDirection.EAST, 1),
+    )
+    engine.execute_turn()
+    journal.undo(2)
+
+    # then
+    assert len(engine.failed_commands) == 1
+    assert journal.position == 0
+    assert world.snapshot() == {
+        "Appa": ((0, 0), True),
+        "Momo": ((0, 0), True),
+        "Aang": ((0, 0), True),
+    }
+
+
+def test_game_engine_only_takes_checkpoints_between_turns() -> None:
+    # given
+    world = World()
+    journal = CommandJournal(world.snapshot, world.restore, snapshot_interval=2)
+    engine = GameEngine(journal=journal)
+    appa = world.units["Appa"]
+
+    # when
+    engine.queue_commands(
+        *(MoveCommand(appa, MovementDirection.EAST, 1) for _ in range(5))
+    )
+    engine.execute_turn()
+    journal.undo(2)
+
+    # then
+    assert journal.checkpoints == [0, 5]
+    assert appa.position == (3, 0)
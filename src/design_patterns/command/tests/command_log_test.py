@@ -0,0 +1,160 @@
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+from src.design_patterns.command.command_log import (
+    MAGIC,
+    CommandLog,
+    read_log,
+    replay_log,
+)
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.supplement import MovementDirection
+from src.design_patterns.command.tests.fixtures import TrackedUnit
+
+
+class BrokenCommand:
+    def execute(self) -> None:
+        pass
+
+
+def _units() -> Dict[int, TrackedUnit]:
+    return {unit_id: TrackedUnit() for unit_id in (7, 42, 1_000_000)}
+
+
+def _play(path: str, units: Dict[int, TrackedUnit], coalesce_moves: bool) -> None:
+    directions = list(MovementDirection)
+    with CommandLog(path, units) as log:
+        engine = GameEngine(command_log=log, coalesce_moves=coalesce_moves)
+        for turn in range(5):
+            engine.queue_commands(
+                *(
+                    MoveCommand(unit, directions[(turn + index) % 4], turn + index)
+                    for index, unit in enumerate(units.values())
+                ),
+                MoveCommand(units[7], MovementDirection.NORTH, 1),
+            )
+            if turn == 3:
+                engine.queue_commands(DestroyCommand(units[42]))
+            engine.execute_turn()
+
+
+def _positions(units: Dict[int, TrackedUnit]) -> Dict[int, Tuple[int, int]]:
+    return {unit_id: unit.position for unit_id, unit in units.items()}
+
+
+def test_replaying_the_log_rebuilds_the_game(tmp_path: Path) -> None:
+    # given
+    path = str(tmp_path / "game.log")
+    units = _units()
+    _play(path, units, coalesce_moves=False)
+    replayed = _units()
+
+    # when
+    turns = replay_log(path, replayed)
+
+    # then
+    assert turns == 5
+    assert [unit.history for unit in replayed.values()] == [
+        unit.history for unit in units.values()
+    ]
+
+
+def test_coalesced_moves_are_logged_as_the_queued_moves(tmp_path: Path) -> None:
+    # given
+    path = str(tmp_path / "game.log")
+    units = _units()
+    _play(path, units, coalesce_moves=True)
+    replayed = _units()
+
+    # when
+    replay_log(path, replayed)
+
+    # then
+    assert _positions(replayed) == _positions(units)
+    assert len(replayed[7].history) == 10
+
+
+def test_records_are_ten_bytes(tmp_path: Path) -> None:
+    # given
+    path = str(tmp_path / "game.log")
+    _play(path, _units(), coalesce_moves=False)
+
+    # when
+    commands = sum(len(turn) for turn in read_log(path, _units()))
+
+    # then
+    assert os.path.getsize(path) == len(MAGIC) + 10 * (commands + 5)
+
+
+def test_a_torn_turn_is_ignored_and_cut_off_on_reopening(tmp_path: Path) -> None:
+    # given
+    path = str(tmp_path / "game.log")
+    units = _units()
+    _play(path, units, coalesce_moves=False)
+    with open(path, "ab") as log:
+        log.write(b"\x01\x07\x00\x00\x00\x00\x05\x00\x00\x00\x01\x07")
+
+    # when
+    turns = len(list(read_log(path, units)))
+    with CommandLog(path, units) as log:
+        log.append_turn([DestroyCommand(units[7])])
+    replayed = _units()
+    replay_log(path, replayed)
+
+    # then
+    assert turns == 5
+    assert replayed[7].history[-1] == ("DESTROYED", 0)
+    assert replayed[7].history[:-1] == units[7].history
+
+
+def test_an_empty_log_replays_nothing(tmp_path: Path) -> None:
+    # given
+    path = str(tmp_path / "game.log")
+    CommandLog(path, {}).close()
+
+    # then
+    assert replay_log(path, {}) == 0
+
+
+def test_unknown_commands_cannot_be_logged(tmp_path: Path) -> None:
+    # given
+    with CommandLog(str(tmp_path / "game.log"), {}) as log:
+        # then
+        with pytest.raises(TypeError):
+            log.append_turn([BrokenCommand()])
+
+
+def test_commands_that_cannot_be_logged_are_refused_before_they_run(
+    tmp_path: Path,
+) -> None:
+    # given
+    units = _units()
+    stranger = TrackedUnit()
+    with CommandLog(str(tmp_path / "game.log"), units) as log:
+        engine = GameEngine(command_log=log)
+
+        # then
+        with pytest.raises(TypeError):
+            engine.queue_commands(
+                MoveCommand(units[7], MovementDirection.NORTH, 1), BrokenCommand()
+            )
+        with pytest.raises(KeyError):
+            engine.queue_commands(MoveCommand(stranger, MovementDirection.EAST, 1))
+        assert engine.queued_commands == ()
+
+
+def test_other_files_are_rejected(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"not a command log")
+
+    # then
+    with pytest.raises(ValueError):
+        CommandLog(str(path), {})
@@ -0,0 +1,149 @@
+import json
+from typing import List, Tuple
+
+import pytest
+
+from src.design_patterns.command.command_metrics import (
+    CommandMetrics,
+    LatencyHistogram,
+)
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    LandUnit,
+    MoveCommand,
+    SeaUnit,
+)
+from src.design_patterns.command.supplement import Command, MovementDirection
+
+
+class FailingCommand:
+    def execute(self) -> None:
+        raise RuntimeError("Unit is stuck.")
+
+
+def _play(metrics: CommandMetrics) -> GameEngine:
+    engine = GameEngine(metrics=metrics)
+    land_unit, sea_unit = LandUnit(), SeaUnit()
+    engine.queue_commands(
+        MoveCommand(land_unit, MovementDirection.NORTH, 2),
+        MoveCommand(sea_unit, MovementDirection.EAST, 5),
+        MoveCommand(land_unit, MovementDirection.SOUTH, 1),
+        DestroyCommand(sea_unit),
+        FailingCommand(),
+    )
+    engine.execute_turn()
+    return engine
+
+
+@pytest.mark.parametrize("value", [0, 1, 7, 15, 16, 17, 1_000, 123_456, 10**10])
+def test_histogram_buckets_are_within_an_eighth_of_the_value(value: int) -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    histogram.record(value)
+
+    # then
+    [(upper_bound, count)] = list(histogram.buckets())
+    assert count == 1
+    assert value <= upper_bound <= value * 1.125 + 1
+
+
+def test_histogram_percentiles() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    for value in range(1, 1_001):
+        histogram.record(value * 1_000)
+
+    # then
+    assert histogram.count == 1_000
+    assert 500_000 <= histogram.percentile(50) <= 500_000 * 1.125
+    assert 990_000 <= histogram.percentile(99) <= 1_000_000
+    assert histogram.percentile(100) == histogram.max == 1_000_000
+
+
+def test_metrics_are_kept_per_command_class_and_receiver_type() -> None:
+    # given
+    metrics = CommandMetrics()
+
+    # when
+    engine = _play(metrics)
+
+    # then
+    statistics = metrics.statistics()
+    assert len(engine.failed_commands) == 1
+    assert {
+        name: (stats["count"], stats["failures"])
+        for name, stats in statistics["commands"].items()
+    } == {"DestroyCommand": (1, 0), "FailingCommand": (1, 1), "MoveCommand": (3, 0)}
+    assert statistics["commands"]["FailingCommand"]["failure_rate"] == 1.0
+    assert statistics["receivers"] == {"LandUnit": 2, "SeaUnit": 2}
+
+
+def test_hooks_see_every_command() -> None:
+    # given
+    metrics = CommandMetrics()
+    started: List[Command] = []
+    finished: List[Tuple[str, bool]] = []
+    metrics.pre_execute_hooks.append(started.append)
+    metrics.post_execute_hooks.append(
+        lambda command, nanoseconds, failed: finished.append(
+            (type(command).__name__, failed)
+        )
+    )
+
+    # when
+    _play(metrics)
+
+    # then
+    assert len(started) == 5
+    assert finished[-2:] == [("DestroyCommand", False), ("FailingCommand", True)]
+
+
+def test_statistics_export_as_json() -> None:
+    # given
+    metrics = CommandMetrics()
+    _play(metrics)
+
+    # when
+    exported = json.loads(metrics.to_json())
+
+    # then
+    assert exported == json.loads(json.dumps(metrics.statistics()))
+    assert (
+        sum(count for _, count in exported["commands"]["MoveCommand"]["buckets"]) == 3
+    )
+
+
+def test_statistics_export_as_prometheus_text() -> None:
+    # given
+    metrics = CommandMetrics()
+    _play(metrics)
+
+    # when
+    exported = metrics.to_prometheus().splitlines()
+
+    # then
+    assert "# TYPE game_command_duration_seconds histogram" in exported
+    assert (
+        'game_command_duration_seconds_bucket{command="MoveCommand",le="+Inf"} 3'
+        in exported
+    )
+    assert 'game_command_duration_seconds_count{command="MoveCommand"} 3' in exported
+    assert 'game_command_failures_total{command="FailingCommand"} 1' in exported
+    assert 'game_receiver_commands_total{receiver="SeaUnit"} 2' in exported
+
+
+def test_reset_clears_the_statistics() -> None:
+    # given
+    metrics = CommandMetrics()
+    _play(metrics)
+
+    # when
+    metrics.reset()
+
+    # then
+    assert metrics.statistics() == {"commands": {}, "receivers": {}}
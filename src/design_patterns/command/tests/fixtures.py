@@ -0,0 +1,28 @@
+from typing import List, Tuple
+
+from src.design_patterns.command.supplement import MovementDirection
+
+
+class TrackedUnit:
+    # keeps track of where it is and of every order it was given, in order
+    def __init__(self, name: str = "", fragile: bool = False) -> None:
+        self.name = name
+        # fragile units fail when told to stand still
+        self.fragile = fragile
+        self.position = (0, 0)
+        self.alive = True
+        self.history: List[Tuple[str, int]] = []
+        self.positions_when_destroyed: List[Tuple[int, int]] = []
+
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        if self.fragile and distance == 0:
+            raise RuntimeError("Unit cannot stand still.")
+        step_x, step_y = direction.unit_vector
+        x, y = self.position
+        self.position = (x + step_x * distance, y + step_y * distance)
+        self.history.append((direction.value, distance))
+
+    def destroy(self) -> None:
+        self.alive = False
+        self.positions_when_destroyed.append(self.position)
+        self.history.append(("DESTROYED", 0))
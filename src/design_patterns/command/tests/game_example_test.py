@@ -1,3 +1,8 @@
+from threading import Thread
+from typing import List, Sequence, Tuple
+
+import pytest
+
 from src.design_patterns.command.game_example import (
     DestroyCommand,
     GameEngine,
@@ -5,7 +10,12 @@ from src.design_patterns.command.game_example import (
     MoveCommand,
     SeaUnit,
 )
-from src.design_patterns.command.supplement import MovementDirection
+from src.design_patterns.command.supplement import (
+    Command,
+    CommandQueueFullError,
+    MovementDirection,
+    OverflowPolicy,
+)
 
 
 def test_player_can_take_turn() -> None:
@@ -23,3 +33,218 @@ def test_player_can_take_turn() -> None:
 
     # then
     engine.execute_turn()
+
+
+class RecordingUnit:
+    def __init__(self) -> None:
+        self.moves: List[Tuple[MovementDirection, int]] = []
+        self.destroyed = 0
+
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        self.moves.append((direction, distance))
+
+    def destroy(self) -> None:
+        self.destroyed += 1
+
+
+class FlakyCommand:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def execute(self) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("Unit is out of range.")
+
+
+class QueueingCommand:
+    def __init__(self, engine: GameEngine, command: Command) -> None:
+        self._engine = engine
+        self._command = command
+
+    def execute(self) -> None:
+        self._engine.queue_commands(self._command)
+
+
+def test_each_turn_only_runs_the_commands_queued_for_it() -> None:
+    # given
+    engine = GameEngine()
+    unit = RecordingUnit()
+    engine.queue_commands(MoveCommand(unit, MovementDirection.NORTH, 2))
+
+    # when
+    engine.execute_turn()
+    engine.queue_commands(MoveCommand(unit, MovementDirection.EAST, 5))
+    engine.execute_turn()
+    engine.execute_turn()
+
+    # then
+    assert unit.moves == [(MovementDirection.NORTH, 2), (MovementDirection.EAST, 5)]
+    assert engine.queued_commands == ()
+
+
+def test_commands_queued_during_a_turn_wait_for_the_next_one() -> None:
+    # given
+    engine = GameEngine()
+    unit = RecordingUnit()
+    engine.queue_commands(QueueingCommand(engine, DestroyCommand(unit)))
+
+    # when
+    engine.execute_turn()
+    destroyed_after_first_turn = unit.destroyed
+    engine.execute_turn()
+
+    # then
+    assert destroyed_after_first_turn == 0
+    assert unit.destroyed == 1
+
+
+def test_full_queue_rejects_new_commands() -> None:
+    # given
+    engine = GameEngine(max_queued_commands=2)
+    unit = RecordingUnit()
+    engine.queue_commands(DestroyCommand(unit), DestroyCommand(unit))
+
+    # then
+    with pytest.raises(CommandQueueFullError):
+        engine.queue_commands(DestroyCommand(unit))
+    assert len(engine.queued_commands) == 2
+
+
+def test_full_queue_can_drop_the_oldest_commands() -> None:
+    # given
+    engine = GameEngine(
+        max_queued_commands=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    unit = RecordingUnit()
+
+    # when
+    engine.queue_commands(
+        *(MoveCommand(unit, MovementDirection.NORTH, distance) for distance in range(5))
+    )
+    engine.execute_turn()
+
+    # then
+    assert unit.moves == [(MovementDirection.NORTH, 3), (MovementDirection.NORTH, 4)]
+    assert engine.dropped_commands == 3
+
+
+def test_full_queue_can_block_until_a_turn_makes_room() -> None:
+    # given
+    engine = GameEngine(max_queued_commands=1, overflow_policy=OverflowPolicy.BLOCK)
+    unit = RecordingUnit()
+    engine.queue_commands(MoveCommand(unit, MovementDirection.NORTH, 1))
+    producer = Thread(
+        target=engine.queue_commands,
+        args=(MoveCommand(unit, MovementDirection.EAST, 2),),
+    )
+
+    # when
+    producer.start()
+    producer.join(timeout=0.05)
+    blocked = producer.is_alive()
+    engine.execute_turn()
+    producer.join()
+    engine.execute_turn()
+
+    # then
+    assert blocked
+    assert unit.moves == [(MovementDirection.NORTH, 1), (MovementDirection.EAST, 2)]
+
+
+def test_blocking_queue_gives_up_after_its_timeout() -> None:
+    # given
+    engine = GameEngine(
+        max_queued_commands=1, overflow_policy=OverflowPolicy.BLOCK, block_timeout=0.01
+    )
+    unit = RecordingUnit()
+    engine.queue_commands(DestroyCommand(unit))
+
+    # then
+    with pytest.raises(CommandQueueFullError):
+        engine.queue_commands(DestroyCommand(unit))
+
+
+def test_failed_commands_are_bounded_and_can_be_retried() -> None:
+    # given
+    engine = GameEngine(max_failed_commands=2)
+    commands = [FlakyCommand(failures=1) for _ in range(3)]
+    engine.queue_commands(*commands)
+
+    # when
+    engine.execute_turn()
+    failed = engine.failed_commands
+    retried = engine.retry_failed_commands()
+    engine.execute_turn()
+
+    # then
+    assert failed == (commands[1], commands[2])
+    assert retried == 2
+    assert [command.calls for command in commands] == [1, 2, 2]
+    assert engine.failed_commands == ()
+
+
+def test_retries_the_queue_has_no_room_for_stay_failed() -> None:
+    # given
+    engine = GameEngine(max_queued_commands=2)
+    commands = [FlakyCommand(failures=1) for _ in range(2)]
+    engine.queue_commands(*commands)
+    engine.execute_turn()
+    queued = DestroyCommand(RecordingUnit())
+    engine.queue_commands(queued)
+
+    # then
+    with pytest.raises(CommandQueueFullError):
+        # when
+        engine.retry_failed_commands()
+    assert engine.queued_commands == (queued, commands[0])
+    assert engine.failed_commands == (commands[1],)
+
+
+@pytest.mark.parametrize(
+    "overflow_policy", [OverflowPolicy.REJECT, OverflowPolicy.BLOCK]
+)
+def test_commands_queued_together_are_all_queued_or_none_are(
+    overflow_policy: OverflowPolicy,
+) -> None:
+    # given
+    engine = GameEngine(
+        max_queued_commands=3, overflow_policy=overflow_policy, block_timeout=0.01
+    )
+    unit = RecordingUnit()
+    first = MoveCommand(unit, MovementDirection.NORTH, 1)
+    engine.queue_commands(first)
+
+    # then
+    with pytest.raises(CommandQueueFullError):
+        # when
+        engine.queue_commands(
+            *(MoveCommand(unit, MovementDirection.EAST, 1) for _ in range(3))
+        )
+    assert engine.queued_commands == (first,)
+
+
+def test_turn_observers_are_told_about_every_turn() -> None:
+    # given
+    engine = GameEngine()
+    unit = RecordingUnit()
+    move = MoveCommand(unit, MovementDirection.NORTH, 1)
+    failing = FlakyCommand(failures=1)
+    turns: List[Tuple[List[Command], List[Command]]] = []
+
+    class TurnRecorder:
+        def turn_finished(
+            self, turn: Sequence[Command], failed: Sequence[Command]
+        ) -> None:
+            turns.append((list(turn), list(failed)))
+
+    engine.turn_observers.append(TurnRecorder())
+
+    # when
+    engine.queue_commands(move, failing)
+    engine.execute_turn()
+    engine.execute_turn()
+
+    # then
+    assert turns == [([move, failing], [failing]), ([], [])]
@@ -0,0 +1,163 @@
+from random import Random
+from typing import Dict, List, Tuple
+
+import pytest
+
+from src.design_patterns.command.game_example import GameEngine
+from src.design_patterns.command.lockstep_game_example import (
+    DestroyOrder,
+    LockstepSimulation,
+    MoveOrder,
+    Order,
+    Position,
+    registry_state,
+    state_hash,
+    to_command,
+)
+from src.design_patterns.command.supplement import MovementDirection, UnitType
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+Units = Dict[int, Tuple[UnitType, Position]]
+
+
+def _units(count: int) -> Units:
+    rng = Random(3)
+    # ids are spread out so that they do not line up with the partitions
+    return {
+        unit_id: (
+            rng.choice(list(UnitType)),
+            (rng.randint(-50, 50), rng.randint(-50, 50)),
+        )
+        for unit_id in range(0, count * 7, 7)
+    }
+
+
+def _turns(units: Units, turns: int) -> List[List[Order]]:
+    rng = Random(11)
+    unit_ids = sorted(units)
+    directions = list(MovementDirection)
+    orders: List[List[Order]] = []
+    for _ in range(turns):
+        turn: List[Order] = []
+        for _ in range(len(unit_ids) * 2):
+            unit_id = rng.choice(unit_ids)
+            if rng.random() < 0.02:
+                turn.append(DestroyOrder(unit_id))
+            else:
+                turn.append(
+                    MoveOrder(unit_id, rng.choice(directions), rng.randint(1, 9))
+                )
+        orders.append(turn)
+    return orders
+
+
+def _single_process_hashes(units: Units, turns: List[List[Order]]) -> List[int]:
+    registry = UnitRegistry()
+    handles = {
+        unit_id: registry.add_unit(unit_type, position)
+        for unit_id, (unit_type, position) in units.items()
+    }
+    engine = GameEngine()
+
+    hashes = []
+    for orders in turns:
+        engine.queue_commands(*(to_command(order, handles) for order in orders))
+        engine.execute_turn()
+        hashes.append(state_hash(registry_state(registry, handles)))
+    return hashes
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_lockstep_turns_match_a_single_process(workers: int) -> None:
+    # given
+    units = _units(200)
+    turns = _turns(units, 6)
+    expected = _single_process_hashes(units, turns)
+
+    # when
+    hashes = []
+    with LockstepSimulation(units, workers) as simulation:
+        for orders in turns:
+            simulation.queue_orders(*orders)
+            hashes.append(simulation.execute_turn())
+
+    # then
+    assert hashes == expected
+    assert len(set(hashes)) == len(hashes)
+
+
+def test_closing_returns_the_final_state_of_every_unit() -> None:
+    # given
+    units = _units(10)
+    simulation = LockstepSimulation(units, workers=2)
+    simulation.queue_orders(
+        MoveOrder(0, MovementDirection.NORTH, 3), DestroyOrder(7), DestroyOrder(14)
+    )
+    simulation.execute_turn()
+
+    # when
+    state = simulation.close()
+
+    # then
+    x, y = units[0][1]
+    assert sorted(state) == sorted(units)
+    assert state[0] == (x, y + 3, True)
+    assert not state[7][2] and not state[14][2]
+
+
+def test_state_hashes_do_not_depend_on_partitioning() -> None:
+    # given
+    state = {1: (0, 0, True), 2: (5, -3, False), 3: (1, 1, True)}
+
+    # then
+    assert state_hash(state) == (
+        state_hash({1: state[1], 3: state[3]}) + state_hash({2: state[2]})
+    ) % (1 << 64)
+    assert state_hash(state) != state_hash({**state, 3: (1, 2, True)})
+
+
+def test_orders_for_unknown_units_are_rejected() -> None:
+    # given
+    units = _units(10)
+
+    # when
+    with LockstepSimulation(units, workers=2) as simulation:
+        # then
+        with pytest.raises(ValueError):
+            simulation.queue_orders(
+                MoveOrder(0, MovementDirection.NORTH, 1), DestroyOrder(99)
+            )
+        simulation.queue_orders(MoveOrder(0, MovementDirection.NORTH, 1))
+        simulation.execute_turn()
+        state = simulation.close()
+
+    # then
+    x, y = units[0][1]
+    assert state[0] == (x, y + 1, True)
+
+
+def test_errors_in_a_worker_are_raised_and_the_workers_stay_usable() -> None:
+    # given
+    units = _units(10)
+    simulation = LockstepSimulation(units, workers=2)
+    # an order that gets past the parent's checks but fails in the worker
+    simulation._turn_orders[0].append(DestroyOrder(99))
+
+    # then
+    with pytest.raises(KeyError):
+        simulation.execute_turn()
+    assert sorted(simulation.close()) == sorted(units)
+
+
+def test_closing_tolerates_a_dead_worker() -> None:
+    # given
+    units = _units(10)
+    simulation = LockstepSimulation(units, workers=2)
+    simulation._processes[0].kill()
+    simulation._processes[0].join()
+
+    # when
+    state = simulation.close()
+
+    # then
+    assert sorted(state) == [unit_id for unit_id in sorted(units) if unit_id % 2]
@@ -0,0 +1,199 @@
+from itertools import cycle
+from typing import List, Sequence, Tuple
+
+import pytest
+
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    LandUnit,
+    MoveCommand,
+    SeaUnit,
+)
+from src.design_patterns.command.move_coalescing import coalesce_commands
+from src.design_patterns.command.supplement import Command, MovementDirection
+from src.design_patterns.command.tests.fixtures import TrackedUnit
+
+
+class BatchTrackedUnit(TrackedUnit):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[Sequence[Tuple[MovementDirection, int]]] = []
+
+    def move_batch(self, moves: Sequence[Tuple[MovementDirection, int]]) -> None:
+        self.batches.append(moves)
+        for direction, distance in moves:
+            super().move(direction, distance)
+
+
+class FailingUnit(TrackedUnit):
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        raise RuntimeError("Unit is stuck.")
+
+
+def _turn(units: Sequence[TrackedUnit]) -> List[Command]:
+    directions = cycle(MovementDirection)
+    commands: List[Command] = []
+    for index in range(60):
+        unit = units[index % len(units)]
+        if index % 17 == 16:
+            commands.append(DestroyCommand(unit))
+        else:
+            commands.append(MoveCommand(unit, next(directions), index % 7))
+    return commands
+
+
+def test_coalesced_turn_ends_in_the_same_state_as_a_sequential_one() -> None:
+    # given
+    sequential_units = [TrackedUnit() for _ in range(3)]
+    coalesced_units = [TrackedUnit() for _ in range(3)]
+    sequential = GameEngine()
+    coalesced = GameEngine(coalesce_moves=True)
+
+    # when
+    sequential.queue_commands(*_turn(sequential_units))
+    coalesced.queue_commands(*_turn(coalesced_units))
+    sequential.execute_turn()
+    coalesced.execute_turn()
+
+    # then
+    for expected, actual in zip(sequential_units, coalesced_units):
+        assert actual.position == expected.position
+        assert actual.positions_when_destroyed == expected.positions_when_destroyed
+        assert len(actual.history) < len(expected.history)
+
+
+def test_moves_in_the_same_direction_are_summed() -> None:
+    # given
+    unit = TrackedUnit()
+    commands: List[Command] = [
+        MoveCommand(unit, MovementDirection.NORTH, distance) for distance in range(5)
+    ]
+
+    # when
+    for command in coalesce_commands(commands):
+        command.execute()
+
+    # then
+    assert unit.history == [("NORTH", 10)]
+
+
+def test_opposite_moves_cancel_out() -> None:
+    # given
+    unit = TrackedUnit()
+    commands: List[Command] = [
+        MoveCommand(unit, MovementDirection.NORTH, 4),
+        MoveCommand(unit, MovementDirection.EAST, 2),
+        MoveCommand(unit, MovementDirection.SOUTH, 4),
+        MoveCommand(unit, MovementDirection.WEST, 5),
+    ]
+
+    # when
+    for command in coalesce_commands(commands):
+        command.execute()
+
+    # then
+    assert unit.history == [("WEST", 3)]
+
+
+def test_moves_are_not_merged_across_a_destroy_command() -> None:
+    # given
+    unit = TrackedUnit()
+    commands: List[Command] = [
+        MoveCommand(unit, MovementDirection.NORTH, 1),
+        DestroyCommand(unit),
+        MoveCommand(unit, MovementDirection.NORTH, 2),
+    ]
+
+    # when
+    for command in coalesce_commands(commands):
+        command.execute()
+
+    # then
+    assert unit.positions_when_destroyed == [(0, 1)]
+    assert unit.history == [("NORTH", 1), ("DESTROYED", 0), ("NORTH", 2)]
+
+
+def test_batch_receivers_get_all_their_moves_in_one_call() -> None:
+    # given
+    unit = BatchTrackedUnit()
+    engine = GameEngine(coalesce_moves=True)
+    engine.queue_commands(
+        MoveCommand(unit, MovementDirection.NORTH, 3),
+        MoveCommand(unit, MovementDirection.EAST, 1),
+        MoveCommand(unit, MovementDirection.NORTH, 2),
+    )
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert unit.batches == [[(MovementDirection.NORTH, 5), (MovementDirection.EAST, 1)]]
+    assert unit.position == (1, 5)
+
+
+def test_failed_coalesced_moves_are_logged_as_the_queued_commands() -> None:
+    # given
+    unit = FailingUnit()
+    engine = GameEngine(coalesce_moves=True)
+    commands = [MoveCommand(unit, MovementDirection.EAST, 1) for _ in range(3)]
+    engine.queue_commands(*commands)
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert engine.failed_commands == tuple(commands)
+
+
+def test_moves_that_cancel_out_still_fail_on_a_unit_that_cannot_move() -> None:
+    # given
+    unit = FailingUnit()
+    engine = GameEngine(coalesce_moves=True)
+    commands = [
+        MoveCommand(unit, MovementDirection.EAST, 2),
+        MoveCommand(unit, MovementDirection.WEST, 2),
+    ]
+    engine.queue_commands(*commands)
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert engine.failed_commands == tuple(commands)
+
+
+def test_moves_that_cancel_out_leave_the_unit_where_it_was() -> None:
+    # given
+    unit = TrackedUnit()
+    commands: List[Command] = [
+        MoveCommand(unit, MovementDirection.NORTH, 3),
+        MoveCommand(unit, MovementDirection.SOUTH, 3),
+    ]
+
+    # when
+    for command in coalesce_commands(commands):
+        command.execute()
+
+    # then
+    assert unit.position == (0, 0)
+    assert unit.history == [("NORTH", 0)]
+
+
+@pytest.mark.parametrize("coalesce_moves", [False, True])
+def test_player_can_take_turn(coalesce_moves: bool) -> None:
+    # given
+    engine = GameEngine(coalesce_moves=coalesce_moves)
+    land_unit = LandUnit()
+    sea_unit = SeaUnit()
+
+    engine.queue_commands(
+        MoveCommand(land_unit, MovementDirection.NORTH, 2),
+        MoveCommand(land_unit, MovementDirection.EAST, 5),
+        MoveCommand(sea_unit, MovementDirection.SOUTH, 6),
+        DestroyCommand(land_unit),
+    )
+
+    # then
+    engine.execute_turn()
+    assert engine.failed_commands == ()
@@ -1,5 +1,8 @@
 from typing import Dict
 
+import pytest
+
+from src.design_patterns.command import photoshop_example
 from src.design_patterns.command.photoshop_example import (
     Command,
     KeyboardHandler,
@@ -38,3 +41,184 @@ def test_unbound_keys_do_not_raise_error() -> None:
 
     # then
     key_handler.handle_input("x")
+
+
+class CountingCommand:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def execute(self) -> None:
+        self.calls += 1
+
+
+def test_handle_inputs_dispatches_a_stream_of_keys() -> None:
+    # given
+    brush = CountingCommand()
+    eraser = CountingCommand()
+    key_handler = KeyboardHandler({"b": brush, "e": eraser})
+
+    # when
+    key_handler.handle_inputs("bexbbq")
+
+    # then
+    assert brush.calls == 3
+    assert eraser.calls == 1
+
+
+def test_keys_can_be_rebound() -> None:
+    # given
+    brush = CountingCommand()
+    eraser = CountingCommand()
+    key_handler = KeyboardHandler({"b": brush})
+
+    # when
+    key_handler.bind("b", eraser)
+    key_handler.handle_input("b")
+    key_handler.unbind("b")
+    key_handler.handle_input("b")
+
+    # then
+    assert brush.calls == 0
+    assert eraser.calls == 1
+
+
+def test_unbound_keys_share_one_null_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    # given
+    key_handler = KeyboardHandler({"b": CountingCommand()})
+
+    def forbidden() -> None:
+        raise AssertionError("A new NullCommand was created.")
+
+    monkeypatch.setattr(photoshop_example, "NullCommand", forbidden)
+
+    # then
+    key_handler.handle_input("x")
+    key_handler.handle_inputs("xyz")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_key_sequences_and_chords_can_be_bound() -> None:
+    # given
+    top = CountingCommand()
+    brush = CountingCommand()
+    key_handler = KeyboardHandler({"g g": top, "ctrl+shift+b": brush})
+
+    # when
+    key_handler.handle_inputs(["g", "g", "shift+ctrl+b", "g", "x", "g", "g"])
+
+    # then
+    assert top.calls == 2
+    assert brush.calls == 1
+
+
+def test_the_space_bar_can_be_bound() -> None:
+    # given
+    pan = CountingCommand()
+    key_handler = KeyboardHandler({" ": pan})
+
+    # when
+    key_handler.handle_inputs([" ", "x", " "])
+
+    # then
+    assert pan.calls == 2
+
+
+@pytest.mark.parametrize("binding", ["", "g  g", " g", "g ", "ctrl+", "+b", "ctrl++b"])
+def test_bindings_with_empty_keys_are_rejected(binding: str) -> None:
+    # then
+    with pytest.raises(ValueError):
+        KeyboardHandler({binding: CountingCommand()})
+
+
+def test_the_plus_key_can_be_bound_on_its_own_and_in_chords() -> None:
+    # given
+    zoom_in = CountingCommand()
+    plus = CountingCommand()
+    key_handler = KeyboardHandler({"ctrl++": zoom_in, "+": plus})
+
+    # when
+    key_handler.handle_inputs(["ctrl++", "+", "shift+ctrl++"])
+
+    # then
+    assert zoom_in.calls == 1
+    assert plus.calls == 1
+
+
+def test_chords_can_be_unbound_with_their_modifiers_in_any_order() -> None:
+    # given
+    redo = CountingCommand()
+    key_handler = KeyboardHandler({"ctrl+shift+z": redo})
+
+    # when
+    key_handler.unbind("shift+ctrl+z")
+    key_handler.handle_input("ctrl+shift+z")
+
+    # then
+    assert redo.calls == 0
+
+
+def test_ambiguous_prefixes_wait_for_the_sequence_timeout() -> None:
+    # given
+    clock = FakeClock()
+    line = CountingCommand()
+    top = CountingCommand()
+    key_handler = KeyboardHandler(
+        {"g": line, "g g": top}, sequence_timeout=0.5, clock=clock
+    )
+
+    # when
+    key_handler.handle_input("g")
+    waiting = line.calls
+    clock.now = 0.6
+    key_handler.poll()
+
+    # then
+    assert waiting == 0
+    assert line.calls == 1
+    assert top.calls == 0
+
+
+def test_a_key_that_breaks_a_sequence_resolves_it_and_starts_afresh() -> None:
+    # given
+    clock = FakeClock()
+    line = CountingCommand()
+    top = CountingCommand()
+    eraser = CountingCommand()
+    key_handler = KeyboardHandler(
+        {"g": line, "g g": top, "e": eraser}, sequence_timeout=0.5, clock=clock
+    )
+
+    # when
+    key_handler.handle_inputs("ge")
+    key_handler.handle_input("g")
+    clock.now = 1.0
+    key_handler.handle_input("g")
+
+    # then
+    assert line.calls == 2
+    assert eraser.calls == 1
+    assert top.calls == 0
+
+
+def test_sequences_can_be_rebound_at_runtime() -> None:
+    # given
+    top = CountingCommand()
+    bottom = CountingCommand()
+    key_handler = KeyboardHandler({"g g": top})
+
+    # when
+    key_handler.bind("g e", bottom)
+    key_handler.handle_inputs("gggegg")
+    key_handler.unbind("g g")
+    key_handler.handle_inputs("gggg")
+
+    # then
+    assert top.calls == 2
+    assert bottom.calls == 1
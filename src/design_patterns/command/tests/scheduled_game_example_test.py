@@ -0,0 +1,216 @@
+from typing import List
+
+import pytest
+
+from src.design_patterns.command.command_metrics import CommandMetrics
+from src.design_patterns.command.game_example import MoveCommand
+from src.design_patterns.command.scheduled_game_example import ScheduledGameEngine
+from src.design_patterns.command.spatial_index import SpatialGrid
+from src.design_patterns.command.supplement import (
+    CommandQueueFullError,
+    MovementDirection,
+    OverflowPolicy,
+    UnitType,
+)
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TimedCommand:
+    def __init__(
+        self, name: str, clock: FakeClock, log: List[str], seconds: float = 1.0
+    ) -> None:
+        self.name = name
+        self._clock = clock
+        self._log = log
+        self._seconds = seconds
+
+    def execute(self) -> None:
+        self._clock.now += self._seconds
+        self._log.append(self.name)
+
+
+class FailingCommand:
+    def execute(self) -> None:
+        raise RuntimeError("Unit is stuck.")
+
+
+def test_commands_run_highest_priority_first_then_in_queued_order() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(clock=clock)
+    engine.queue_commands(TimedCommand("move 1", clock, log))
+    engine.queue_command(TimedCommand("destroy", clock, log), priority=10)
+    engine.queue_command(TimedCommand("move 2", clock, log))
+    engine.queue_command(TimedCommand("attack", clock, log), priority=5)
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert log == ["destroy", "attack", "move 1", "move 2"]
+
+
+def test_earlier_deadlines_go_first_within_a_priority() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(clock=clock)
+    engine.queue_command(TimedCommand("no deadline", clock, log))
+    engine.queue_command(TimedCommand("turn 3", clock, log), deadline=3)
+    engine.queue_command(TimedCommand("turn 1", clock, log), deadline=1)
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert log == ["turn 1", "turn 3", "no deadline"]
+
+
+def test_a_turn_stops_at_its_time_budget_and_carries_the_rest_over() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(turn_time_budget=3.0, clock=clock)
+    commands = [TimedCommand(f"move {index}", clock, log) for index in range(5)]
+    engine.queue_commands(*commands)
+
+    # when
+    engine.execute_turn()
+    first_turn = engine.last_turn_stats
+    engine.execute_turn()
+
+    # then
+    assert first_turn is not None
+    assert (first_turn.executed, first_turn.deferred) == (3, tuple(commands[3:]))
+    assert first_turn.seconds == 3.0
+    assert log == [command.name for command in commands]
+    assert engine.queued_commands == ()
+
+
+def test_carried_over_commands_still_beat_lower_priorities() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(turn_time_budget=1.0, clock=clock)
+    engine.queue_command(TimedCommand("destroy 1", clock, log), priority=9)
+    engine.queue_command(TimedCommand("destroy 2", clock, log), priority=9)
+    engine.execute_turn()
+
+    # when
+    move = TimedCommand("move", clock, log)
+    engine.queue_command(move)
+    engine.execute_turn()
+
+    # then
+    assert log == ["destroy 1", "destroy 2"]
+    assert engine.queued_commands == (move,)
+
+
+def test_commands_past_their_deadline_are_dropped() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(turn_time_budget=1.0, clock=clock)
+    urgent = TimedCommand("urgent", clock, log)
+    expiring = TimedCommand("expiring", clock, log)
+    later = TimedCommand("later", clock, log)
+    engine.queue_command(urgent, priority=1)
+    engine.queue_command(expiring, deadline=1)
+    engine.queue_command(later, deadline=2)
+
+    # when
+    engine.execute_turn()
+    first_turn = engine.last_turn_stats
+    engine.execute_turn()
+
+    # then
+    assert first_turn is not None
+    assert first_turn.dropped == (expiring,)
+    assert first_turn.deferred == (later,)
+    assert log == ["urgent", "later"]
+    assert engine.dropped_commands == 1
+
+
+def test_a_turn_always_runs_at_least_one_command() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(turn_time_budget=0.5, clock=clock)
+    engine.queue_commands(
+        TimedCommand("slow", clock, log, seconds=2.0),
+        TimedCommand("next", clock, log),
+    )
+
+    # when
+    engine.execute_turn()
+    engine.execute_turn()
+
+    # then
+    assert log == ["slow", "next"]
+
+
+def test_failures_are_counted_and_kept() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(clock=clock)
+    failing = FailingCommand()
+    engine.queue_commands(failing, TimedCommand("move", clock, log))
+
+    # when
+    engine.execute_turn()
+
+    # then
+    stats = engine.last_turn_stats
+    assert stats is not None
+    assert (stats.turn, stats.executed, stats.failed) == (1, 2, 1)
+    assert engine.failed_commands == (failing,)
+
+
+def test_a_rejected_command_is_not_queued() -> None:
+    # given
+    clock = FakeClock()
+    log: List[str] = []
+    engine = ScheduledGameEngine(
+        clock=clock, max_queued_commands=1, overflow_policy=OverflowPolicy.REJECT
+    )
+    engine.queue_command(TimedCommand("first", clock, log), priority=1)
+
+    # then
+    with pytest.raises(CommandQueueFullError):
+        engine.queue_command(TimedCommand("second", clock, log), priority=9)
+    assert len(engine.queued_commands) == 1
+
+
+def test_engine_options_are_passed_on() -> None:
+    # given
+    registry = UnitRegistry()
+    unit = registry.add_unit(UnitType.LAND, (0, 0))
+    grid = SpatialGrid(registry, cell_size=10)
+    metrics = CommandMetrics()
+    engine = ScheduledGameEngine(
+        unit_registry=registry, spatial_index=grid, metrics=metrics
+    )
+    engine.queue_commands(MoveCommand(unit, MovementDirection.EAST, 25))
+
+    # when
+    engine.execute_turn()
+
+    # then
+    assert grid.units_in_cell((2, 0)) == [unit]
+    assert metrics.statistics()["commands"]["MoveCommand"]["count"] == 1
+
+
+def test_moves_cannot_be_coalesced() -> None:
+    # then
+    with pytest.raises(ValueError):
+        ScheduledGameEngine(coalesce_moves=True)
@@ -0,0 +1,145 @@
+from typing import List
+
+import pytest
+
+from src.design_patterns.command.command_metrics import CommandMetrics
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.sharded_game_example import ShardedGameEngine
+from src.design_patterns.command.spatial_index import SpatialGrid
+from src.design_patterns.command.supplement import Command, MovementDirection, UnitType
+from src.design_patterns.command.tests.fixtures import TrackedUnit
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+
+def _turn(units: List[TrackedUnit]) -> List[Command]:
+    directions = list(MovementDirection)
+    commands: List[Command] = []
+    for index in range(200):
+        unit = units[index * 7 % len(units)]
+        if index % 50 == 49:
+            commands.append(DestroyCommand(unit))
+        else:
+            commands.append(
+                MoveCommand(unit, directions[index % len(directions)], index % 5)
+            )
+    return commands
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_turn_matches_a_sequential_one(pool: str, workers: int) -> None:
+    # given
+    expected_units = [TrackedUnit(str(index), index % 4 == 0) for index in range(10)]
+    actual_units = [TrackedUnit(str(index), index % 4 == 0) for index in range(10)]
+    sequential = GameEngine()
+    expected_commands = _turn(expected_units)
+    actual_commands = _turn(actual_units)
+    sequential.queue_commands(*expected_commands)
+
+    # when
+    sequential.execute_turn()
+    with ShardedGameEngine(workers=workers, pool=pool) as engine:
+        engine.queue_commands(*actual_commands)
+        engine.execute_turn()
+        failed = engine.failed_commands
+
+    # then
+    assert [unit.history for unit in actual_units] == [
+        unit.history for unit in expected_units
+    ]
+    assert sorted(map(actual_commands.index, failed)) == sorted(
+        map(expected_commands.index, sequential.failed_commands)
+    )
+    assert failed
+
+
+def test_pool_survives_between_turns() -> None:
+    # given
+    unit = TrackedUnit("Appa")
+    other = TrackedUnit("Momo")
+
+    # when
+    with ShardedGameEngine(workers=2) as engine:
+        for distance in range(3):
+            engine.queue_commands(
+                MoveCommand(unit, MovementDirection.NORTH, distance),
+                MoveCommand(other, MovementDirection.SOUTH, distance),
+            )
+            engine.execute_turn()
+
+    # then
+    assert unit.history == [("NORTH", 0), ("NORTH", 1), ("NORTH", 2)]
+    assert other.history == [("SOUTH", 0), ("SOUTH", 1), ("SOUTH", 2)]
+
+
+def test_unknown_pools_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        ShardedGameEngine(pool="fiber")
+
+
+def test_engine_options_are_passed_on() -> None:
+    # given
+    registry = UnitRegistry()
+    units = [registry.add_unit(UnitType.LAND, (0, 0)) for _ in range(2)]
+    grid = SpatialGrid(registry, cell_size=10)
+
+    # when
+    with ShardedGameEngine(
+        workers=2, unit_registry=registry, spatial_index=grid
+    ) as engine:
+        engine.queue_commands(
+            MoveCommand(units[0], MovementDirection.EAST, 25),
+            MoveCommand(units[1], MovementDirection.NORTH, 25),
+        )
+        engine.execute_turn()
+
+    # then
+    assert grid.units_in_cell((2, 0)) == [units[0]]
+    assert grid.units_in_cell((0, 2)) == [units[1]]
+
+
+def test_metrics_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        ShardedGameEngine(metrics=CommandMetrics())
+
+
+def test_receivers_without_a_dict_cannot_be_sent_to_processes() -> None:
+    # given
+    registry = UnitRegistry()
+    units = [registry.add_unit(UnitType.LAND, (0, 0)) for _ in range(2)]
+
+    # when
+    with ShardedGameEngine(workers=2, pool="process") as engine:
+        engine.queue_commands(
+            *(MoveCommand(unit, MovementDirection.EAST, 1) for unit in units)
+        )
+
+        # then
+        with pytest.raises(TypeError):
+            engine.execute_turn()
+    assert [registry.position(unit.index) for unit in units] == [(0, 0), (0, 0)]
+
+
+class CountingCommand:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def execute(self) -> None:
+        self.calls += 1
+
+
+def test_commands_without_a_receiver_keep_their_state_in_process_mode() -> None:
+    # given
+    commands = [CountingCommand() for _ in range(3)]
+
+    # when
+    with ShardedGameEngine(workers=2, pool="process") as engine:
+        engine.queue_commands(*commands)
+        engine.execute_turn()
+
+    # then
+    assert [command.calls for command in commands] == [1, 1, 1]
@@ -0,0 +1,129 @@
+from math import hypot
+from random import Random
+from typing import List, Set, Tuple
+
+import pytest
+
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.spatial_index import SpatialGrid
+from src.design_patterns.command.supplement import MovementDirection, UnitType
+from src.design_patterns.command.unit_registry import RegisteredUnit, UnitRegistry
+
+
+def _registry(units: int, size: int = 200) -> UnitRegistry:
+    rng = Random(7)
+    registry = UnitRegistry()
+    for _ in range(units):
+        registry.add_unit(
+            UnitType.LAND, (rng.randint(-size, size), rng.randint(-size, size))
+        )
+    return registry
+
+
+def _indices(units: List[RegisteredUnit]) -> Set[int]:
+    return {unit.index for unit in units}
+
+
+def _within(registry: UnitRegistry, point: Tuple[int, int], radius: float) -> Set[int]:
+    return {
+        unit.index
+        for unit in registry.units
+        if unit.alive
+        and hypot(unit.position[0] - point[0], unit.position[1] - point[1]) <= radius
+    }
+
+
+@pytest.mark.parametrize("cell_size", [1, 7, 16, 500])
+@pytest.mark.parametrize(
+    "point, radius", [((0, 0), 30), ((-150, 90), 12.5), ((199, -199), 80), ((3, 3), 0)]
+)
+def test_units_within_matches_checking_every_unit(
+    cell_size: int, point: Tuple[int, int], radius: float
+) -> None:
+    # given
+    registry = _registry(2_000)
+    grid = SpatialGrid(registry, cell_size)
+
+    # then
+    assert _indices(grid.units_within(point, radius)) == _within(
+        registry, point, radius
+    )
+
+
+def test_large_radii_over_a_sparse_grid_only_visit_occupied_cells() -> None:
+    # given
+    registry = _registry(10, size=1_000_000)
+    grid = SpatialGrid(registry, cell_size=1)
+
+    # when
+    # walking every cell in the box would take 4 * 10^14 steps
+    found = grid.units_within((0, 0), 10_000_000)
+
+    # then
+    assert _indices(found) == set(range(10))
+    assert _indices(grid.units_within((0, 0), 500_000)) == _within(
+        registry, (0, 0), 500_000
+    )
+
+
+def test_units_in_cell_are_the_units_inside_it() -> None:
+    # given
+    registry = UnitRegistry()
+    inside = registry.add_unit(UnitType.LAND, (16, 31))
+    registry.add_unit(UnitType.SEA, (15, 31))
+    registry.add_unit(UnitType.SEA, (16, 32))
+    grid = SpatialGrid(registry, cell_size=16)
+
+    # then
+    assert grid.cell_of((16, 31)) == (1, 1)
+    assert grid.units_in_cell((1, 1)) == [inside]
+    assert grid.units_in_cell((50, 50)) == []
+
+
+def test_game_engine_keeps_the_index_up_to_date() -> None:
+    # given
+    registry = _registry(500)
+    grid = SpatialGrid(registry, cell_size=10)
+    engine = GameEngine(unit_registry=registry, spatial_index=grid)
+    directions = list(MovementDirection)
+    units = registry.units
+
+    # when
+    for turn in range(5):
+        engine.queue_commands(
+            *(
+                MoveCommand(unit, directions[(index + turn) % 4], index % 13)
+                for index, unit in enumerate(units)
+            ),
+            DestroyCommand(units[turn]),
+        )
+        engine.execute_turn()
+
+    # then
+    for point, radius in [((0, 0), 50), ((100, -100), 35), ((-60, 20), 90)]:
+        assert _indices(grid.units_within(point, radius)) == _within(
+            registry, point, radius
+        )
+    assert not set(range(5)) & _indices(grid.units_within((0, 0), 10_000))
+
+
+def test_rebuilding_picks_up_units_added_later() -> None:
+    # given
+    registry = UnitRegistry()
+    grid = SpatialGrid(registry)
+    unit = registry.add_unit(UnitType.LAND, (4, 4))
+
+    # when
+    grid.rebuild()
+
+    # then
+    assert grid.units_within((0, 0), 6) == [unit]
+
+
+def test_cells_must_have_a_size() -> None:
+    with pytest.raises(ValueError):
+        SpatialGrid(UnitRegistry(), cell_size=0)
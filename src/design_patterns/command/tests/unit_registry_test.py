@@ -0,0 +1,141 @@
+from itertools import cycle
+from typing import List
+
+import pytest
+
+from src.design_patterns.command.game_example import (
+    DestroyCommand,
+    GameEngine,
+    MoveCommand,
+)
+from src.design_patterns.command.supplement import (
+    Command,
+    MovementDirection,
+    UnitType,
+)
+from src.design_patterns.command.unit_registry import UnitRegistry
+
+
+class CountingCommand:
+    def __init__(self) -> None:
+        self.executions = 0
+
+    def execute(self) -> None:
+        self.executions += 1
+
+
+def _moves(registry: UnitRegistry, rounds: int) -> List[Command]:
+    directions = cycle(MovementDirection)
+    return [
+        MoveCommand(unit, next(directions), (index + turn) % 5 + 1)
+        for turn in range(rounds)
+        for index, unit in enumerate(registry.units)
+    ]
+
+
+def _registry(units: int) -> UnitRegistry:
+    registry = UnitRegistry()
+    for index in range(units):
+        unit_type = UnitType.LAND if index % 2 else UnitType.SEA
+        registry.add_unit(unit_type, (index, -index))
+    return registry
+
+
+@pytest.mark.parametrize(
+    "direction, vector",
+    [
+        (MovementDirection.NORTH, (0, 1)),
+        (MovementDirection.EAST, (1, 0)),
+        (MovementDirection.SOUTH, (0, -1)),
+        (MovementDirection.WEST, (-1, 0)),
+    ],
+)
+def test_directions_map_to_unit_vectors(
+    direction: MovementDirection, vector: tuple
+) -> None:
+    assert direction.unit_vector == vector
+
+
+def test_units_are_stored_with_their_type_and_position() -> None:
+    # given
+    registry = UnitRegistry()
+
+    # when
+    ship = registry.add_unit(UnitType.SEA, (3, 4))
+    tank = registry.add_unit(UnitType.LAND)
+
+    # then
+    assert len(registry) == 2
+    assert (ship.unit_type, ship.position) == (UnitType.SEA, (3, 4))
+    assert (tank.unit_type, tank.position) == (UnitType.LAND, (0, 0))
+
+
+def test_bulk_moves_match_moving_each_unit() -> None:
+    # given
+    one_by_one = _registry(50)
+    in_bulk = _registry(50)
+
+    # when
+    for command in _moves(one_by_one, 4):
+        command.execute()
+    failed = in_bulk.apply_moves(_moves(in_bulk, 4))  # type: ignore[arg-type]
+
+    # then
+    assert failed == []
+    assert in_bulk.xs == one_by_one.xs
+    assert in_bulk.ys == one_by_one.ys
+
+
+def test_game_engine_applies_registered_moves_in_bulk() -> None:
+    # given
+    registry = _registry(20)
+    expected = _registry(20)
+    for command in _moves(expected, 3):
+        command.execute()
+    engine = GameEngine(unit_registry=registry)
+    other = CountingCommand()
+
+    # when
+    engine.queue_commands(*_moves(registry, 3), other)
+    engine.execute_turn()
+
+    # then
+    assert other.executions == 1
+    assert engine.failed_commands == ()
+    assert [unit.position for unit in registry.units] == [
+        unit.position for unit in expected.units
+    ]
+
+
+def test_moves_after_a_destroy_in_the_same_turn_fail() -> None:
+    # given
+    registry = _registry(2)
+    first, second = registry.units
+    engine = GameEngine(unit_registry=registry)
+    late_move = MoveCommand(first, MovementDirection.NORTH, 5)
+
+    # when
+    engine.queue_commands(
+        MoveCommand(first, MovementDirection.EAST, 2),
+        MoveCommand(second, MovementDirection.EAST, 2),
+        DestroyCommand(first),
+        late_move,
+        MoveCommand(second, MovementDirection.NORTH, 1),
+    )
+    engine.execute_turn()
+
+    # then
+    assert engine.failed_commands == (late_move,)
+    assert not first.alive
+    assert first.position == (2, 0)
+    assert second.position == (3, 0)
+
+
+def test_moving_a_destroyed_unit_directly_raises() -> None:
+    # given
+    unit = UnitRegistry().add_unit(UnitType.LAND)
+    unit.destroy()
+
+    # then
+    with pytest.raises(RuntimeError):
+        unit.move(MovementDirection.NORTH, 1)
@@ -0,0 +1,134 @@
+from array import array
+from operator import attrgetter
+from typing import List, Sequence, Tuple
+
+from src.design_patterns.command.game_example import MoveCommand
+from src.design_patterns.command.supplement import (
+    BaseUnit,
+    Command,
+    MovementDirection,
+    UnitType,
+)
+
+_UNIT_TYPES = tuple(UnitType)
+_TYPE_CODES = {unit_type: code for code, unit_type in enumerate(_UNIT_TYPES)}
+_UNIT_VECTORS = {direction: direction.unit_vector for direction in MovementDirection}
+_MOVE_FIELDS = attrgetter("receiver.index", "direction", "distance")
+
+
+class RegisteredUnit:
+    # a handle on one unit's row in a `UnitRegistry`, usable anywhere a `BaseUnit` is
+    __slots__ = ("registry", "index")
+
+    def __init__(self, registry: "UnitRegistry", index: int) -> None:
+        self.registry = registry
+        self.index = index
+
+    @property
+    def unit_type(self) -> UnitType:
+        return _UNIT_TYPES[self.registry.types[self.index]]
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return self.registry.position(self.index)
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.registry.alive[self.index])
+
+    def move(self, direction: MovementDirection, distance: int) -> None:
+        self.registry.move(self.index, direction, distance)
+
+    def destroy(self) -> None:
+        self.registry.destroy(self.index)
+
+
+class UnitRegistry:
+    def __init__(self) -> None:
+        # every unit is one row across these arrays, so a turn's moves update plain
+        # machine integers rather than attributes spread over many objects
+        self.xs = array("q")
+        self.ys = array("q")
+        self.types = array("B")
+        self.alive = array("B")
+        self.units: List[RegisteredUnit] = []
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def add_unit(
+        self, unit_type: UnitType, position: Tuple[int, int] = (0, 0)
+    ) -> RegisteredUnit:
+        unit = RegisteredUnit(self, len(self.units))
+        x, y = position
+        self.xs.append(x)
+        self.ys.append(y)
+        self.types.append(_TYPE_CODES[unit_type])
+        self.alive.append(1)
+        self.units.append(unit)
+        return unit
+
+    def owns(self, unit: BaseUnit) -> bool:
+        return isinstance(unit, RegisteredUnit) and unit.registry is self
+
+    def position(self, index: int) -> Tuple[int, int]:
+        return self.xs[index], self.ys[index]
+
+    def move(self, index: int, direction: MovementDirection, distance: int) -> None:
+        # the slow path, for a single unit moved through its `move` method
+        if not self.alive[index]:
+            raise RuntimeError("Destroyed units cannot move.")
+
+        step_x, step_y = _UNIT_VECTORS[direction]
+        self.xs[index] += step_x * distance
+        self.ys[index] += step_y * distance
+
+    def destroy(self, index: int) -> None:
+        self.alive[index] = 0
+
+    def apply_moves(self, commands: Sequence[MoveCommand]) -> List[MoveCommand]:
+        # adds each move to the position arrays in turn, returning the moves of
+        # destroyed units as failed rather than raising for each of them
+        alive = self.alive
+        # each direction steps along a single axis
+        axes = {
+            direction: (self.xs, step_x) if step_x else (self.ys, step_y)
+            for direction, (step_x, step_y) in _UNIT_VECTORS.items()
+        }
+        failed = []
+
+        for command, (index, direction, distance) in zip(
+            commands, map(_MOVE_FIELDS, commands)
+        ):
+            if not alive[index]:
+                failed.append(command)
+                continue
+
+            axis, sign = axes[direction]
+            axis[index] += sign * distance
+
+        return failed
+
+    def execute_commands(self, commands: Sequence[Command]) -> List[Command]:
+        # runs a turn, returning the commands that failed. Moves of this registry's
+        # units are gathered and applied in bulk, but never across another command,
+        # as it may destroy a unit that was about to move.
+        failed: List[Command] = []
+        moves: List[MoveCommand] = []
+
+        for command in commands:
+            if type(command) is MoveCommand and self.owns(command.receiver):
+                moves.append(command)
+                continue
+
+            if moves:
+                failed.extend(self.apply_moves(moves))
+                moves = []
+
+            try:
+                command.execute()
+            except RuntimeError:
+                failed.append(command)
+
+        failed.extend(self.apply_moves(moves))
+        return failed
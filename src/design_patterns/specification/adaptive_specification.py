@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from math import inf
+from time import perf_counter
+from typing import Callable, List
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    NotSpecification,
+    OrSpecification,
+    junction_operands,
+)
+from src.design_patterns.specification.supplement import EmployeeLike
+
+
+class _ProfiledOperand:
+    def __init__(self, specification: BaseSpecification) -> None:
+        self.specification = specification
+        self.calls = 0
+        self.passes = 0
+        self.seconds = 0.0
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        start = perf_counter()
+        result = self.specification.is_satisfied_by(employee)
+        self.seconds += perf_counter() - start
+        self.calls += 1
+        self.passes += bool(result)
+        return result
+
+    def rank(self, conjunctive: bool) -> float:
+        # cheap operands that are likely to short-circuit the junction go first;
+        # operands that were never reached keep their place at the back
+        if not self.calls:
+            return inf
+
+        decisive_calls = self.calls - self.passes if conjunctive else self.passes
+        if not decisive_calls:
+            return inf
+
+        return self.seconds / decisive_calls
+
+
+class _AdaptiveJunction(BaseSpecification):
+    def __init__(self, conjunctive: bool, operands: List[BaseSpecification]) -> None:
+        self.conjunctive = conjunctive
+        self.operands = [_ProfiledOperand(_adapt(operand)) for operand in operands]
+        self._checks: List[Callable[[EmployeeLike], bool]] = []
+        self.profile()
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        if self.conjunctive:
+            for check in self._checks:
+                if not check(employee):
+                    return False
+            return True
+
+        for check in self._checks:
+            if check(employee):
+                return True
+        return False
+
+    def profile(self) -> None:
+        for operand in self.operands:
+            operand.calls = operand.passes = 0
+            operand.seconds = 0.0
+            _profile(operand.specification)
+
+        self._checks = [operand.is_satisfied_by for operand in self.operands]
+
+    def reorder(self) -> None:
+        for operand in self.operands:
+            _reorder(operand.specification)
+
+        # `sort` is stable, so operands with equal ranks keep their written order
+        self.operands.sort(key=lambda operand: operand.rank(self.conjunctive))
+        self._checks = [
+            operand.specification.is_satisfied_by for operand in self.operands
+        ]
+
+
+class _AdaptiveNot(BaseSpecification):
+    def __init__(self, subject: BaseSpecification) -> None:
+        self.subject = _adapt(subject)
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return not self.subject.is_satisfied_by(employee)
+
+
+def _adapt(specification: BaseSpecification) -> BaseSpecification:
+    if isinstance(specification, AndSpecification):
+        return _AdaptiveJunction(True, junction_operands(specification))
+
+    if isinstance(specification, OrSpecification):
+        return _AdaptiveJunction(False, junction_operands(specification))
+
+    if isinstance(specification, NotSpecification):
+        return _AdaptiveNot(specification.subject)
+
+    return specification
+
+
+def _profile(specification: BaseSpecification) -> None:
+    if isinstance(specification, _AdaptiveJunction):
+        specification.profile()
+    elif isinstance(specification, _AdaptiveNot):
+        _profile(specification.subject)
+
+
+def _reorder(specification: BaseSpecification) -> None:
+    if isinstance(specification, _AdaptiveJunction):
+        specification.reorder()
+    elif isinstance(specification, _AdaptiveNot):
+        _reorder(specification.subject)
+
+
+class AdaptiveSpecification(BaseSpecification):
+    def __init__(
+        self, specification: BaseSpecification, sample_size: int = 1_000
+    ) -> None:
+        if sample_size < 1:
+            raise ValueError(
+                f"The sample size must be at least 1, but {sample_size} was given."
+            )
+
+        self.sample_size = sample_size
+        self._root = _adapt(specification)
+        self._remaining_samples = sample_size
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        result = self._root.is_satisfied_by(employee)
+
+        if self._remaining_samples:
+            self._remaining_samples -= 1
+            if not self._remaining_samples:
+                self.reorder()
+
+        return result
+
+    def reorder(self) -> None:
+        self._remaining_samples = 0
+        _reorder(self._root)
+
+    def reprofile(self) -> None:
+        self._remaining_samples = self.sample_size
+        _profile(self._root)
@@ -0,0 +1,294 @@
+import os
+import sqlite3
+import tracemalloc
+from timeit import timeit
+from typing import Callable, Dict, List, Tuple
+
+from src.design_patterns.specification.employee_repository import EmployeeRepository
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.employee_table import EmployeeTable
+from src.design_patterns.specification.specification_evaluator import (
+    SpecificationEvaluator,
+)
+from src.design_patterns.specification.specification_sql import (
+    create_schema,
+    find_employees,
+    insert_employees,
+)
+from src.design_patterns.specification.supplement import (
+    CompactEmployee,
+    Department,
+    Employee,
+    EmployeeLike,
+)
+
+_DEPARTMENTS = list(Department)
+
+
+def generate_employees(count: int) -> List[Employee]:
+    employees = []
+
+    for index in range(count):
+        employee = Employee(
+            f"employee-{index}",
+            age=14 + index * 7 % 90,
+            department=_DEPARTMENTS[index % len(_DEPARTMENTS)],
+            salary=5_000 + index * 7_919 % 100_000,
+            years_worked=index % 40,
+        )
+        employee.previous_bonus_years.extend(
+            year for year in range(2018, 2024) if (index + year) % 3 == 0
+        )
+        employees.append(employee)
+
+    return employees
+
+
+def raise_specification() -> BaseSpecification:
+    return (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    ) & IsValidWorkingAge()
+
+
+def benchmark_compiled_specification(
+    population_size: int = 100_000, repeat: int = 3
+) -> Dict[str, float]:
+    employees = generate_employees(population_size)
+    specification = raise_specification()
+    compiled = specification.compile()
+
+    interpreted_seconds = timeit(
+        lambda: [specification.is_satisfied_by(employee) for employee in employees],
+        number=repeat,
+    )
+    compiled_seconds = timeit(
+        lambda: [compiled(employee) for employee in employees], number=repeat
+    )
+
+    evaluations = population_size * repeat
+    return {
+        "interpreted_ns_per_employee": interpreted_seconds / evaluations * 1e9,
+        "compiled_ns_per_employee": compiled_seconds / evaluations * 1e9,
+        "speedup": interpreted_seconds / compiled_seconds,
+    }
+
+
+def benchmark_vectorised_specification(
+    population_size: int = 100_000, repeat: int = 3
+) -> Dict[str, float]:
+    employees = generate_employees(population_size)
+    table = EmployeeTable.from_employees(employees)
+    specification = raise_specification()
+
+    interpreted_seconds = timeit(
+        lambda: [specification.is_satisfied_by(employee) for employee in employees],
+        number=repeat,
+    )
+    vectorised_seconds = timeit(lambda: specification.mask(table), number=repeat)
+
+    evaluations = population_size * repeat
+    return {
+        "interpreted_ns_per_employee": interpreted_seconds / evaluations * 1e9,
+        "vectorised_ns_per_employee": vectorised_seconds / evaluations * 1e9,
+        "speedup": interpreted_seconds / vectorised_seconds,
+    }
+
+
+def benchmark_indexed_repository(
+    population_size: int = 100_000, repeat: int = 3
+) -> Dict[str, float]:
+    employees = generate_employees(population_size)
+    repository = EmployeeRepository(employees)
+    specification = BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000)
+
+    scan_seconds = timeit(
+        lambda: [
+            employee
+            for employee in employees
+            if specification.is_satisfied_by(employee)
+        ],
+        number=repeat,
+    )
+    indexed_seconds = timeit(lambda: repository.find(specification), number=repeat)
+
+    return {
+        "scan_ms_per_query": scan_seconds / repeat * 1e3,
+        "indexed_ms_per_query": indexed_seconds / repeat * 1e3,
+        "speedup": scan_seconds / indexed_seconds,
+    }
+
+
+def _adaptive_speedup(
+    specification: BaseSpecification, employees: List[Employee], repeat: int
+) -> float:
+    adaptive = specification.adaptive()
+
+    static_seconds = timeit(
+        lambda: [specification.is_satisfied_by(employee) for employee in employees],
+        number=repeat,
+    )
+    adaptive_seconds = timeit(
+        lambda: [adaptive.is_satisfied_by(employee) for employee in employees],
+        number=repeat,
+    )
+    return static_seconds / adaptive_seconds
+
+
+def benchmark_adaptive_specification(
+    population_size: int = 100_000, repeat: int = 3
+) -> Dict[str, float]:
+    employees = generate_employees(population_size)
+    raise_eligibility = (
+        HrRaiseEligibility()
+        | SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+    )
+
+    # reordering only pays off when the written order is far from the best one. Here
+    # the costly bonus year checks come first and the age check rejects few
+    # employees, so there is little to gain...
+    even = raise_eligibility & IsValidWorkingAge()
+    # ...while here a cheap salary cap that rejects nearly everyone is written last
+    skewed = raise_eligibility & EarnsAtMost(8_000)
+
+    return {
+        "even_speedup": _adaptive_speedup(even, employees, repeat),
+        "skewed_speedup": _adaptive_speedup(skewed, employees, repeat),
+    }
+
+
+def benchmark_parallel_evaluation(
+    population_size: int = 1_000_000, workers: int = os.cpu_count() or 1
+) -> Dict[str, float]:
+    employees = generate_employees(population_size)
+    specification = raise_specification()
+    evaluator = SpecificationEvaluator()
+
+    serial_seconds = timeit(
+        lambda: [specification.is_satisfied_by(employee) for employee in employees],
+        number=1,
+    )
+    parallel_seconds = timeit(
+        lambda: evaluator.evaluate_many(specification, employees, workers=workers),
+        number=1,
+    )
+
+    return {
+        "workers": workers,
+        "serial_seconds": serial_seconds,
+        "parallel_seconds": parallel_seconds,
+        "speedup": serial_seconds / parallel_seconds,
+    }
+
+
+def _bytes_per_item(build: Callable[[], List], count: int) -> Tuple[List, float]:
+    tracemalloc.start()
+    try:
+        items = build()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return items, allocated / count
+
+
+def benchmark_compact_employee(
+    population_size: int = 100_000, repeat: int = 3
+) -> Dict[str, float]:
+    employees, employee_bytes = _bytes_per_item(
+        lambda: generate_employees(population_size), population_size
+    )
+    compact_employees, compact_bytes = _bytes_per_item(
+        lambda: [
+            CompactEmployee(
+                f"employee-{index}",
+                age=employee.age,
+                department=employee.department,
+                salary=employee.salary,
+                years_worked=employee.years_worked,
+                previous_bonus_years=employee.previous_bonus_years,
+            )
+            for index, employee in enumerate(employees)
+        ],
+        population_size,
+    )
+    specification = raise_specification()
+
+    employee_seconds = timeit(
+        lambda: [specification.is_satisfied_by(employee) for employee in employees],
+        number=repeat,
+    )
+    compact_seconds = timeit(
+        lambda: [
+            specification.is_satisfied_by(employee) for employee in compact_employees
+        ],
+        number=repeat,
+    )
+
+    evaluations = population_size * repeat
+    return {
+        "employee_bytes": employee_bytes,
+        "compact_employee_bytes": compact_bytes,
+        "employee_ns_per_evaluation": employee_seconds / evaluations * 1e9,
+        "compact_employee_ns_per_evaluation": compact_seconds / evaluations * 1e9,
+    }
+
+
+class _Opaque(BaseSpecification):
+    def __init__(self, specification: BaseSpecification) -> None:
+        self.specification = specification
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return self.specification.is_satisfied_by(employee)
+
+
+def benchmark_sql_pushdown(
+    population_size: int = 1_000_000, repeat: int = 1
+) -> Dict[str, float]:
+    connection = sqlite3.connect(":memory:")
+    create_schema(connection)
+    insert_employees(connection, generate_employees(population_size))
+    specification = raise_specification()
+
+    # an opaque specification cannot be translated, so every row is pulled back
+    # into Python before it is filtered
+    pull_all_seconds = timeit(
+        lambda: find_employees(connection, _Opaque(specification)), number=repeat
+    )
+    pushdown_seconds = timeit(
+        lambda: find_employees(connection, specification), number=repeat
+    )
+    connection.close()
+
+    return {
+        "pull_all_seconds": pull_all_seconds / repeat,
+        "pushdown_seconds": pushdown_seconds / repeat,
+        "speedup": pull_all_seconds / pushdown_seconds,
+    }
+
+
+if __name__ == "__main__":
+    for benchmark in (
+        benchmark_compiled_specification,
+        benchmark_vectorised_specification,
+        benchmark_indexed_repository,
+        benchmark_adaptive_specification,
+        benchmark_parallel_evaluation,
+        benchmark_compact_employee,
+        benchmark_sql_pushdown,
+    ):
+        print(benchmark.__name__)
+        for name, value in benchmark().items():
+            print(f"  {name}: {value:.2f}")
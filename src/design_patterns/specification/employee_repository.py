@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    OrSpecification,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+
+
+class AccessPath(NamedTuple):
+    # `size` is known up front, so the planner can compare paths without
+    # materialising their positions. `residual` is whatever part of the
+    # specification the index could not answer exactly.
+    size: int
+    positions: Callable[[], Iterable[int]]
+    residual: Optional[BaseSpecification] = None
+
+
+class SortedIndex:
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        entries = sorted((key, position) for position, key in enumerate(keys))
+        self._keys: List[int] = [key for key, _ in entries]
+        self._positions: List[int] = [position for _, position in entries]
+
+    def add(self, key: int, position: int) -> None:
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._positions.insert(index, position)
+
+    def range(
+        self,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+        inclusive: bool = True,
+    ) -> AccessPath:
+        if low is None:
+            start = 0
+        elif inclusive:
+            start = bisect_left(self._keys, low)
+        else:
+            start = bisect_right(self._keys, low)
+
+        if high is None:
+            end = len(self._keys)
+        elif inclusive:
+            end = bisect_right(self._keys, high)
+        else:
+            end = bisect_left(self._keys, high)
+
+        end = max(start, end)
+        return AccessPath(end - start, lambda: self._positions[start:end])
+
+
+class EmployeeRepository:
+    def __init__(self, employees: Iterable[Employee] = ()) -> None:
+        self._employees: List[Employee] = list(employees)
+        self.reindex()
+
+    def __len__(self) -> int:
+        return len(self._employees)
+
+    def __iter__(self) -> Iterator[Employee]:
+        return iter(self._employees)
+
+    def add(self, employee: Employee) -> None:
+        position = len(self._employees)
+        self._employees.append(employee)
+        self._departments[employee.department].append(position)
+        self._ages.add(employee.age, position)
+        self._salaries.add(employee.salary, position)
+
+    def reindex(self) -> None:
+        # indexes are maintained on `add`, so employees edited in place need a rebuild
+        self._departments: Dict[Department, List[int]] = {
+            department: [] for department in Department
+        }
+        for position, employee in enumerate(self._employees):
+            self._departments[employee.department].append(position)
+
+        self._ages = SortedIndex(employee.age for employee in self._employees)
+        self._salaries = SortedIndex(employee.salary for employee in self._employees)
+
+    def candidates(self, specification: BaseSpecification) -> List[Employee]:
+        return self._candidates(self._plan(specification))
+
+    def find(self, specification: BaseSpecification) -> List[Employee]:
+        path = self._plan(specification)
+        candidates = self._candidates(path)
+        residual = specification if path is None else path.residual
+
+        if residual is None:
+            return candidates
+
+        is_satisfied_by = residual.compile()
+        return [employee for employee in candidates if is_satisfied_by(employee)]
+
+    def _candidates(self, path: Optional[AccessPath]) -> List[Employee]:
+        if path is None:
+            return list(self._employees)
+
+        return [self._employees[position] for position in sorted(path.positions())]
+
+    def _plan(self, specification: BaseSpecification) -> Optional[AccessPath]:
+        if isinstance(specification, AndSpecification):
+            first = self._plan(specification.first)
+            second = self._plan(specification.second)
+
+            # every operand must hold, so the most selective index is enough and
+            # the other operand is checked on the surviving candidates
+            if first is not None and (second is None or first.size <= second.size):
+                return first._replace(
+                    residual=_conjoin(first.residual, specification.second)
+                )
+
+            if second is not None:
+                return second._replace(
+                    residual=_conjoin(second.residual, specification.first)
+                )
+
+            return None
+
+        if isinstance(specification, OrSpecification):
+            first = self._plan(specification.first)
+            second = self._plan(specification.second)
+
+            if first is None or second is None:
+                return None
+
+            return AccessPath(
+                first.size + second.size,
+                _union(first.positions, second.positions),
+                None if first.residual is second.residual is None else specification,
+            )
+
+        planner = _INDEXED_LEAVES.get(type(specification))
+        if planner is None:
+            return None
+
+        path = planner(specification, self)
+        if type(specification) in _EXACT_LEAVES:
+            return path
+
+        return path._replace(residual=specification)
+
+    def _department(self, department: Department) -> AccessPath:
+        positions = self._departments[department]
+        return AccessPath(len(positions), lambda: positions)
+
+
+def _conjoin(
+    first: Optional[BaseSpecification], second: BaseSpecification
+) -> BaseSpecification:
+    return second if first is None else first & second
+
+
+def _union(
+    first: Callable[[], Iterable[int]], second: Callable[[], Iterable[int]]
+) -> Callable[[], Iterable[int]]:
+    return lambda: set(first()) | set(second())
+
+
+# indexes on these leaves hold exactly the matching employees, every other indexed
+# leaf only narrows down the candidates it still has to be checked against
+_EXACT_LEAVES = {BelongsToDepartment, IsValidWorkingAge, EarnsAtLeast, EarnsAtMost}
+
+
+_INDEXED_LEAVES: Dict[type, Callable[[Any, EmployeeRepository], AccessPath]] = {
+    BelongsToDepartment: lambda spec, repository: repository._department(
+        spec.department
+    ),
+    SalesRaiseEligibility: lambda spec, repository: repository._department(
+        Department.SALES
+    ),
+    FinanceRaiseEligibility: lambda spec, repository: repository._department(
+        Department.FINANCE
+    ),
+    DevelopmentRaiseEligibility: lambda spec, repository: repository._department(
+        Department.DEVELOPMENT
+    ),
+    HrRaiseEligibility: lambda spec, repository: repository._department(Department.HR),
+    IsValidWorkingAge: lambda spec, repository: repository._ages.range(
+        18, 99, inclusive=False
+    ),
+    MatchesHiringCriteria: lambda spec, repository: repository._ages.range(18, 99),
+    EarnsAtLeast: lambda spec, repository: repository._salaries.range(low=spec.amount),
+    EarnsAtMost: lambda spec, repository: repository._salaries.range(high=spec.amount),
+}
@@ -2,14 +2,30 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-
-from src.design_patterns.specification.supplement import Department, Employee
+from typing import TYPE_CHECKING, Callable, Iterable, List, Union
+
+from src.design_patterns.specification.supplement import (
+    Department,
+    Employee,
+    EmployeeLike,
+)
+
+if TYPE_CHECKING:
+    from src.design_patterns.specification.adaptive_specification import (
+        AdaptiveSpecification,
+    )
+    from src.design_patterns.specification.employee_table import EmployeeTable
+    from src.design_patterns.specification.evaluation_cache import EvaluationCache
+    from src.design_patterns.specification.live_view import LiveView
+    from src.design_patterns.specification.specification_profiler import (
+        ProfiledSpecification,
+    )
 
 
 # Generic specification framework
 class BaseSpecification(ABC):
     @abstractmethod
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         raise NotImplementedError()
 
     def __and__(self, other: BaseSpecification) -> AndSpecification:
@@ -21,13 +37,49 @@ class BaseSpecification(ABC):
     def __neg__(self) -> NotSpecification:
         return NotSpecification(self)
 
+    def compile(self) -> Callable[[EmployeeLike], bool]:
+        from src.design_patterns.specification.specification_compiler import (
+            compile_specification,
+        )
+
+        return compile_specification(self)
+
+    def adaptive(self, sample_size: int = 1_000) -> AdaptiveSpecification:
+        from src.design_patterns.specification.adaptive_specification import (
+            AdaptiveSpecification,
+        )
+
+        return AdaptiveSpecification(self, sample_size)
+
+    def cached(self, cache: EvaluationCache) -> BaseSpecification:
+        return cache.wrap(self)
+
+    def profiled(self) -> ProfiledSpecification:
+        from src.design_patterns.specification.specification_profiler import (
+            ProfiledSpecification,
+        )
+
+        return ProfiledSpecification(self)
+
+    def live(self, employees: Iterable[Employee] = ()) -> LiveView:
+        from src.design_patterns.specification.live_view import LiveView
+
+        return LiveView(self, employees)
+
+    def mask(self, table: EmployeeTable) -> bytes:
+        from src.design_patterns.specification.employee_table import (
+            mask_specification,
+        )
+
+        return mask_specification(self, table)
+
 
 @dataclass
 class AndSpecification(BaseSpecification):
     first: BaseSpecification
     second: BaseSpecification
 
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return self.first.is_satisfied_by(employee) and self.second.is_satisfied_by(
             employee
         )
@@ -38,7 +90,7 @@ class OrSpecification(BaseSpecification):
     first: BaseSpecification
     second: BaseSpecification
 
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return self.first.is_satisfied_by(employee) or self.second.is_satisfied_by(
             employee
         )
@@ -48,18 +100,35 @@ class OrSpecification(BaseSpecification):
 class NotSpecification(BaseSpecification):
     subject: BaseSpecification
 
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return not self.subject.is_satisfied_by(employee)
 
 
+def junction_operands(
+    specification: Union[AndSpecification, OrSpecification]
+) -> List[BaseSpecification]:
+    # the operands of a chain of the same junction, left to right, so that
+    # `a & (b & c)` gives `[a, b, c]`
+    kind = type(specification)
+    operands: List[BaseSpecification] = []
+    pending: List[BaseSpecification] = [specification]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, kind):
+            pending += (current.second, current.first)
+        else:
+            operands.append(current)
+    return operands
+
+
 # Application specifications
 class IsValidWorkingAge(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return 18 < employee.age < 99
 
 
 class HadValidName(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return employee.name != ""
 
 
@@ -67,12 +136,28 @@ class BelongsToDepartment(BaseSpecification):
     def __init__(self, department: Department) -> None:
         self.department = department
 
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         return employee.department == self.department
 
 
+class EarnsAtLeast(BaseSpecification):
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return employee.salary >= self.amount
+
+
+class EarnsAtMost(BaseSpecification):
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return employee.salary <= self.amount
+
+
 class MatchesHiringCriteria(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         if (
             employee.age < 18
             or employee.age > 99
@@ -85,7 +170,7 @@ class MatchesHiringCriteria(BaseSpecification):
 
 
 class SalesRaiseEligibility(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         if employee.department == Department.SALES:
             if employee.salary < 10_000:
                 return False
@@ -100,7 +185,7 @@ class SalesRaiseEligibility(BaseSpecification):
 
 
 class FinanceRaiseEligibility(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         if employee.department == Department.FINANCE:
             if employee.salary > 85_000:
                 return False
@@ -110,7 +195,7 @@ class FinanceRaiseEligibility(BaseSpecification):
 
 
 class DevelopmentRaiseEligibility(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         if employee.department == Department.DEVELOPMENT:
             return True
 
@@ -118,7 +203,7 @@ class DevelopmentRaiseEligibility(BaseSpecification):
 
 
 class HrRaiseEligibility(BaseSpecification):
-    def is_satisfied_by(self, employee: Employee) -> bool:
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
         if employee.department == Department.HR:
             for year in employee.previous_bonus_years:
                 if year == 2022:
@@ -0,0 +1,127 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Mapping, TextIO
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+
+FIELDNAMES = [
+    "name",
+    "age",
+    "department",
+    "salary",
+    "years_worked",
+    "previous_bonus_years",
+]
+
+# CSV has no list type, so bonus years are written as e.g. "2021;2022"
+_BONUS_YEAR_SEPARATOR = ";"
+
+
+def _optional_int(value: Any, default: int) -> int:
+    return default if value is None or value == "" else int(value)
+
+
+def employee_from_record(record: Mapping[str, Any]) -> Employee:
+    employee = Employee(
+        record["name"],
+        int(record["age"]),
+        Department(record["department"]),
+        salary=_optional_int(record.get("salary"), 30_000),
+        years_worked=_optional_int(record.get("years_worked"), 0),
+    )
+
+    bonus_years = record.get("previous_bonus_years") or []
+    if isinstance(bonus_years, str):
+        bonus_years = bonus_years.split(_BONUS_YEAR_SEPARATOR)
+    employee.previous_bonus_years.extend(int(year) for year in bonus_years)
+
+    return employee
+
+
+def employee_to_record(employee: Employee) -> Dict[str, Any]:
+    return {
+        "name": employee.name,
+        "age": employee.age,
+        "department": employee.department.value,
+        "salary": employee.salary,
+        "years_worked": employee.years_worked,
+        "previous_bonus_years": list(employee.previous_bonus_years),
+    }
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Employee]:
+    for record in csv.DictReader(lines):
+        yield employee_from_record(record)
+
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[Employee]:
+    for line in lines:
+        if line.strip():
+            yield employee_from_record(json.loads(line))
+
+
+def stream_matching(
+    specification: BaseSpecification, employees: Iterable[Employee]
+) -> Iterator[Employee]:
+    return filter(specification.compile(), employees)
+
+
+def write_csv(employees: Iterable[Employee], destination: TextIO) -> int:
+    writer = csv.DictWriter(destination, fieldnames=FIELDNAMES)
+    writer.writeheader()
+
+    written = 0
+    for employee in employees:
+        record = employee_to_record(employee)
+        record["previous_bonus_years"] = _BONUS_YEAR_SEPARATOR.join(
+            str(year) for year in employee.previous_bonus_years
+        )
+        writer.writerow(record)
+        written += 1
+
+    return written
+
+
+def write_jsonl(employees: Iterable[Employee], destination: TextIO) -> int:
+    written = 0
+    for employee in employees:
+        destination.write(json.dumps(employee_to_record(employee)) + "\n")
+        written += 1
+
+    return written
+
+
+# Pipeline stages: matching rows are copied through untouched, so columns that
+# `Employee` does not know about are kept
+def filter_csv(
+    specification: BaseSpecification, source: TextIO, destination: TextIO
+) -> int:
+    is_satisfied_by = specification.compile()
+    reader = csv.DictReader(source)
+    writer = csv.DictWriter(destination, fieldnames=reader.fieldnames or FIELDNAMES)
+    writer.writeheader()
+
+    written = 0
+    for record in reader:
+        if is_satisfied_by(employee_from_record(record)):
+            writer.writerow(record)
+            written += 1
+
+    return written
+
+
+def filter_jsonl(
+    specification: BaseSpecification, source: TextIO, destination: TextIO
+) -> int:
+    is_satisfied_by = specification.compile()
+
+    written = 0
+    for line in source:
+        if line.strip() and is_satisfied_by(employee_from_record(json.loads(line))):
+            destination.write(line if line.endswith("\n") else line + "\n")
+            written += 1
+
+    return written
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from itertools import compress, repeat
+from typing import Any, Callable, Dict, Iterable, List
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    NotSpecification,
+    OrSpecification,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+
+# A mask holds one byte per row, `1` where the row satisfies a specification and `0`
+# where it does not.
+Mask = bytes
+
+DEPARTMENTS = tuple(Department)
+DEPARTMENT_CODES = {department: code for code, department in enumerate(DEPARTMENTS)}
+
+_NOT_TABLE = bytes([1, 0]) + bytes(254)
+
+
+class EmployeeTable:
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.ages = array("q")
+        self.department_codes = array("B")
+        self.salaries = array("q")
+        self.years_worked = array("q")
+        # bonus years are ragged, row `i` owns `bonus_years[offsets[i]:offsets[i + 1]]`
+        self.bonus_years = array("q")
+        self.bonus_offsets = array("Q", [0])
+        self.bonus_rows = array("Q")
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[Employee]) -> EmployeeTable:
+        table = cls()
+        for employee in employees:
+            table.append(employee)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, employee: Employee) -> None:
+        self.names.append(employee.name)
+        self.ages.append(employee.age)
+        self.department_codes.append(DEPARTMENT_CODES[employee.department])
+        self.salaries.append(employee.salary)
+        self.years_worked.append(employee.years_worked)
+        self.bonus_years.extend(employee.previous_bonus_years)
+        self.bonus_offsets.append(len(self.bonus_years))
+        self.bonus_rows.extend(
+            repeat(len(self.names) - 1, len(employee.previous_bonus_years))
+        )
+
+    def row(self, index: int) -> Employee:
+        employee = Employee(
+            self.names[index],
+            self.ages[index],
+            DEPARTMENTS[self.department_codes[index]],
+            salary=self.salaries[index],
+            years_worked=self.years_worked[index],
+        )
+        start, end = self.bonus_offsets[index], self.bonus_offsets[index + 1]
+        employee.previous_bonus_years.extend(self.bonus_years[start:end])
+        return employee
+
+    def select(self, mask: Mask) -> List[Employee]:
+        return [self.row(index) for index in compress(range(len(self)), mask)]
+
+
+# Vectorised building blocks
+def _translate(column: array, predicate: Callable[[int], bool]) -> Mask:
+    # single byte columns are mapped through a 256 entry lookup table in one pass
+    return column.tobytes().translate(bytes(predicate(value) for value in range(256)))
+
+
+def _in_department(table: EmployeeTable, department: Department) -> Mask:
+    code = DEPARTMENT_CODES[department]
+    return _translate(table.department_codes, lambda value: value == code)
+
+
+def _age_mask(table: EmployeeTable, predicate: Callable[[int], bool]) -> Mask:
+    # ages can hold any value a spec should reject, so they take a wide column and
+    # bound method comparisons rather than a lookup table
+    return bytes(map(predicate, table.ages))
+
+
+def _salary_at_least(table: EmployeeTable, threshold: int) -> Mask:
+    return bytes(map(threshold.__le__, table.salaries))
+
+
+def _salary_at_most(table: EmployeeTable, threshold: int) -> Mask:
+    return bytes(map(threshold.__ge__, table.salaries))
+
+
+def _had_bonus_in(table: EmployeeTable, year: int) -> Mask:
+    mask = bytearray(len(table))
+    rows = compress(table.bonus_rows, map(year.__eq__, table.bonus_years))
+    # scatter the matching rows into the mask without a Python level loop
+    deque(map(mask.__setitem__, rows, repeat(1)), maxlen=0)
+    return bytes(mask)
+
+
+def mask_and(first: Mask, second: Mask) -> Mask:
+    combined = int.from_bytes(first, "little") & int.from_bytes(second, "little")
+    return combined.to_bytes(len(first), "little")
+
+
+def mask_or(first: Mask, second: Mask) -> Mask:
+    combined = int.from_bytes(first, "little") | int.from_bytes(second, "little")
+    return combined.to_bytes(len(first), "little")
+
+
+def mask_not(subject: Mask) -> Mask:
+    return subject.translate(_NOT_TABLE)
+
+
+_VECTORISED_LEAVES: Dict[type, Callable[[Any, EmployeeTable], Mask]] = {
+    IsValidWorkingAge: lambda spec, table: mask_and(
+        _age_mask(table, (18).__lt__), _age_mask(table, (99).__gt__)
+    ),
+    HadValidName: lambda spec, table: bytes(map(bool, table.names)),
+    BelongsToDepartment: lambda spec, table: _in_department(table, spec.department),
+    EarnsAtLeast: lambda spec, table: _salary_at_least(table, spec.amount),
+    EarnsAtMost: lambda spec, table: _salary_at_most(table, spec.amount),
+    MatchesHiringCriteria: lambda spec, table: mask_and(
+        mask_and(
+            mask_and(_age_mask(table, (18).__le__), _age_mask(table, (99).__ge__)),
+            mask_not(_in_department(table, Department.SALES)),
+        ),
+        bytes(map(bool, table.names)),
+    ),
+    SalesRaiseEligibility: lambda spec, table: mask_and(
+        mask_and(
+            _in_department(table, Department.SALES),
+            _salary_at_least(table, 10_000),
+        ),
+        _age_mask(table, (75).__gt__),
+    ),
+    FinanceRaiseEligibility: lambda spec, table: mask_and(
+        _in_department(table, Department.FINANCE),
+        _salary_at_most(table, 85_000),
+    ),
+    DevelopmentRaiseEligibility: lambda spec, table: _in_department(
+        table, Department.DEVELOPMENT
+    ),
+    HrRaiseEligibility: lambda spec, table: mask_and(
+        _in_department(table, Department.HR),
+        mask_not(_had_bonus_in(table, 2022)),
+    ),
+}
+
+
+def mask_specification(specification: BaseSpecification, table: EmployeeTable) -> Mask:
+    if isinstance(specification, AndSpecification):
+        return mask_and(
+            mask_specification(specification.first, table),
+            mask_specification(specification.second, table),
+        )
+
+    if isinstance(specification, OrSpecification):
+        return mask_or(
+            mask_specification(specification.first, table),
+            mask_specification(specification.second, table),
+        )
+
+    if isinstance(specification, NotSpecification):
+        return mask_not(mask_specification(specification.subject, table))
+
+    vectorised = _VECTORISED_LEAVES.get(type(specification))
+    if vectorised is None:
+        # unknown leaves fall back to evaluating one materialised row at a time
+        return bytes(
+            bool(specification.is_satisfied_by(table.row(index)))
+            for index in range(len(table))
+        )
+
+    return vectorised(specification, table)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from itertools import count
+from operator import attrgetter
+from typing import Any, Dict, Hashable, NamedTuple, Tuple
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    NotSpecification,
+    OrSpecification,
+)
+from src.design_patterns.specification.specification_compiler import (
+    specification_key,
+)
+from src.design_patterns.specification.supplement import EmployeeLike
+
+# past this many distinct trees, sub-specifications wrapped later stop sharing tokens
+# with those wrapped before
+_MAX_TOKENS = 10_000
+
+_SCALAR_FIELDS = attrgetter("name", "age", "department", "salary", "years_worked")
+
+
+def _snapshot(employee: EmployeeLike) -> Tuple[Any, ...]:
+    # every field a specification may read, with the bonus years copied so that
+    # in-place edits to them are noticed too
+    return (*_SCALAR_FIELDS(employee), tuple(employee.previous_bonus_years))
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry(NamedTuple):
+    # holding on to the employee stops its `id` from being reused by another one
+    employee: EmployeeLike
+    fields: Tuple[Any, ...]
+    result: bool
+
+
+class EvaluationCache:
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Tuple[int, int], _Entry] = OrderedDict()
+        self._tokens: Dict[Hashable, int] = {}
+        # tokens are never handed out twice, so forgetting `_tokens` cannot make a
+        # later specification collide with one that was wrapped before
+        self._next_token = count()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def wrap(self, specification: BaseSpecification) -> BaseSpecification:
+        if isinstance(specification, AndSpecification):
+            inner: BaseSpecification = AndSpecification(
+                self.wrap(specification.first), self.wrap(specification.second)
+            )
+        elif isinstance(specification, OrSpecification):
+            inner = OrSpecification(
+                self.wrap(specification.first), self.wrap(specification.second)
+            )
+        elif isinstance(specification, NotSpecification):
+            inner = NotSpecification(self.wrap(specification.subject))
+        else:
+            inner = specification
+
+        # equivalent sub-specifications share a token, and so share cached results
+        key = specification_key(specification)
+        token = self._tokens.get(key)
+        if token is None:
+            if len(self._tokens) >= _MAX_TOKENS:
+                self._tokens.clear()
+            token = self._tokens[key] = next(self._next_token)
+        return CachedSpecification(inner, token, self)
+
+    def evaluate(
+        self, token: int, specification: BaseSpecification, employee: EmployeeLike
+    ) -> bool:
+        key = (token, id(employee))
+        entry = self._entries.get(key)
+        fields = _snapshot(employee)
+
+        if entry is not None and entry.employee is employee and entry.fields == fields:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry.result
+
+        self._misses += 1
+        result = specification.is_satisfied_by(employee)
+        self._entries[key] = _Entry(employee, fields, result)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            self._hits, self._misses, self._evictions, len(self._entries)
+        )
+
+
+class CachedSpecification(BaseSpecification):
+    def __init__(
+        self, specification: BaseSpecification, token: int, cache: EvaluationCache
+    ) -> None:
+        self.specification = specification
+        self._token = token
+        self._cache = cache
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return self._cache.evaluate(self._token, self.specification, employee)
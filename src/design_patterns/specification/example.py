@@ -96,3 +96,19 @@ def is_employee_eligible_for_a_raise(employee: Employee) -> bool:
     ) & IsValidWorkingAge()
 
     return raise_specification.is_satisfied_by(employee)
+
+
+# best practice for hot paths: build and compile the specification once
+_compiled_raise_specification = (
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge()
+).compile()
+
+
+def is_employee_eligible_for_a_raise_compiled(employee: Employee) -> bool:
+    return _compiled_raise_specification(employee)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    NotSpecification,
+    OrSpecification,
+)
+from src.design_patterns.specification.supplement import Employee
+
+
+class MembershipChange(NamedTuple):
+    employee: Employee
+    joined: bool
+
+
+class _Recorder:
+    # Stands in for an employee while a leaf is evaluated, and notes down every
+    # attribute the leaf reads.
+    def __init__(self, employee: Employee, attributes: Set[str]) -> None:
+        object.__setattr__(self, "_employee", employee)
+        object.__setattr__(self, "_attributes", attributes)
+
+    def __getattr__(self, name: str) -> Any:
+        self._attributes.add(name)
+        return getattr(self._employee, name)
+
+
+class _LiveNode(ABC):
+    def __init__(self, children: List[_LiveNode]) -> None:
+        self.children = children
+        # one byte per position in the view, holding this node's last result
+        self.results = bytearray()
+
+    def depends_on(self, changed: Optional[AbstractSet[str]]) -> bool:
+        return any(child.depends_on(changed) for child in self.children)
+
+    def append(self, employee: Employee) -> None:
+        for child in self.children:
+            child.append(employee)
+        self.results.append(self._combine(len(self.results)))
+
+    def remove(self, position: int) -> None:
+        for child in self.children:
+            child.remove(position)
+        self.results[position] = self.results[-1]
+        del self.results[-1]
+
+    def refresh(
+        self, position: int, employee: Employee, changed: Optional[AbstractSet[str]]
+    ) -> None:
+        # only the sub-nodes that read a changed attribute are evaluated again,
+        # every other child keeps its stored result
+        for child in self.children:
+            if child.depends_on(changed):
+                child.refresh(position, employee, changed)
+        self.results[position] = self._combine(position)
+
+    @abstractmethod
+    def _combine(self, position: int) -> int:
+        raise NotImplementedError()
+
+
+class _LiveLeaf(_LiveNode):
+    def __init__(self, specification: BaseSpecification) -> None:
+        super().__init__([])
+        self.specification = specification
+        self.attributes: Set[str] = set()
+
+    def depends_on(self, changed: Optional[AbstractSet[str]]) -> bool:
+        # a leaf's result only depends on what it read, and it reads something new
+        # only after one of those attributes has changed and it is evaluated again
+        return changed is None or not self.attributes.isdisjoint(changed)
+
+    def append(self, employee: Employee) -> None:
+        self.results.append(self._evaluate(employee))
+
+    def refresh(
+        self, position: int, employee: Employee, changed: Optional[AbstractSet[str]]
+    ) -> None:
+        self.results[position] = self._evaluate(employee)
+
+    def _combine(self, position: int) -> int:
+        # a leaf has no children, so its own stored result stands
+        return self.results[position]
+
+    def _evaluate(self, employee: Employee) -> int:
+        recorder: Any = _Recorder(employee, self.attributes)
+        return bool(self.specification.is_satisfied_by(recorder))
+
+
+class _LiveJunction(_LiveNode):
+    def __init__(self, conjunctive: bool, children: List[_LiveNode]) -> None:
+        super().__init__(children)
+        self.conjunctive = conjunctive
+
+    def _combine(self, position: int) -> int:
+        if self.conjunctive:
+            return all(child.results[position] for child in self.children)
+        return any(child.results[position] for child in self.children)
+
+
+class _LiveNot(_LiveNode):
+    def _combine(self, position: int) -> int:
+        return not self.children[0].results[position]
+
+
+def _build(specification: BaseSpecification) -> _LiveNode:
+    if isinstance(specification, AndSpecification):
+        return _LiveJunction(
+            True, [_build(specification.first), _build(specification.second)]
+        )
+
+    if isinstance(specification, OrSpecification):
+        return _LiveJunction(
+            False, [_build(specification.first), _build(specification.second)]
+        )
+
+    if isinstance(specification, NotSpecification):
+        return _LiveNot([_build(specification.subject)])
+
+    return _LiveLeaf(specification)
+
+
+class LiveView:
+    def __init__(
+        self, specification: BaseSpecification, employees: Iterable[Employee] = ()
+    ) -> None:
+        self.specification = specification
+        self._root = _build(specification)
+        self._employees: List[Employee] = []
+        self._positions: Dict[int, int] = {}
+        self._members: Dict[int, Employee] = {}
+        self._listeners: List[Callable[[MembershipChange], None]] = []
+
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[Employee]:
+        return iter(self._members.values())
+
+    def __contains__(self, employee: object) -> bool:
+        return self._members.get(id(employee)) is employee
+
+    def subscribe(self, listener: Callable[[MembershipChange], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[MembershipChange], None]) -> None:
+        self._listeners.remove(listener)
+
+    def add(self, employee: Employee) -> None:
+        if id(employee) in self._positions:
+            return
+
+        self._positions[id(employee)] = len(self._employees)
+        self._employees.append(employee)
+        self._root.append(employee)
+
+        if self._root.results[-1]:
+            self._join(employee)
+
+    def remove(self, employee: Employee) -> None:
+        position = self._positions.pop(id(employee))
+        last = self._employees.pop()
+
+        # the last employee takes over the freed position, as it does in every node
+        if last is not employee:
+            self._employees[position] = last
+            self._positions[id(last)] = position
+        self._root.remove(position)
+
+        if self._members.pop(id(employee), None) is not None:
+            self._notify(MembershipChange(employee, joined=False))
+
+    def update(self, employee: Employee, *attributes: str) -> None:
+        # without any attributes every leaf is evaluated again, which is needed after
+        # in-place edits such as appending to `previous_bonus_years`
+        position = self._positions[id(employee)]
+        changed = frozenset(attributes) if attributes else None
+
+        if not self._root.depends_on(changed):
+            return
+
+        was_member = bool(self._root.results[position])
+        self._root.refresh(position, employee, changed)
+        is_member = bool(self._root.results[position])
+
+        if is_member and not was_member:
+            self._join(employee)
+        elif was_member and not is_member:
+            del self._members[id(employee)]
+            self._notify(MembershipChange(employee, joined=False))
+
+    def _join(self, employee: Employee) -> None:
+        self._members[id(employee)] = employee
+        self._notify(MembershipChange(employee, joined=True))
+
+    def _notify(self, change: MembershipChange) -> None:
+        for listener in self._listeners:
+            listener(change)
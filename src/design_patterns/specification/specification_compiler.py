@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    NotSpecification,
+    OrSpecification,
+    SalesRaiseEligibility,
+    junction_operands,
+)
+from src.design_patterns.specification.supplement import (
+    Department,
+    EmployeeLike,
+)
+
+CompiledSpecification = Callable[[EmployeeLike], bool]
+
+# Each built-in leaf is rewritten as an inline expression over ``{e}`` (the employee),
+# with ``{0}``, ``{1}``... standing in for the constants it compares against.
+InlineLeaf = Tuple[str, Tuple[Hashable, ...]]
+
+_INLINE_LEAVES: Dict[type, Callable[[Any], InlineLeaf]] = {
+    IsValidWorkingAge: lambda spec: ("(18 < {e}.age < 99)", ()),
+    HadValidName: lambda spec: ('({e}.name != "")', ()),
+    BelongsToDepartment: lambda spec: (
+        "({e}.department == {0})",
+        (spec.department,),
+    ),
+    EarnsAtLeast: lambda spec: ("({e}.salary >= {0})", (spec.amount,)),
+    EarnsAtMost: lambda spec: ("({e}.salary <= {0})", (spec.amount,)),
+    MatchesHiringCriteria: lambda spec: (
+        "(not ({e}.age < 18 or {e}.age > 99"
+        ' or {e}.department == {0} or {e}.name == ""))',
+        (Department.SALES,),
+    ),
+    SalesRaiseEligibility: lambda spec: (
+        "({e}.department == {0} and {e}.salary >= 10_000 and not {e}.age >= 75)",
+        (Department.SALES,),
+    ),
+    FinanceRaiseEligibility: lambda spec: (
+        "({e}.department == {0} and not {e}.salary > 85_000)",
+        (Department.FINANCE,),
+    ),
+    DevelopmentRaiseEligibility: lambda spec: (
+        "({e}.department == {0})",
+        (Department.DEVELOPMENT,),
+    ),
+    HrRaiseEligibility: lambda spec: (
+        "({e}.department == {0} and 2022 not in {e}.previous_bonus_years)",
+        (Department.HR,),
+    ),
+}
+
+
+# Normalised form of a specification tree
+@dataclass(frozen=True)
+class _Constant:
+    value: bool
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    key: Hashable
+    template: str = field(compare=False)
+    constants: Tuple[Hashable, ...] = field(compare=False)
+    specification: BaseSpecification = field(compare=False)
+
+
+@dataclass(frozen=True)
+class _Not:
+    operand: _Node
+
+
+@dataclass(frozen=True)
+class _Junction:
+    conjunctive: bool
+    operands: Tuple[_Node, ...]
+
+
+_Node = Union[_Constant, _Leaf, _Not, _Junction]
+
+
+def _lower(specification: BaseSpecification) -> _Node:
+    if isinstance(specification, AndSpecification):
+        return _junction(True, tuple(map(_lower, junction_operands(specification))))
+
+    if isinstance(specification, OrSpecification):
+        return _junction(False, tuple(map(_lower, junction_operands(specification))))
+
+    if isinstance(specification, NotSpecification):
+        return _negate(_lower(specification.subject))
+
+    kind = type(specification)
+    inline = _INLINE_LEAVES.get(kind)
+    if inline is None:
+        # unknown leaves are called as-is and are only ever equal to themselves
+        return _Leaf(id(specification), "", (), specification)
+
+    template, constants = inline(specification)
+    return _Leaf((kind, constants), template, constants, specification)
+
+
+def _negate(node: _Node) -> _Node:
+    if isinstance(node, _Constant):
+        return _Constant(not node.value)
+
+    if isinstance(node, _Not):
+        return node.operand
+
+    return _Not(node)
+
+
+def _junction(conjunctive: bool, operands: Tuple[_Node, ...]) -> _Node:
+    flattened: List[_Node] = []
+
+    for operand in operands:
+        if isinstance(operand, _Junction) and operand.conjunctive == conjunctive:
+            candidates = operand.operands
+        else:
+            candidates = (operand,)
+
+        for candidate in candidates:
+            if isinstance(candidate, _Constant):
+                if candidate.value != conjunctive:
+                    # `False` absorbs an AND, `True` absorbs an OR
+                    return candidate
+                continue
+
+            if candidate in flattened:
+                continue
+
+            if _negate(candidate) in flattened:
+                # `x & -x` is never satisfied, `x | -x` always is
+                return _Constant(not conjunctive)
+
+            flattened.append(candidate)
+
+    if not flattened:
+        return _Constant(conjunctive)
+
+    if len(flattened) == 1:
+        return flattened[0]
+
+    return _Junction(conjunctive, tuple(flattened))
+
+
+def _emit(node: _Node, constants: List[Hashable], leaves: List[Callable]) -> str:
+    if isinstance(node, _Constant):
+        return repr(node.value)
+
+    if isinstance(node, _Leaf):
+        if not node.template:
+            leaves.append(node.specification.is_satisfied_by)
+            return f"_l{len(leaves) - 1}(employee)"
+
+        names = []
+        for constant in node.constants:
+            constants.append(constant)
+            names.append(f"_c{len(constants) - 1}")
+        return node.template.format(*names, e="employee")
+
+    if isinstance(node, _Not):
+        return f"(not {_emit(node.operand, constants, leaves)})"
+
+    joiner = " and " if node.conjunctive else " or "
+    operands = [_emit(operand, constants, leaves) for operand in node.operands]
+    return f"({joiner.join(operands)})"
+
+
+# Factories are cached per tree shape, so equally shaped trees share compiled code and
+# only differ in the constants and leaves bound into them.
+_FACTORY_CACHE: Dict[str, Callable[..., CompiledSpecification]] = {}
+
+
+def _factory_for(
+    expression: str, constant_count: int, leaf_count: int
+) -> Callable[..., CompiledSpecification]:
+    factory = _FACTORY_CACHE.get(expression)
+
+    if factory is None:
+        parameters = [f"_c{index}" for index in range(constant_count)]
+        parameters += [f"_l{index}" for index in range(leaf_count)]
+        source = (
+            f"def _factory({', '.join(parameters)}):\n"
+            f"    def _compiled(employee):\n"
+            f"        return {expression}\n"
+            f"    return _compiled\n"
+        )
+        namespace: Dict[str, Any] = {}
+        # the source is only ever built from the fixed templates above
+        exec(source, namespace)  # nosec B102
+        factory = namespace["_factory"]
+        _FACTORY_CACHE[expression] = factory
+
+    return factory
+
+
+def specification_key(specification: BaseSpecification) -> Hashable:
+    # equivalent trees normalise to equal keys, so they can share cached results
+    return _lower(specification)
+
+
+def specification_source(specification: BaseSpecification) -> str:
+    return _emit(_lower(specification), [], [])
+
+
+def compile_specification(
+    specification: BaseSpecification,
+) -> CompiledSpecification:
+    constants: List[Hashable] = []
+    leaves: List[Callable] = []
+    expression = _emit(_lower(specification), constants, leaves)
+
+    factory = _factory_for(expression, len(constants), len(leaves))
+    return factory(*constants, *leaves)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+)
+from src.design_patterns.specification.supplement import (
+    Department,
+    Employee,
+    EmployeeLike,
+)
+
+EmployeeRow = Tuple[str, int, Department, int, int, Tuple[int, ...]]
+
+# Set in each worker by its initializer. Only workers ever set them, so concurrent
+# calls in the parent cannot see each other's specification.
+_shared_predicate: Optional[Callable[[EmployeeLike], bool]] = None
+_shared_employees: Sequence[Employee] = ()
+
+
+def _evaluate(
+    predicate: Callable[[EmployeeLike], bool], employees: Iterable[Employee]
+) -> bytes:
+    return bytes(map(bool, map(predicate, employees)))
+
+
+def _installed_predicate() -> Callable[[EmployeeLike], bool]:
+    if _shared_predicate is None:
+        raise RuntimeError("No specification has been installed in this worker.")
+    return _shared_predicate
+
+
+def _evaluate_shared(bounds: Tuple[int, int]) -> bytes:
+    start, end = bounds
+    return _evaluate(_installed_predicate(), _shared_employees[start:end])
+
+
+def _to_row(employee: Employee) -> EmployeeRow:
+    return (
+        employee.name,
+        employee.age,
+        employee.department,
+        employee.salary,
+        employee.years_worked,
+        tuple(employee.previous_bonus_years),
+    )
+
+
+def _from_row(row: EmployeeRow) -> Employee:
+    name, age, department, salary, years_worked, bonus_years = row
+    employee = Employee(name, age, department, salary, years_worked)
+    employee.previous_bonus_years.extend(bonus_years)
+    return employee
+
+
+def _install_shared(
+    predicate: Callable[[EmployeeLike], bool], employees: Sequence[Employee]
+) -> None:
+    global _shared_predicate, _shared_employees
+    _shared_predicate = predicate
+    _shared_employees = employees
+
+
+def _install_specification(specification: BaseSpecification) -> None:
+    global _shared_predicate
+    _shared_predicate = specification.compile()
+
+
+def _evaluate_rows(rows: List[EmployeeRow]) -> bytes:
+    return _evaluate(_installed_predicate(), map(_from_row, rows))
+
+
+class SpecificationEvaluator:
+    def __init__(
+        self, chunk_size: int = 50_000, start_method: Optional[str] = None
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.start_method = start_method
+
+    def evaluate_many(
+        self,
+        specification: BaseSpecification,
+        employees: Sequence[Employee],
+        workers: Optional[int] = None,
+    ) -> List[bool]:
+        workers = workers or os.cpu_count() or 1
+        bounds = [
+            (start, min(start + self.chunk_size, len(employees)))
+            for start in range(0, len(employees), self.chunk_size)
+        ]
+
+        if workers == 1 or len(bounds) <= 1:
+            return list(map(bool, _evaluate(specification.compile(), employees)))
+
+        start_method = self.start_method
+        if start_method is None:
+            start_method = "fork" if "fork" in get_all_start_methods() else "spawn"
+
+        if start_method == "fork":
+            chunks = self._evaluate_forked(specification, employees, bounds, workers)
+        else:
+            chunks = self._evaluate_pickled(
+                specification, employees, bounds, workers, start_method
+            )
+
+        return [bool(result) for chunk in chunks for result in chunk]
+
+    def _evaluate_forked(
+        self,
+        specification: BaseSpecification,
+        employees: Sequence[Employee],
+        bounds: List[Tuple[int, int]],
+        workers: int,
+    ) -> List[bytes]:
+        # forked workers inherit their initializer's arguments from the parent
+        # process, so neither the compiled predicate nor the population is pickled
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=get_context("fork"),
+            initializer=_install_shared,
+            initargs=(specification.compile(), employees),
+        ) as pool:
+            return list(pool.map(_evaluate_shared, bounds))
+
+    def _evaluate_pickled(
+        self,
+        specification: BaseSpecification,
+        employees: Sequence[Employee],
+        bounds: List[Tuple[int, int]],
+        workers: int,
+        start_method: str,
+    ) -> List[bytes]:
+        # the specification is sent once per worker, and employees travel as plain
+        # tuples, which pickle far more compactly than `Employee` instances
+        chunks = (
+            [_to_row(employee) for employee in employees[start:end]]
+            for start, end in bounds
+        )
+
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=get_context(start_method),
+            initializer=_install_specification,
+            initargs=(specification,),
+        ) as pool:
+            return list(pool.map(_evaluate_rows, chunks))
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from time import perf_counter
+from typing import Any, Dict, List
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    NotSpecification,
+    OrSpecification,
+    junction_operands,
+)
+from src.design_patterns.specification.supplement import EmployeeLike
+
+
+def _label(specification: BaseSpecification) -> str:
+    arguments = ", ".join(
+        f"{name}={value!r}" for name, value in vars(specification).items()
+    )
+    return f"{type(specification).__name__}({arguments})"
+
+
+class _ProfiledNode(BaseSpecification):
+    def __init__(
+        self,
+        label: str,
+        specification: BaseSpecification,
+        children: List[_ProfiledNode],
+    ) -> None:
+        self.label = label
+        self.specification = specification
+        self.children = children
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.passes = 0
+        self.skips = 0
+        self.seconds = 0.0
+        for child in self.children:
+            child.reset()
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        start = perf_counter()
+        result = self._evaluate(employee)
+        self.seconds += perf_counter() - start
+        self.calls += 1
+        self.passes += bool(result)
+        return result
+
+    def _evaluate(self, employee: EmployeeLike) -> bool:
+        return self.specification.is_satisfied_by(employee)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "node": self.label,
+            "calls": self.calls,
+            "passed": self.passes,
+            "failed": self.calls - self.passes,
+            "skipped": self.skips,
+            "seconds": self.seconds,
+            "children": [child.as_dict() for child in self.children],
+        }
+
+    def explain(self, depth: int = 0) -> List[str]:
+        line = (
+            f"{'  ' * depth}-> {self.label}  (calls={self.calls} "
+            f"passed={self.passes} failed={self.calls - self.passes} "
+            f"skipped={self.skips} time={self.seconds * 1e3:.3f} ms)"
+        )
+        return [line] + [
+            text for child in self.children for text in child.explain(depth + 1)
+        ]
+
+
+class _ProfiledJunction(_ProfiledNode):
+    def __init__(
+        self,
+        conjunctive: bool,
+        specification: BaseSpecification,
+        children: List[_ProfiledNode],
+    ) -> None:
+        super().__init__("And" if conjunctive else "Or", specification, children)
+        self.conjunctive = conjunctive
+
+    def _evaluate(self, employee: EmployeeLike) -> bool:
+        # the junction short-circuits on the first operand that decides it, every
+        # operand after that one is recorded as skipped
+        for index, child in enumerate(self.children):
+            if bool(child.is_satisfied_by(employee)) is not self.conjunctive:
+                for skipped in self.children[index + 1 :]:
+                    skipped.skips += 1
+                return not self.conjunctive
+        return self.conjunctive
+
+
+class _ProfiledNot(_ProfiledNode):
+    def _evaluate(self, employee: EmployeeLike) -> bool:
+        return not self.children[0].is_satisfied_by(employee)
+
+
+def _instrument(specification: BaseSpecification) -> _ProfiledNode:
+    if isinstance(specification, AndSpecification):
+        operands = junction_operands(specification)
+        return _ProfiledJunction(True, specification, list(map(_instrument, operands)))
+
+    if isinstance(specification, OrSpecification):
+        operands = junction_operands(specification)
+        return _ProfiledJunction(False, specification, list(map(_instrument, operands)))
+
+    if isinstance(specification, NotSpecification):
+        return _ProfiledNot("Not", specification, [_instrument(specification.subject)])
+
+    return _ProfiledNode(_label(specification), specification, [])
+
+
+class ProfiledSpecification(BaseSpecification):
+    # Instrumentation lives in a mirror of the specification tree, so the
+    # specification itself is left untouched and costs nothing extra when it is
+    # evaluated directly.
+    def __init__(self, specification: BaseSpecification) -> None:
+        self.specification = specification
+        self._root = _instrument(specification)
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return self._root.is_satisfied_by(employee)
+
+    def reset(self) -> None:
+        self._root.reset()
+
+    def statistics(self) -> Dict[str, Any]:
+        return self._root.as_dict()
+
+    def explain(self) -> str:
+        return "\n".join(self._root.explain())
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.statistics(), indent=indent)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from src.design_patterns.specification.employee_specification import (
+    AndSpecification,
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    NotSpecification,
+    OrSpecification,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    department TEXT NOT NULL,
+    salary INTEGER NOT NULL,
+    years_worked INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS employee_bonus_years (
+    employee_id INTEGER NOT NULL REFERENCES employees (id),
+    year INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS employee_bonus_years_by_employee
+    ON employee_bonus_years (employee_id, year);
+"""
+
+_SELECT = """
+SELECT
+    name,
+    age,
+    department,
+    salary,
+    years_worked,
+    (
+        SELECT group_concat(year, ';')
+        FROM employee_bonus_years
+        WHERE employee_id = employees.id
+    )
+FROM employees
+"""
+
+_BONUS_YEAR_SEPARATOR = ";"
+
+
+class SqlFilter(NamedTuple):
+    # Rows satisfy the specification exactly when they match `clause` and then
+    # `residual`. A `None` clause does not restrict the query at all, and a `None`
+    # residual means the database answered the specification on its own.
+    clause: Optional[str]
+    parameters: Tuple[Any, ...] = ()
+    residual: Optional[BaseSpecification] = None
+
+
+def _conjoin(
+    first: Optional[BaseSpecification], second: Optional[BaseSpecification]
+) -> Optional[BaseSpecification]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return first & second
+
+
+_HAD_BONUS_IN = (
+    "EXISTS (SELECT 1 FROM employee_bonus_years AS bonus "
+    "WHERE bonus.employee_id = employees.id AND bonus.year = ?)"
+)
+
+
+_TRANSLATED_LEAVES: Dict[type, Callable[[Any], Tuple[str, Tuple[Any, ...]]]] = {
+    IsValidWorkingAge: lambda spec: ("(age > ? AND age < ?)", (18, 99)),
+    HadValidName: lambda spec: ("name <> ''", ()),
+    BelongsToDepartment: lambda spec: ("department = ?", (spec.department.value,)),
+    EarnsAtLeast: lambda spec: ("salary >= ?", (spec.amount,)),
+    EarnsAtMost: lambda spec: ("salary <= ?", (spec.amount,)),
+    MatchesHiringCriteria: lambda spec: (
+        "(age >= ? AND age <= ? AND department <> ? AND name <> '')",
+        (18, 99, Department.SALES.value),
+    ),
+    SalesRaiseEligibility: lambda spec: (
+        "(department = ? AND salary >= ? AND age < ?)",
+        (Department.SALES.value, 10_000, 75),
+    ),
+    FinanceRaiseEligibility: lambda spec: (
+        "(department = ? AND salary <= ?)",
+        (Department.FINANCE.value, 85_000),
+    ),
+    DevelopmentRaiseEligibility: lambda spec: (
+        "department = ?",
+        (Department.DEVELOPMENT.value,),
+    ),
+    HrRaiseEligibility: lambda spec: (
+        f"(department = ? AND NOT {_HAD_BONUS_IN})",
+        (Department.HR.value, 2022),
+    ),
+}
+
+
+def specification_filter(specification: BaseSpecification) -> SqlFilter:
+    if isinstance(specification, AndSpecification):
+        first = specification_filter(specification.first)
+        second = specification_filter(specification.second)
+
+        # whatever either side could not translate is checked in Python on the
+        # rows that the translated side lets through
+        if first.clause is None or second.clause is None:
+            clause = first.clause or second.clause
+        else:
+            clause = f"({first.clause} AND {second.clause})"
+
+        return SqlFilter(
+            clause,
+            first.parameters + second.parameters,
+            _conjoin(first.residual, second.residual),
+        )
+
+    if isinstance(specification, OrSpecification):
+        first = specification_filter(specification.first)
+        second = specification_filter(specification.second)
+
+        if first.clause is None or second.clause is None:
+            return SqlFilter(None, residual=specification)
+
+        # either clause still narrows the rows down, but a residual on one side
+        # can no longer be separated from the other side
+        return SqlFilter(
+            f"({first.clause} OR {second.clause})",
+            first.parameters + second.parameters,
+            None if first.residual is second.residual is None else specification,
+        )
+
+    if isinstance(specification, NotSpecification):
+        subject = specification_filter(specification.subject)
+
+        if subject.clause is None or subject.residual is not None:
+            return SqlFilter(None, residual=specification)
+
+        return SqlFilter(f"NOT {subject.clause}", subject.parameters)
+
+    translate = _TRANSLATED_LEAVES.get(type(specification))
+    if translate is None:
+        return SqlFilter(None, residual=specification)
+
+    return SqlFilter(*translate(specification))
+
+
+def create_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(SCHEMA)
+
+
+def insert_employees(
+    connection: sqlite3.Connection, employees: Iterable[Employee]
+) -> int:
+    ((last_id,),) = connection.execute("SELECT coalesce(max(id), 0) FROM employees")
+    bonus_rows: List[Tuple[int, int]] = []
+
+    def rows() -> Iterator[Tuple[Any, ...]]:
+        # ids are assigned here, so both tables can be filled with `executemany`
+        for employee_id, employee in enumerate(employees, start=last_id + 1):
+            bonus_rows.extend(
+                (employee_id, year) for year in employee.previous_bonus_years
+            )
+            yield (
+                employee_id,
+                employee.name,
+                employee.age,
+                employee.department.value,
+                employee.salary,
+                employee.years_worked,
+            )
+
+    inserted = connection.executemany(
+        "INSERT INTO employees (id, name, age, department, salary, years_worked) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows(),
+    ).rowcount
+    connection.executemany(
+        "INSERT INTO employee_bonus_years (employee_id, year) VALUES (?, ?)",
+        bonus_rows,
+    )
+    connection.commit()
+    return inserted
+
+
+def _from_row(row: Tuple[Any, ...]) -> Employee:
+    name, age, department, salary, years_worked, bonus_years = row
+    employee = Employee(name, age, Department(department), salary, years_worked)
+    if bonus_years:
+        employee.previous_bonus_years.extend(
+            int(year) for year in bonus_years.split(_BONUS_YEAR_SEPARATOR)
+        )
+    return employee
+
+
+def find_employees(
+    connection: sqlite3.Connection, specification: BaseSpecification
+) -> List[Employee]:
+    clause, parameters, residual = specification_filter(specification)
+
+    # the clause is assembled from the fixed fragments above, every value is bound
+    query = _SELECT if clause is None else f"{_SELECT} WHERE {clause}"
+    rows = connection.execute(f"{query} ORDER BY id", parameters)  # nosec B608
+    employees = map(_from_row, rows)
+
+    if residual is None:
+        return list(employees)
+
+    return list(filter(residual.compile(), employees))
@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 from enum import Enum
-from typing import List
+from typing import Any, Iterable, List, Protocol, Sequence, Tuple
 
 
 class InvalidEmployeeError(ValueError):
@@ -30,5 +32,83 @@ class Employee:
         self.years_worked = years_worked
         self.previous_bonus_years: List[int] = []
 
-    def save(self) -> None:
-        pass
+
+class EmployeeLike(Protocol):
+    # what a specification may read from an employee, met by `Employee` and
+    # `CompactEmployee` alike
+    @property
+    def name(self) -> str:
+        ...
+
+    @property
+    def age(self) -> int:
+        ...
+
+    @property
+    def department(self) -> Department:
+        ...
+
+    @property
+    def salary(self) -> int:
+        ...
+
+    @property
+    def years_worked(self) -> int:
+        ...
+
+    @property
+    def previous_bonus_years(self) -> Sequence[int]:
+        ...
+
+
+class CompactEmployee:
+    # A memory-lean stand-in for `Employee`: slots instead of a per-instance
+    # `__dict__`, and an immutable tuple of bonus years instead of a list.
+    __slots__ = (
+        "name",
+        "age",
+        "department",
+        "salary",
+        "years_worked",
+        "previous_bonus_years",
+    )
+
+    name: str
+    age: int
+    department: Department
+    salary: int
+    years_worked: int
+    previous_bonus_years: Tuple[int, ...]
+
+    def __init__(
+        self,
+        name: str,
+        age: int,
+        department: Department,
+        salary: int = 30_000,
+        years_worked: int = 0,
+        previous_bonus_years: Iterable[int] = (),
+    ) -> None:
+        self.name = name
+        self.age = age
+        self.department = department
+        self.salary = salary
+        self.years_worked = years_worked
+        self.previous_bonus_years = tuple(previous_bonus_years)
+
+    @classmethod
+    def from_employee(cls, employee: Employee) -> CompactEmployee:
+        return cls(
+            employee.name,
+            employee.age,
+            employee.department,
+            employee.salary,
+            employee.years_worked,
+            employee.previous_bonus_years,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "previous_bonus_years":
+            value = tuple(value)
+
+        object.__setattr__(self, name, value)
@@ -0,0 +1,111 @@
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import (
+    Department,
+    EmployeeLike,
+)
+from src.design_patterns.specification.tests.fixtures import population
+
+
+class ExpensiveCheck(BaseSpecification):
+    def __init__(self, result: bool) -> None:
+        self.result = result
+        self.calls = 0
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        self.calls += 1
+        sum(range(2_000))
+        return self.result
+
+
+specifications = [
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    (
+        HrRaiseEligibility()
+        | SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+    -(EarnsAtMost(10_000) | -HadValidName()) & BelongsToDepartment(Department.HR),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_adaptive_specification_matches_original(
+    specification: BaseSpecification,
+) -> None:
+    # given
+    adaptive = specification.adaptive(sample_size=50)
+
+    # then
+    for employee in population + population:
+        assert adaptive.is_satisfied_by(employee) == specification.is_satisfied_by(
+            employee
+        )
+
+
+def test_cheap_decisive_checks_move_to_the_front_of_an_and() -> None:
+    # given
+    expensive = ExpensiveCheck(True)
+    adaptive = (expensive & BelongsToDepartment(Department.MARKETING)).adaptive(
+        sample_size=100
+    )
+    for employee in population[:100]:
+        adaptive.is_satisfied_by(employee)
+
+    # when
+    expensive.calls = 0
+    matches = [
+        employee for employee in population if adaptive.is_satisfied_by(employee)
+    ]
+
+    # then
+    assert expensive.calls == len(matches)
+
+
+def test_cheap_decisive_checks_move_to_the_front_of_an_or() -> None:
+    # given
+    expensive = ExpensiveCheck(False)
+    adaptive = (expensive | HadValidName()).adaptive(sample_size=100)
+    for employee in population[:100]:
+        adaptive.is_satisfied_by(employee)
+
+    # when
+    expensive.calls = 0
+    for employee in population:
+        adaptive.is_satisfied_by(employee)
+
+    # then
+    assert expensive.calls == sum(employee.name == "" for employee in population)
+
+
+def test_reprofiling_starts_a_new_sample() -> None:
+    # given
+    expensive = ExpensiveCheck(True)
+    adaptive = (expensive & HadValidName()).adaptive(sample_size=10)
+
+    # when
+    adaptive.reprofile()
+
+    # then
+    for employee in population[:10]:
+        assert adaptive.is_satisfied_by(employee) == (employee.name != "")
+
+
+@pytest.mark.parametrize("sample_size", [0, -1])
+def test_sample_sizes_below_one_are_rejected(sample_size: int) -> None:
+    # then
+    with pytest.raises(ValueError):
+        HadValidName().adaptive(sample_size=sample_size)
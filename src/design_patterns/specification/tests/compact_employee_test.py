@@ -0,0 +1,70 @@
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.evaluation_cache import EvaluationCache
+from src.design_patterns.specification.supplement import CompactEmployee, Department
+from src.design_patterns.specification.tests.fixtures import population
+
+specifications = [
+    IsValidWorkingAge(),
+    HadValidName(),
+    BelongsToDepartment(Department.FINANCE),
+    EarnsAtLeast(10_000),
+    EarnsAtMost(85_000),
+    MatchesHiringCriteria(),
+    SalesRaiseEligibility(),
+    FinanceRaiseEligibility(),
+    DevelopmentRaiseEligibility(),
+    HrRaiseEligibility(),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_compact_employees_are_a_drop_in_replacement(
+    specification: BaseSpecification,
+) -> None:
+    # given
+    compact_population = [
+        CompactEmployee.from_employee(employee) for employee in population
+    ]
+    compiled = specification.compile()
+
+    # then
+    for employee, compact in zip(population, compact_population):
+        expected = specification.is_satisfied_by(employee)
+        assert specification.is_satisfied_by(compact) == expected
+        assert compiled(compact) == expected
+
+
+def test_compact_employees_have_no_instance_dict() -> None:
+    # when
+    employee = CompactEmployee("Roy", 31, Department.DEVELOPMENT)
+
+    # then
+    assert not hasattr(employee, "__dict__")
+    assert isinstance(employee.previous_bonus_years, tuple)
+
+
+def test_assigning_bonus_years_invalidates_cached_results() -> None:
+    # given
+    cached = HrRaiseEligibility().cached(EvaluationCache())
+    employee = CompactEmployee("Jen", 28, Department.HR)
+    assert cached.is_satisfied_by(employee)
+
+    # when
+    employee.previous_bonus_years = (*employee.previous_bonus_years, 2022)
+
+    # then
+    assert not cached.is_satisfied_by(employee)
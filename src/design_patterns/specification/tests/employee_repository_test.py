@@ -0,0 +1,97 @@
+import pytest
+
+from src.design_patterns.specification.employee_repository import EmployeeRepository
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.tests.fixtures import population
+
+specifications = [
+    BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000),
+    EarnsAtLeast(10_000) & -BelongsToDepartment(Department.SALES),
+    MatchesHiringCriteria(),
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+    HadValidName() | BelongsToDepartment(Department.HR),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_find_matches_a_linear_scan(specification: BaseSpecification) -> None:
+    # given
+    repository = EmployeeRepository(population)
+
+    # when
+    found = repository.find(specification)
+
+    # then
+    assert found == [
+        employee for employee in population if specification.is_satisfied_by(employee)
+    ]
+
+
+def test_department_queries_only_scan_one_bucket() -> None:
+    # given
+    repository = EmployeeRepository(population)
+    specification = BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000)
+
+    # when
+    candidates = repository.candidates(specification)
+
+    # then
+    assert len(candidates) <= len(population) // len(Department)
+    assert all(employee.department == Department.FINANCE for employee in candidates)
+
+
+def test_most_selective_index_is_used() -> None:
+    # given
+    repository = EmployeeRepository(population)
+
+    # when
+    candidates = repository.candidates(
+        BelongsToDepartment(Department.HR) & EarnsAtMost(5_000)
+    )
+
+    # then
+    assert candidates == []
+
+
+def test_unindexed_specifications_fall_back_to_a_full_scan() -> None:
+    # given
+    repository = EmployeeRepository(population)
+
+    # then
+    assert len(repository.candidates(HadValidName())) == len(population)
+
+
+def test_added_and_reindexed_employees_are_found() -> None:
+    # given
+    repository = EmployeeRepository(population)
+    newcomer = Employee("Suki", 30, Department.MARKETING, salary=40_000)
+    repository.add(newcomer)
+
+    # when
+    newcomer.department = Department.FINANCE
+    repository.reindex()
+
+    # then
+    assert newcomer in repository.find(
+        BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000)
+    )
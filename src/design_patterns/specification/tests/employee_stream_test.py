@@ -0,0 +1,124 @@
+import io
+import json
+from itertools import count, islice
+from typing import Iterator
+
+from src.design_patterns.specification.employee_specification import (
+    BelongsToDepartment,
+    EarnsAtMost,
+    HrRaiseEligibility,
+)
+from src.design_patterns.specification.employee_stream import (
+    filter_csv,
+    filter_jsonl,
+    read_csv,
+    read_jsonl,
+    stream_matching,
+    write_csv,
+    write_jsonl,
+)
+from src.design_patterns.specification.supplement import Department
+from src.design_patterns.specification.tests.fixtures import population
+
+
+def _attributes(employee: object) -> tuple:
+    return tuple(
+        getattr(employee, field)
+        for field in (
+            "name",
+            "age",
+            "department",
+            "salary",
+            "years_worked",
+            "previous_bonus_years",
+        )
+    )
+
+
+def test_employees_round_trip_through_csv() -> None:
+    # given
+    buffer = io.StringIO()
+
+    # when
+    written = write_csv(population, buffer)
+    buffer.seek(0)
+
+    # then
+    assert written == len(population)
+    assert [_attributes(employee) for employee in read_csv(buffer)] == [
+        _attributes(employee) for employee in population
+    ]
+
+
+def test_employees_round_trip_through_jsonl() -> None:
+    # given
+    buffer = io.StringIO()
+
+    # when
+    write_jsonl(population, buffer)
+    buffer.seek(0)
+
+    # then
+    assert [_attributes(employee) for employee in read_jsonl(buffer)] == [
+        _attributes(employee) for employee in population
+    ]
+
+
+def test_stream_matching_is_lazy() -> None:
+    # given
+    def endless_export() -> Iterator[str]:
+        for index in count():
+            department = "hr" if index % 2 else "sales"
+            yield json.dumps({"name": "Toph", "age": 30, "department": department})
+
+    # when
+    matches = stream_matching(
+        BelongsToDepartment(Department.HR), read_jsonl(endless_export())
+    )
+
+    # then
+    assert all(employee.department == Department.HR for employee in islice(matches, 10))
+
+
+def test_filter_csv_copies_matching_rows_through() -> None:
+    # given
+    source = io.StringIO(
+        "name,age,department,salary,employee_id\n"
+        "Moss,30,finance,40000,1\n"
+        "Mai,25,finance,90000,2\n"
+        "Roy,31,development,40000,3\n"
+    )
+    destination = io.StringIO()
+
+    # when
+    written = filter_csv(
+        BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000),
+        source,
+        destination,
+    )
+
+    # then
+    assert written == 1
+    assert destination.getvalue().splitlines() == [
+        "name,age,department,salary,employee_id",
+        "Moss,30,finance,40000,1",
+    ]
+
+
+def test_filter_jsonl_copies_matching_rows_through() -> None:
+    # given
+    lines = [
+        '{"name": "Jen", "age": 28, "department": "hr", "badge": 7}\n',
+        '{"name": "Appa", "age": 25, "department": "hr",'
+        ' "previous_bonus_years": [2022]}\n',
+    ]
+    destination = io.StringIO()
+
+    # when
+    written = filter_jsonl(
+        HrRaiseEligibility(), io.StringIO("".join(lines)), destination
+    )
+
+    # then
+    assert written == 1
+    assert destination.getvalue() == lines[0]
@@ -0,0 +1,111 @@
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.employee_table import EmployeeTable
+from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.tests.fixtures import HasLongName, population
+
+specifications = [
+    IsValidWorkingAge(),
+    HadValidName(),
+    BelongsToDepartment(Department.MARKETING),
+    MatchesHiringCriteria(),
+    SalesRaiseEligibility(),
+    FinanceRaiseEligibility(),
+    DevelopmentRaiseEligibility(),
+    HrRaiseEligibility(),
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+    HasLongName() | -HrRaiseEligibility(),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_mask_matches_is_satisfied_by(specification: BaseSpecification) -> None:
+    # given
+    table = EmployeeTable.from_employees(population)
+
+    # when
+    mask = specification.mask(table)
+
+    # then
+    assert list(mask) == [
+        specification.is_satisfied_by(employee) for employee in population
+    ]
+
+
+def test_rows_round_trip_through_the_table() -> None:
+    # given
+    table = EmployeeTable.from_employees(population)
+
+    # then
+    assert len(table) == len(population)
+    for index, employee in enumerate(population):
+        row = table.row(index)
+        assert row.name == employee.name
+        assert row.age == employee.age
+        assert row.department == employee.department
+        assert row.salary == employee.salary
+        assert row.previous_bonus_years == employee.previous_bonus_years
+
+
+def test_can_select_rows_using_a_mask() -> None:
+    # given
+    table = EmployeeTable.from_employees(population)
+    specification = FinanceRaiseEligibility() & IsValidWorkingAge()
+
+    # when
+    selected = table.select(specification.mask(table))
+
+    # then
+    assert selected
+    assert all(specification.is_satisfied_by(employee) for employee in selected)
+
+
+def test_empty_table_produces_empty_mask() -> None:
+    # given
+    table = EmployeeTable()
+
+    # then
+    assert (IsValidWorkingAge() & -HrRaiseEligibility()).mask(table) == b""
+
+
+@pytest.mark.parametrize("age", [-1, 256, 70_000])
+def test_out_of_range_ages_are_rejected_rather_than_crashing(age: int) -> None:
+    # given
+    table = EmployeeTable.from_employees([Employee("Toph", age, Department.HR)])
+
+    # then
+    assert IsValidWorkingAge().mask(table) == b"\x00"
+    assert MatchesHiringCriteria().mask(table) == b"\x00"
+    assert table.row(0).age == age
+
+
+def test_years_outside_small_unsigned_ranges_round_trip() -> None:
+    # given
+    employee = Employee("Zuko", 40, Department.SALES, years_worked=-3)
+    employee.previous_bonus_years.extend([1999, 70_000, -5])
+
+    # when
+    table = EmployeeTable.from_employees([employee])
+
+    # then
+    assert table.row(0).years_worked == -3
+    assert table.row(0).previous_bonus_years == [1999, 70_000, -5]
+    assert HrRaiseEligibility().mask(table) == b"\x00"
@@ -0,0 +1,119 @@
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.evaluation_cache import EvaluationCache
+from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.tests.fixtures import population
+
+specifications = [
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_cached_specification_matches_original(
+    specification: BaseSpecification,
+) -> None:
+    # given
+    cached = specification.cached(EvaluationCache())
+
+    # then
+    for employee in population + population:
+        assert cached.is_satisfied_by(employee) == specification.is_satisfied_by(
+            employee
+        )
+
+
+def test_shared_sub_specifications_are_only_evaluated_once() -> None:
+    # given
+    cache = EvaluationCache()
+    hiring = (IsValidWorkingAge() & HadValidName()).cached(cache)
+    report = (IsValidWorkingAge() & -BelongsToDepartment(Department.SALES)).cached(
+        cache
+    )
+    employee = Employee("Roy", 31, Department.DEVELOPMENT)
+
+    # when
+    hiring.is_satisfied_by(employee)
+    report.is_satisfied_by(employee)
+
+    # then
+    assert cache.statistics().hits == 1
+
+
+def test_changing_a_field_invalidates_cached_results() -> None:
+    # given
+    cached = IsValidWorkingAge().cached(EvaluationCache())
+    employee = Employee("Roy", 31, Department.DEVELOPMENT)
+    assert cached.is_satisfied_by(employee)
+
+    # when
+    employee.age = 101
+
+    # then
+    assert not cached.is_satisfied_by(employee)
+
+
+def test_editing_bonus_years_in_place_invalidates_cached_results() -> None:
+    # given
+    cached = HrRaiseEligibility().cached(EvaluationCache())
+    employee = Employee("Jen", 28, Department.HR)
+    assert cached.is_satisfied_by(employee)
+
+    # when
+    employee.previous_bonus_years.append(2022)
+
+    # then
+    assert not cached.is_satisfied_by(employee)
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    # given
+    cache = EvaluationCache(maxsize=2)
+    cached = HadValidName().cached(cache)
+
+    # when
+    for employee in population[:3]:
+        cached.is_satisfied_by(employee)
+    cached.is_satisfied_by(population[0])
+
+    # then
+    statistics = cache.statistics()
+    assert statistics.size == 2
+    assert statistics.evictions == 2
+    assert statistics.hits == 0
+    assert statistics.misses == 4
+    assert statistics.hit_rate == 0.0
+
+
+def test_specifications_wrapped_after_clearing_do_not_reuse_results() -> None:
+    # given
+    cache = EvaluationCache()
+    employee = Employee("Toph", 12, Department.HR)
+    too_young = IsValidWorkingAge().cached(cache)
+    too_young.is_satisfied_by(employee)
+
+    # when
+    cache.clear()
+    in_hr = BelongsToDepartment(Department.HR).cached(cache)
+
+    # then
+    assert in_hr.is_satisfied_by(employee)
+    assert not too_young.is_satisfied_by(employee)
+    assert cache.statistics().hits == 0
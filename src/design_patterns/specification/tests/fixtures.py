@@ -1,4 +1,9 @@
-from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.employee_specification import BaseSpecification
+from src.design_patterns.specification.supplement import (
+    Department,
+    Employee,
+    EmployeeLike,
+)
 
 valid_new_employees = [
     ("Roy", 31, Department.DEVELOPMENT),
@@ -34,3 +39,27 @@ employees_not_getting_a_raise = [
     Employee("Mai", 25, Department.FINANCE, salary=90_000),
     hr_employee_with_previous_year_bonus,
 ]
+
+
+def _population() -> list:
+    employees = []
+
+    for age in (10, 18, 19, 50, 74, 75, 98, 99, 102):
+        for department in Department:
+            for salary in (8_000, 10_000, 85_000, 90_000):
+                for bonus_years in ([], [2021], [2021, 2022]):
+                    employee = Employee("Toph", age, department, salary=salary)
+                    employee.previous_bonus_years.extend(bonus_years)
+                    employees.append(employee)
+
+    employees.append(Employee("", 30, Department.HR))
+    return employees
+
+
+population = _population()
+
+
+class HasLongName(BaseSpecification):
+    # a leaf none of the built-in optimisations know about
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        return len(employee.name) > 3
@@ -0,0 +1,158 @@
+from typing import List
+
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.live_view import MembershipChange
+from src.design_patterns.specification.supplement import (
+    Department,
+    Employee,
+    EmployeeLike,
+)
+from src.design_patterns.specification.tests.fixtures import population
+
+raise_specification = (
+    SalesRaiseEligibility()
+    | FinanceRaiseEligibility()
+    | DevelopmentRaiseEligibility()
+    | HrRaiseEligibility()
+) & IsValidWorkingAge()
+
+
+class CountingSalaryCheck(BaseSpecification):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def is_satisfied_by(self, employee: EmployeeLike) -> bool:
+        self.calls += 1
+        return employee.salary >= 10_000
+
+
+def _copy(employees: List[Employee]) -> List[Employee]:
+    copies = []
+    for employee in employees:
+        copy = Employee(
+            employee.name,
+            employee.age,
+            employee.department,
+            employee.salary,
+            employee.years_worked,
+        )
+        copy.previous_bonus_years.extend(employee.previous_bonus_years)
+        copies.append(copy)
+    return copies
+
+
+@pytest.mark.parametrize(
+    "specification",
+    [
+        raise_specification,
+        MatchesHiringCriteria(),
+        -(EarnsAtMost(10_000) | -HadValidName()) & BelongsToDepartment(Department.HR),
+    ],
+)
+def test_live_view_tracks_field_changes(specification: BaseSpecification) -> None:
+    # given
+    employees = _copy(population)
+    view = specification.live(employees)
+
+    # when
+    for index, employee in enumerate(employees):
+        if index % 3 == 0:
+            employee.salary += 50_000
+            view.update(employee, "salary")
+        elif index % 3 == 1:
+            employee.department = Department.SALES
+            view.update(employee, "department")
+        else:
+            employee.previous_bonus_years.append(2022)
+            view.update(employee)
+
+    # then
+    assert set(view) == {
+        employee for employee in employees if specification.is_satisfied_by(employee)
+    }
+
+
+def test_update_emits_membership_changes() -> None:
+    # given
+    employee = Employee("Aang", 25, Department.FINANCE, salary=90_000)
+    view = raise_specification.live([employee])
+    changes: List[MembershipChange] = []
+    view.subscribe(changes.append)
+
+    # when
+    employee.salary = 80_000
+    view.update(employee, "salary")
+    employee.salary = 85_000
+    view.update(employee, "salary")
+    employee.age = 12
+    view.update(employee, "age")
+
+    # then
+    assert changes == [
+        MembershipChange(employee, joined=True),
+        MembershipChange(employee, joined=False),
+    ]
+    assert employee not in view
+
+
+def test_update_only_re_evaluates_leaves_that_read_a_changed_attribute() -> None:
+    # given
+    salary_check = CountingSalaryCheck()
+    employees = _copy(population)
+    view = (salary_check & IsValidWorkingAge()).live(employees)
+    calls = salary_check.calls
+
+    # when
+    for employee in employees:
+        employee.age += 1
+        view.update(employee, "age")
+
+    # then
+    assert salary_check.calls == calls
+    assert set(view) == {
+        employee
+        for employee in employees
+        if employee.salary >= 10_000 and 18 < employee.age < 99
+    }
+
+
+def test_add_and_remove_keep_membership_in_step() -> None:
+    # given
+    employees = _copy(population)
+    view = HadValidName().live(employees)
+    changes: List[MembershipChange] = []
+    view.subscribe(changes.append)
+    removed = employees[:10]
+
+    # when
+    for employee in removed:
+        view.remove(employee)
+    newcomer = Employee("Iroh", 60, Department.HR)
+    view.add(newcomer)
+    view.add(newcomer)
+
+    # then
+    assert len(view) == len(employees) - 1 - len(removed) + 1
+    assert newcomer in view
+    assert all(employee not in view for employee in removed)
+    assert changes == [
+        *(MembershipChange(employee, joined=False) for employee in removed),
+        MembershipChange(newcomer, joined=True),
+    ]
+    for employee in employees[10:]:
+        employee.name = ""
+        view.update(employee, "name")
+    assert list(view) == [newcomer]
@@ -0,0 +1,94 @@
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.example import (
+    is_employee_eligible_for_a_raise,
+    is_employee_eligible_for_a_raise_compiled,
+)
+from src.design_patterns.specification.specification_compiler import (
+    specification_source,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.tests.fixtures import HasLongName, population
+
+specifications = [
+    IsValidWorkingAge(),
+    MatchesHiringCriteria(),
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+    -(HasLongName() | -BelongsToDepartment(Department.MARKETING)),
+    -(-HrRaiseEligibility()) & HasLongName(),
+    IsValidWorkingAge() & -IsValidWorkingAge(),
+    HadValidName() | -HadValidName() | HasLongName(),
+    BelongsToDepartment(Department.HR) & BelongsToDepartment(Department.FINANCE),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_compiled_specification_matches_interpreter(
+    specification: BaseSpecification,
+) -> None:
+    # when
+    compiled = specification.compile()
+
+    # then
+    for employee in population:
+        assert compiled(employee) == specification.is_satisfied_by(employee)
+
+
+def test_contradictions_are_folded_to_constants() -> None:
+    # then
+    assert specification_source(IsValidWorkingAge() & -IsValidWorkingAge()) == "False"
+    assert specification_source(HadValidName() | -HadValidName()) == "True"
+
+
+def test_duplicate_sub_specifications_are_removed() -> None:
+    # given
+    specification = IsValidWorkingAge() & HadValidName() & IsValidWorkingAge()
+
+    # then
+    assert specification_source(specification) == specification_source(
+        IsValidWorkingAge() & HadValidName()
+    )
+
+
+def test_double_negation_is_removed() -> None:
+    # then
+    assert specification_source(-(-HadValidName())) == specification_source(
+        HadValidName()
+    )
+
+
+def test_trees_of_the_same_shape_share_compiled_code() -> None:
+    # when
+    finance = BelongsToDepartment(Department.FINANCE).compile()
+    hr = BelongsToDepartment(Department.HR).compile()
+
+    # then
+    assert finance.__code__ is hr.__code__
+    assert finance(Employee("Moss", 30, Department.FINANCE))
+    assert not hr(Employee("Moss", 30, Department.FINANCE))
+
+
+def test_compiled_raise_eligibility_matches_example() -> None:
+    # then
+    for employee in population:
+        assert is_employee_eligible_for_a_raise_compiled(
+            employee
+        ) == is_employee_eligible_for_a_raise(employee)
@@ -0,0 +1,74 @@
+from threading import Thread
+from typing import Dict, List
+
+import pytest
+
+from src.design_patterns.specification.benchmarks import raise_specification
+from src.design_patterns.specification.employee_specification import (
+    BelongsToDepartment,
+    HadValidName,
+    IsValidWorkingAge,
+)
+from src.design_patterns.specification.specification_evaluator import (
+    SpecificationEvaluator,
+)
+from src.design_patterns.specification.supplement import Department
+from src.design_patterns.specification.tests.fixtures import population
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_evaluate_many_preserves_order(start_method: str) -> None:
+    # given
+    evaluator = SpecificationEvaluator(chunk_size=50, start_method=start_method)
+    specification = raise_specification()
+
+    # when
+    results = evaluator.evaluate_many(specification, population, workers=2)
+
+    # then
+    assert results == [
+        specification.is_satisfied_by(employee) for employee in population
+    ]
+
+
+def test_small_populations_are_evaluated_in_process() -> None:
+    # given
+    evaluator = SpecificationEvaluator()
+    specification = (
+        IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES)
+    )
+
+    # when
+    results = evaluator.evaluate_many(specification, population, workers=4)
+
+    # then
+    assert results == [
+        specification.is_satisfied_by(employee) for employee in population
+    ]
+
+
+def test_concurrent_forked_evaluations_keep_their_own_specification() -> None:
+    # given
+    evaluator = SpecificationEvaluator(chunk_size=50, start_method="fork")
+    specifications = [
+        BelongsToDepartment(department) for department in list(Department)[:4]
+    ]
+    results: Dict[int, List[bool]] = {}
+
+    def evaluate(position: int) -> None:
+        results[position] = evaluator.evaluate_many(
+            specifications[position], population, workers=2
+        )
+
+    # when
+    threads = [Thread(target=evaluate, args=(position,)) for position in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert results == {
+        position: [specification.is_satisfied_by(employee) for employee in population]
+        for position, specification in enumerate(specifications)
+    }
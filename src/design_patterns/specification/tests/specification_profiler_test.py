@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.supplement import Department
+from src.design_patterns.specification.tests.fixtures import population
+
+raise_specification = (
+    SalesRaiseEligibility()
+    | FinanceRaiseEligibility()
+    | DevelopmentRaiseEligibility()
+    | HrRaiseEligibility()
+) & IsValidWorkingAge()
+
+specifications = [
+    raise_specification,
+    IsValidWorkingAge() & HadValidName() & -BelongsToDepartment(Department.SALES),
+    -(EarnsAtMost(10_000) | -HadValidName()) & BelongsToDepartment(Department.HR),
+]
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_profiled_specification_matches_original(
+    specification: BaseSpecification,
+) -> None:
+    # given
+    profiled = specification.profiled()
+
+    # then
+    for employee in population:
+        assert profiled.is_satisfied_by(employee) == specification.is_satisfied_by(
+            employee
+        )
+
+
+def test_statistics_count_calls_passes_and_short_circuit_skips() -> None:
+    # given
+    profiled = raise_specification.profiled()
+
+    # when
+    for employee in population:
+        profiled.is_satisfied_by(employee)
+    root = profiled.statistics()
+
+    # then
+    junction, working_age = root["children"]
+    sales, finance, development, hr = junction["children"]
+
+    assert root["node"] == "And"
+    assert root["calls"] == len(population)
+    assert root["passed"] == sum(map(raise_specification.is_satisfied_by, population))
+    assert junction["node"] == "Or"
+    assert working_age["calls"] == junction["passed"]
+    assert working_age["skipped"] == junction["failed"]
+    assert sales["calls"] == len(population)
+    assert finance["calls"] == sales["failed"]
+    assert finance["skipped"] == sales["passed"]
+    assert development["calls"] + development["skipped"] == len(population)
+    assert hr["calls"] + hr["skipped"] == len(population)
+
+
+def test_explain_prints_an_annotated_tree() -> None:
+    # given
+    profiled = (BelongsToDepartment(Department.HR) & -HadValidName()).profiled()
+
+    # when
+    for employee in population:
+        profiled.is_satisfied_by(employee)
+    lines = profiled.explain().splitlines()
+
+    # then
+    assert lines[0].startswith("-> And  (calls=")
+    assert lines[1].startswith("  -> BelongsToDepartment(department=")
+    assert lines[2].startswith("  -> Not  (calls=")
+    assert lines[3].startswith("    -> HadValidName()  (calls=")
+    assert all("time=" in line for line in lines)
+
+
+def test_to_json_exports_the_statistics_and_reset_clears_them() -> None:
+    # given
+    profiled = raise_specification.profiled()
+    for employee in population:
+        profiled.is_satisfied_by(employee)
+
+    # when
+    exported = json.loads(profiled.to_json())
+    profiled.reset()
+
+    # then
+    assert exported["calls"] == len(population)
+    assert [child["node"] for child in exported["children"]] == [
+        "Or",
+        "IsValidWorkingAge()",
+    ]
+    assert profiled.statistics()["calls"] == 0
+    assert profiled.statistics()["children"][0]["children"][0]["seconds"] == 0.0
@@ -0,0 +1,145 @@
+import sqlite3
+from typing import Iterator
+
+import pytest
+
+from src.design_patterns.specification.employee_specification import (
+    BaseSpecification,
+    BelongsToDepartment,
+    DevelopmentRaiseEligibility,
+    EarnsAtLeast,
+    EarnsAtMost,
+    FinanceRaiseEligibility,
+    HadValidName,
+    HrRaiseEligibility,
+    IsValidWorkingAge,
+    MatchesHiringCriteria,
+    SalesRaiseEligibility,
+)
+from src.design_patterns.specification.specification_sql import (
+    create_schema,
+    find_employees,
+    insert_employees,
+    specification_filter,
+)
+from src.design_patterns.specification.supplement import Department, Employee
+from src.design_patterns.specification.tests.fixtures import HasLongName, population
+
+specifications = [
+    IsValidWorkingAge(),
+    HadValidName(),
+    BelongsToDepartment(Department.FINANCE) & EarnsAtMost(85_000),
+    EarnsAtLeast(10_000) & -BelongsToDepartment(Department.SALES),
+    MatchesHiringCriteria(),
+    -HrRaiseEligibility(),
+    (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    )
+    & IsValidWorkingAge(),
+    HasLongName() & BelongsToDepartment(Department.HR),
+    HasLongName() | BelongsToDepartment(Department.HR),
+    -(HasLongName() & EarnsAtLeast(10_000)),
+    (HasLongName() & EarnsAtLeast(10_000)) | HrRaiseEligibility(),
+]
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:")
+    create_schema(connection)
+    insert_employees(connection, population)
+    yield connection
+    connection.close()
+
+
+def _attributes(employee: Employee) -> tuple:
+    return (
+        employee.name,
+        employee.age,
+        employee.department,
+        employee.salary,
+        employee.years_worked,
+        employee.previous_bonus_years,
+    )
+
+
+@pytest.mark.parametrize("specification", specifications)
+def test_find_employees_matches_in_python_evaluation(
+    connection: sqlite3.Connection, specification: BaseSpecification
+) -> None:
+    # when
+    found = find_employees(connection, specification)
+
+    # then
+    assert [_attributes(employee) for employee in found] == [
+        _attributes(employee)
+        for employee in population
+        if specification.is_satisfied_by(employee)
+    ]
+
+
+def test_built_in_leaves_are_translated_completely() -> None:
+    # given
+    specification = (
+        SalesRaiseEligibility()
+        | FinanceRaiseEligibility()
+        | DevelopmentRaiseEligibility()
+        | HrRaiseEligibility()
+    ) & IsValidWorkingAge()
+
+    # when
+    clause, parameters, residual = specification_filter(specification)
+
+    # then
+    assert residual is None
+    assert "EXISTS" in str(clause)
+    assert clause is not None and clause.count("?") == len(parameters)
+
+
+def test_untranslatable_leaves_are_left_as_a_residual() -> None:
+    # given
+    long_names = HasLongName()
+
+    # when
+    clause, parameters, residual = specification_filter(
+        long_names & BelongsToDepartment(Department.HR)
+    )
+
+    # then
+    assert clause == "department = ?"
+    assert parameters == (Department.HR.value,)
+    assert residual is long_names
+
+
+def test_untranslatable_disjunctions_are_not_pushed_down() -> None:
+    # given
+    specification = HasLongName() | BelongsToDepartment(Department.HR)
+
+    # when
+    clause, _, residual = specification_filter(specification)
+
+    # then
+    assert clause is None
+    assert residual is specification
+
+
+def test_insert_employees_appends_after_existing_rows(
+    connection: sqlite3.Connection,
+) -> None:
+    # given
+    employee = Employee("Iroh", 60, Department.HR)
+    employee.previous_bonus_years.append(2022)
+
+    # when
+    inserted = insert_employees(connection, [employee])
+
+    # then
+    assert inserted == 1
+    assert [
+        _attributes(found)
+        for found in find_employees(connection, -HrRaiseEligibility())
+        if found.name == "Iroh"
+    ] == [_attributes(employee)]
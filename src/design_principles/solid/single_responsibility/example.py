@@ -1,7 +1,8 @@
-from typing import Optional, Protocol
+from typing import Iterator, Optional, Protocol
 from uuid import UUID
 
 from src.design_principles.solid.single_responsibility.supplement import (
+    DEFAULT_CHUNK_SIZE,
     MP3File,
     SoundData,
 )
@@ -63,6 +64,13 @@ class PlayableSoundFormat(Protocol):
         ...
 
 
+class StreamableSoundFormat(Protocol):
+    def stream_sound_data(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[SoundData]:
+        ...
+
+
 class BestSoundSpeaker:
     speaker_id: UUID
     volume: int
@@ -85,3 +93,15 @@ class BestSoundSpeaker:
             return sound.get_sound_data()
         else:
             return None
+
+    def stream_sound(
+        self, sound: StreamableSoundFormat, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[SoundData]:
+        # chunks are pulled one at a time, so the speaker sets the pace and stops
+        # pulling as soon as it is powered off
+        chunks = sound.stream_sound_data(chunk_size)
+        while self.powered_on:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
@@ -1,9 +1,23 @@
 from dataclasses import dataclass
+from typing import Iterator, Union
+
+DEFAULT_CHUNK_SIZE = 4096
 
 
 @dataclass
 class SoundData:
-    sound_data: bytes
+    sound_data: Union[bytes, memoryview]
+
+
+def _stream_chunks(data: bytes, chunk_size: int) -> Iterator[SoundData]:
+    # each chunk is a view over the original bytes rather than a copy, and the next
+    # chunk is only made once the consumer asks for it
+    if chunk_size < 1:
+        raise ValueError("Chunks must hold at least 1 byte.")
+
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield SoundData(view[start : start + chunk_size])
 
 
 class MP3File:
@@ -15,6 +29,11 @@ class MP3File:
     def stream_mp3_data(self) -> SoundData:
         return SoundData(self.mp3_data)
 
+    def stream_sound_data(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[SoundData]:
+        return _stream_chunks(self.mp3_data, chunk_size)
+
 
 class WAVFile:
     wav_data: bytes
@@ -25,6 +44,11 @@ class WAVFile:
     def stream_wav_data(self) -> SoundData:
         return SoundData(self.wav_data)
 
+    def stream_sound_data(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[SoundData]:
+        return _stream_chunks(self.wav_data, chunk_size)
+
 
 class FLACFile:
     flac_data: bytes
@@ -34,3 +58,8 @@ class FLACFile:
 
     def get_sound_data(self) -> SoundData:
         return SoundData(self.flac_data)
+
+    def stream_sound_data(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[SoundData]:
+        return _stream_chunks(self.flac_data, chunk_size)
@@ -146,3 +146,65 @@ def test_can_play_flac_music_from_best_speaker() -> None:
 
     # then
     assert speaker_output == SoundData(music_data)
+
+
+@pytest.mark.parametrize("music_file_type", [MP3File, WAVFile, FLACFile])
+def test_can_stream_music_in_chunks_without_copying(music_file_type: type) -> None:
+    # given
+    music_data = b"great music, played loudly"
+    music_file = music_file_type(data=music_data)
+
+    # when
+    chunks = list(music_file.stream_sound_data(chunk_size=8))
+
+    # then
+    assert [chunk.sound_data for chunk in chunks] == [
+        b"great mu",
+        b"sic, pla",
+        b"yed loud",
+        b"ly",
+    ]
+    assert all(chunk.sound_data.obj is music_data for chunk in chunks)
+
+
+def test_chunks_must_hold_some_sound() -> None:
+    # given
+    music_file = WAVFile(data=b"great music")
+
+    # then
+    with pytest.raises(ValueError):
+        next(music_file.stream_sound_data(chunk_size=0))
+
+
+def test_can_stream_music_from_best_speaker() -> None:
+    # given
+    music_data = b"great music"
+    music_file = FLACFile(data=music_data)
+
+    speaker = BestSoundSpeaker()
+    speaker.power_on()
+
+    # when
+    speaker_output = b"".join(
+        chunk.sound_data for chunk in speaker.stream_sound(music_file, chunk_size=4)
+    )
+
+    # then
+    assert speaker_output == music_data
+
+
+def test_best_speaker_stops_streaming_when_powered_off() -> None:
+    # given
+    music_file = MP3File(data=b"great music")
+
+    speaker = BestSoundSpeaker()
+    speaker.power_on()
+    stream = speaker.stream_sound(music_file, chunk_size=4)
+
+    # when
+    first_chunk = next(stream)
+    speaker.power_off()
+
+    # then
+    assert first_chunk == SoundData(b"grea")
+    assert list(stream) == []